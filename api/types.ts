@@ -93,6 +93,7 @@ export interface RiskSummary {
   active_documents: number;
   risk_factors: number;
   action_results: number;
+  pending_risk_factors_estimate: number;
 }
 
 export interface RiskTableRow {
@@ -185,6 +186,7 @@ export interface TbmSummary {
   written_tbm_docs: number;
   total_tbm_attendees: number;
   participation_rate: number;
+  pending_attendees_estimate: number;
 }
 
 export interface TbmTableRow {
@@ -0,0 +1,87 @@
+"""
+ETL run API routes
+"""
+
+from typing import List, Optional
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+
+from backend.api.schemas.etl import EtlRunRequest, EtlRunStatus, PendingFilesResponse, UploadResponse
+from backend.services.etl_service import (
+    EtlBusyError,
+    get_etl_run,
+    get_pending_files,
+    ingest_uploads,
+    start_etl_run
+)
+
+router = APIRouter()
+
+
+# Plain (non-async) handlers: FastAPI runs them in its threadpool, so
+# spawning the ETL process never stalls the event loop
+
+
+@router.post("/runs", response_model=EtlRunStatus, status_code=202)
+def create_etl_run(request: EtlRunRequest = EtlRunRequest()):
+    """
+    Start an ETL run in the background.
+
+    - incremental: load new and modified files
+    - full: rebuild into a shadow database and swap it in (like --reset)
+    - tiered (incremental only): load risk/TBM files from their file name
+      metadata first so dashboard counts update at once, then deep-parse
+      them at lower priority (progress as "risk:deep"/"tbm:deep")
+    - hot_days: files dated within the last N days are loaded for all file
+      types before older ones (newest first throughout)
+
+    Returns 409 if a run or an upload is already in progress.
+    """
+    try:
+        return start_etl_run(request.mode, request.workers, request.tiered, request.hot_days)
+    except EtlBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.get("/runs/{run_id}", response_model=EtlRunStatus)
+def etl_run_status(run_id: str):
+    """
+    Get the status and live progress of an ETL run.
+
+    Returns files done per type, rows inserted, errors and throughput.
+    """
+    status = get_etl_run(run_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="ETL run not found")
+    return status
+
+
+@router.get("/pending", response_model=PendingFilesResponse)
+def pending_files(
+    file_type: Optional[str] = Query(None, description="attendance, risk or tbm"),
+    limit: int = Query(100, ge=1, le=1000, description="Max files listed")
+):
+    """
+    List documents loaded metadata-first that are still pending deep parsing.
+
+    Their rows count on the dashboards, but risk items/confirmations and TBM
+    content/participants are filled in once deep parsing completes.
+    """
+    return get_pending_files(file_type, limit)
+
+
+@router.post("/uploads", response_model=UploadResponse)
+def upload_files(files: List[UploadFile] = File(..., description="xlsx workbooks (attendance/TBM also as csv/tsv)")):
+    """
+    Upload workbooks and load them into the database.
+
+    The type of each file comes from its name prefix (출퇴근무사고_,
+    위험성평가_, tbm_). Files are stored in the data repository, parsed in
+    a worker pool and loaded incrementally; the response has one result per
+    file (loaded, updated, unchanged, error or rejected).
+
+    Returns 409 while an ETL run is in progress.
+    """
+    try:
+        return ingest_uploads([(upload.filename, upload.file.read()) for upload in files])
+    except EtlBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
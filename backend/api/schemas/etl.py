@@ -0,0 +1,77 @@
+"""
+ETL run Pydantic schemas
+"""
+
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional
+
+from backend.etl.parallel import MAX_WORKERS
+
+
+class EtlRunRequest(BaseModel):
+    """Parameters of a background ETL run."""
+    mode: Literal["incremental", "full"] = "incremental"  # full = --reset rebuild
+    workers: int = Field(1, ge=1, le=MAX_WORKERS)  # Parser processes (at most one per CPU)
+    tiered: bool = False  # Incremental only: risk/TBM metadata first, deep parsing after
+    hot_days: Optional[int] = None  # Hot window loaded before older files (default: ETL_HOT_WINDOW_DAYS)
+
+
+class EtlTypeProgress(BaseModel):
+    """Progress of one file type."""
+    files_total: int = 0  # Files to load (new or modified)
+    files_done: int = 0
+    rows: int = 0  # Parsed records loaded (risk: items + confirmations)
+    rows_merged: int = 0  # Rows the merge inserted (duplicates merged into existing rows not counted)
+    errors: int = 0
+    skipped: int = 0  # Unchanged files
+    updated: int = 0  # Modified files re-loaded
+
+
+class EtlRunStatus(BaseModel):
+    """State and live progress of an ETL run."""
+    id: str
+    mode: str
+    workers: int
+    tiered: bool = False
+    status: str  # running, completed, failed
+    started_at: str
+    finished_at: Optional[str] = None
+    elapsed_seconds: float = 0.0
+    types: Dict[str, EtlTypeProgress] = {}  # deep-parsing stage as "risk:deep"/"tbm:deep"
+    files_done: int = 0
+    rows_inserted: int = 0  # Sum of rows_merged
+    errors: int = 0
+    files_per_sec: float = 0.0
+    rows_per_sec: float = 0.0
+    error: Optional[str] = None
+
+
+class PendingFile(BaseModel):
+    """A file loaded metadata-first whose deep parsing is pending."""
+    filename: str
+    file_type: str
+    row_count: Optional[int] = None  # Estimated records (rows holding values, see run_metadata)
+    processed_at: Optional[str] = None
+
+
+class PendingFilesResponse(BaseModel):
+    """Files still pending deep parsing."""
+    files: List[PendingFile]
+    total: int = 0
+
+
+class UploadFileResult(BaseModel):
+    """Outcome of one uploaded file."""
+    filename: str
+    file_type: Optional[str] = None  # attendance, risk, tbm (None if not recognized)
+    status: str  # loaded, updated, unchanged, error, rejected
+    rows: int = 0
+    error: Optional[str] = None
+
+
+class UploadResponse(BaseModel):
+    """Result of an upload request."""
+    files: List[UploadFileResult]
+    loaded: int = 0  # Files loaded or updated
+    errors: int = 0  # Files rejected or failed to load
+    elapsed_seconds: float = 0.0
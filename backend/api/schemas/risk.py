@@ -12,6 +12,7 @@ class RiskSummary(BaseModel):
     active_documents: int = 0
     risk_factors: int = 0
     action_results: int = 0
+    pending_risk_factors_estimate: int = 0  # 항목 미파싱 문서의 추정 행 수 (metadata-tier files)
 
 
 class RiskTableRow(BaseModel):
@@ -101,6 +102,7 @@ class RiskDocument(BaseModel):
     end_date: str
     filename: Optional[str] = None
     item_count: int = 0
+    parse_pending: bool = False  # Loaded metadata-first; items not parsed yet
 
 
 class RiskItem(BaseModel):
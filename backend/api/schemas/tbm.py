@@ -12,6 +12,7 @@ class TbmSummary(BaseModel):
     written_tbm_docs: int = 0
     total_tbm_attendees: int = 0
     participation_rate: float = 0.0
+    pending_attendees_estimate: int = 0  # 참석자 미파싱 문서의 추정 인원 (metadata-tier files)
 
 
 class TbmTableRow(BaseModel):
@@ -39,6 +40,7 @@ class TbmLog(BaseModel):
     partner_name: str
     content: Optional[str] = None
     participant_count: int = 0
+    parse_pending: bool = False  # Loaded metadata-first; participants not parsed yet
 
 
 class TbmParticipant(BaseModel):
@@ -8,12 +8,25 @@ PROJECT_ROOT = BASE_DIR.parent
 # Database
 DATABASE_PATH = BASE_DIR / "database" / "safety.db"
 
+# ETL parse-result cache (keyed by content hash and parser version)
+PARSE_CACHE_DIR = BASE_DIR / "database" / "parse_cache"
+# Size limit of the parse cache; least recently used entries are evicted past it
+PARSE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Known workbook layout templates of DATABASE_PATH (see etl/templates.py);
+# other databases keep a file of this name in their own directory
+LAYOUT_TEMPLATES_PATH = DATABASE_PATH.parent / "layout_templates.json"
+
 # Data repository
 DATA_REPOSITORY = PROJECT_ROOT / "data_repository"
 ATTENDANCE_DIR = DATA_REPOSITORY / "01_attendance"
 RISK_ASSESSMENT_DIR = DATA_REPOSITORY / "02_risk_assessment"
 TBM_DIR = DATA_REPOSITORY / "03_tbm"
 
+# ETL scheduling: files dated within the last N days are loaded before older
+# backfill (run_etl --hot-days)
+ETL_HOT_WINDOW_DAYS = 7
+
 # API settings
 API_PREFIX = "/api"
 API_PORT = 3002
@@ -5,7 +5,7 @@ Database schema for HyunJangTong 2.0 Safety Management System
 import sqlite3
 from pathlib import Path
 
-SCHEMA_SQL = """
+TABLES_SQL = """
 -- Master tables
 CREATE TABLE IF NOT EXISTS sites (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -31,6 +31,7 @@ CREATE TABLE IF NOT EXISTS attendance_logs (
     check_in_time TIME,
     check_out_time TIME,
     has_accident BOOLEAN DEFAULT 0,
+    source_file TEXT,  -- 원본 파일명 (변경 파일 재처리 시 교체용)
     FOREIGN KEY(site_id) REFERENCES sites(id),
     FOREIGN KEY(partner_id) REFERENCES partners(id)
 );
@@ -73,6 +74,7 @@ CREATE TABLE IF NOT EXISTS tbm_logs (
     site_id INTEGER NOT NULL,
     partner_id INTEGER NOT NULL,
     content TEXT,
+    source_file TEXT,  -- 원본 파일명 (변경 파일 재처리 시 교체용)
     FOREIGN KEY(site_id) REFERENCES sites(id),
     FOREIGN KEY(partner_id) REFERENCES partners(id)
 );
@@ -89,43 +91,132 @@ CREATE TABLE IF NOT EXISTS processed_files (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     filename TEXT UNIQUE NOT NULL,
     file_type TEXT NOT NULL,  -- 'attendance', 'risk', 'tbm'
+    file_size INTEGER,  -- 처리 시점 파일 크기 (bytes)
+    mtime_ns INTEGER,  -- 처리 시점 수정 시각 (ns)
+    content_hash TEXT,  -- 처리 시점 내용 해시
+    parse_stage TEXT NOT NULL DEFAULT 'full',  -- 'metadata' (상세 파싱 대기) or 'full'
+    row_count INTEGER,  -- 적재 행 수 (metadata 단계: 시트 크기 기준 추정치)
     processed_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 5. Discovery manifest (날짜별 하위 폴더로 옮긴 원본 파일 위치)
+CREATE TABLE IF NOT EXISTS source_manifest (
+    filename TEXT PRIMARY KEY,  -- processed_files.filename
+    file_type TEXT NOT NULL,
+    location TEXT NOT NULL  -- 유형 디렉터리 기준 하위 폴더 (YYYY/MM)
+);
+"""
+
+# Indexes the ETL merge itself needs (natural-key and child lookups of
+# MERGE_SQL); a bulk rebuild creates them with the tables
+MERGE_INDEXES_SQL = """
+-- Natural keys (ETL merge of staged rows)
+CREATE INDEX IF NOT EXISTS idx_attendance_natural ON attendance_logs(work_date, site_id, partner_id, worker_name, check_in_time);
+CREATE INDEX IF NOT EXISTS idx_risk_docs_natural ON risk_docs(site_id, partner_id, start_date, end_date, doc_index);
+CREATE INDEX IF NOT EXISTS idx_tbm_natural ON tbm_logs(work_date, site_id, partner_id);
+
+-- Children of merged documents/logs
+CREATE INDEX IF NOT EXISTS idx_risk_items_doc ON risk_items(doc_id);
+CREATE INDEX IF NOT EXISTS idx_risk_confirmations_doc ON risk_confirmations(doc_id);
+CREATE INDEX IF NOT EXISTS idx_tbm_participants ON tbm_participants(tbm_id);
+"""
+
+# Query indexes; a bulk rebuild creates them once the data is loaded
+DEFERRED_INDEXES_SQL = """
 -- Performance indexes
 CREATE INDEX IF NOT EXISTS idx_attendance_date_site ON attendance_logs(work_date, site_id);
 CREATE INDEX IF NOT EXISTS idx_attendance_partner ON attendance_logs(partner_id);
 CREATE INDEX IF NOT EXISTS idx_risk_docs_dates ON risk_docs(start_date, end_date);
 CREATE INDEX IF NOT EXISTS idx_risk_docs_site ON risk_docs(site_id);
-CREATE INDEX IF NOT EXISTS idx_risk_items_doc ON risk_items(doc_id);
 CREATE INDEX IF NOT EXISTS idx_tbm_date_site ON tbm_logs(work_date, site_id);
-CREATE INDEX IF NOT EXISTS idx_tbm_participants ON tbm_participants(tbm_id);
 CREATE INDEX IF NOT EXISTS idx_processed_files_name ON processed_files(filename);
+CREATE INDEX IF NOT EXISTS idx_processed_files_pending ON processed_files(file_type) WHERE parse_stage = 'metadata';
+
+-- Source file lookups (replace rows of modified files)
+CREATE INDEX IF NOT EXISTS idx_attendance_source ON attendance_logs(source_file);
+CREATE INDEX IF NOT EXISTS idx_risk_docs_filename ON risk_docs(filename);
+CREATE INDEX IF NOT EXISTS idx_tbm_source ON tbm_logs(source_file);
 """
 
+INDEXES_SQL = MERGE_INDEXES_SQL + DEFERRED_INDEXES_SQL
+
+# Connection settings of a bulk rebuild. Only for a throwaway file (the
+# shadow database): the rollback journal is kept in memory (per-file
+# savepoints still roll back) and nothing is synced, so a crash mid-write
+# can leave the file corrupt.
+BULK_LOAD_PRAGMAS = [
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA cache_size = -262144",  # 256 MiB
+    "PRAGMA temp_store = MEMORY",
+]
+
+SCHEMA_SQL = TABLES_SQL + INDEXES_SQL
+
+# Columns added after the initial schema: (table, column, declaration)
+MIGRATION_COLUMNS = [
+    ("attendance_logs", "source_file", "TEXT"),
+    ("tbm_logs", "source_file", "TEXT"),
+    ("processed_files", "file_size", "INTEGER"),
+    ("processed_files", "mtime_ns", "INTEGER"),
+    ("processed_files", "content_hash", "TEXT"),
+    ("processed_files", "parse_stage", "TEXT NOT NULL DEFAULT 'full'"),
+    ("processed_files", "row_count", "INTEGER"),
+]
+
+
+def migrate_schema(conn: sqlite3.Connection) -> None:
+    """Add columns missing from databases created with an older schema."""
+    cursor = conn.cursor()
+    for table, column, declaration in MIGRATION_COLUMNS:
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
 
-def init_db(db_path: Path) -> None:
-    """Initialize database with schema."""
+def init_db(db_path: Path, bulk: bool = False) -> None:
+    """
+    Initialize database with schema.
+
+    With bulk=True only the indexes the ETL merge needs are created; the
+    others are built by finish_bulk_load() after the data is loaded.
+    """
     # Ensure directory exists
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(str(db_path))
     cursor = conn.cursor()
 
-    # Execute schema
-    cursor.executescript(SCHEMA_SQL)
+    # Execute schema (tables, then migrations, then indexes on migrated columns)
+    cursor.executescript(TABLES_SQL)
+    migrate_schema(conn)
+    cursor.executescript(MERGE_INDEXES_SQL if bulk else INDEXES_SQL)
 
     conn.commit()
     conn.close()
     print(f"Database initialized: {db_path}")
 
 
+def apply_bulk_pragmas(conn: sqlite3.Connection) -> None:
+    """Switch a connection to bulk-load settings (see BULK_LOAD_PRAGMAS)."""
+    for pragma in BULK_LOAD_PRAGMAS:
+        conn.execute(pragma)
+
+
+def finish_bulk_load(conn: sqlite3.Connection) -> None:
+    """Create the deferred indexes over the loaded data and refresh planner statistics."""
+    conn.executescript(DEFERRED_INDEXES_SQL)
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
 def drop_all_tables(db_path: Path) -> None:
     """Drop all tables (for re-initialization)."""
     conn = sqlite3.connect(str(db_path))
     cursor = conn.cursor()
 
     tables = [
+        "source_manifest",
         "processed_files",
         "tbm_participants",
         "tbm_logs",
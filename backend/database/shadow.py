@@ -0,0 +1,143 @@
+"""
+Shadow database rebuilds.
+
+A full reset is loaded into a separate file next to the live database
+(safety.db.shadow), verified, and then renamed over the live file. The
+rename is atomic, so API requests keep reading the previous snapshot for
+the whole rebuild; the API services open a new connection per request and
+pick up the new file without a restart. Writers of the live database hold
+its writer lock (see writer_lock) and open their connections inside it, so
+none of them is left committing into the replaced file.
+
+A small state file (safety.db.shadow.json) records that a rebuild is in
+progress. Files are committed to the shadow in batches together with their
+processed_files marks, so an interrupted rebuild is resumed by loading only
+the files it has not committed yet.
+
+A bulk rebuild (run_etl --reset --bulk: journal in memory, no syncs) is
+recorded as 'bulk-loading' while it writes; only a cleanly interrupted one
+is marked 'building' again and resumed, after a crash the shadow may be
+corrupt and is rebuilt. Rebuilds are journaled unless --bulk is given.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .writer_lock import writer_lock
+
+SHADOW_SUFFIX = ".shadow"
+
+# Rebuild states (see write_rebuild_state)
+REBUILD_BUILDING = "building"  # resumable
+REBUILD_BULK_LOADING = "bulk-loading"  # bulk writes in progress; not resumable
+REBUILD_FAILED = "failed"
+
+# Sidecar files SQLite keeps next to a database while writing to it
+SIDECAR_SUFFIXES = ("-journal", "-wal", "-shm")
+
+
+def shadow_path(db_path: Path) -> Path:
+    """Path of the rebuild file for db_path (same directory, so rename is atomic)."""
+    return db_path.with_name(db_path.name + SHADOW_SUFFIX)
+
+
+def state_path(shadow: Path) -> Path:
+    """Path of the rebuild state file of a shadow database."""
+    return shadow.with_name(shadow.name + ".json")
+
+
+def read_rebuild_state(shadow: Path) -> Optional[Dict[str, Any]]:
+    """State of the rebuild in shadow, or None if there is none (or it is unreadable)."""
+    try:
+        return json.loads(state_path(shadow).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_rebuild_state(shadow: Path, status: str, started_at: Optional[str] = None) -> None:
+    """Record the rebuild status (REBUILD_BUILDING, REBUILD_BULK_LOADING or REBUILD_FAILED)."""
+    state = {"status": status, "started_at": started_at or datetime.now().isoformat(timespec="seconds")}
+    tmp = state_path(shadow).with_suffix(".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp, state_path(shadow))
+
+
+def discard_rebuild(shadow: Path) -> None:
+    """Delete a shadow database and its state file."""
+    remove_database(shadow)
+    state_path(shadow).unlink(missing_ok=True)
+
+
+def remove_database(db_path: Path) -> None:
+    """Delete a database file together with its sidecar files."""
+    for path in [db_path] + [db_path.with_name(db_path.name + s) for s in SIDECAR_SUFFIXES]:
+        path.unlink(missing_ok=True)
+
+
+def table_counts(db_path: Path, tables: List[str]) -> Dict[str, int]:
+    """Row counts of the given tables (missing tables count as 0)."""
+    if not db_path.exists():
+        return {table: 0 for table in tables}
+    conn = sqlite3.connect(str(db_path))
+    try:
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] if table in existing else 0
+            for table in tables
+        }
+    finally:
+        conn.close()
+
+
+def verify_database(db_path: Path, expected_counts: Dict[str, int]) -> List[str]:
+    """
+    Check a rebuilt database before it is swapped in.
+
+    Runs PRAGMA integrity_check and compares table row counts with the
+    counts the load reported. Returns a list of problems (empty if OK).
+    """
+    problems = []
+    conn = sqlite3.connect(str(db_path))
+    try:
+        result = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+        if result != ["ok"]:
+            problems.append("integrity_check: " + "; ".join(result[:5]))
+    finally:
+        conn.close()
+
+    actual = table_counts(db_path, list(expected_counts))
+    for table, expected in expected_counts.items():
+        if actual[table] != expected:
+            problems.append(f"{table}: expected {expected} rows, found {actual[table]}")
+    return problems
+
+
+def swap_database(shadow: Path, db_path: Path) -> None:
+    """
+    Atomically replace db_path with the rebuilt shadow file.
+
+    Waits for the writer lock, so no writer is between batches on the old
+    file. Refuses to swap while the live database has a rollback journal or
+    WAL file, since SQLite would apply it to the new file on the next open.
+    Open read connections keep reading the old file until they are closed.
+    """
+    with writer_lock(db_path, wait_message=f"Waiting for the writer of {db_path.name} to finish..."):
+        for suffix in SIDECAR_SUFFIXES:
+            sidecar = db_path.with_name(db_path.name + suffix)
+            if sidecar.exists():
+                raise RuntimeError(f"Live database is being written ({sidecar.name} exists); not swapping")
+
+        os.replace(shadow, db_path)
+    state_path(shadow).unlink(missing_ok=True)
+
+    # Persist the rename itself (directory entry) where the platform allows it
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(str(db_path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -0,0 +1,126 @@
+"""
+Cross-process writer lock of a database.
+
+SQLite serializes single transactions, but the ETL writes in batches and a
+full rebuild replaces the database file: a writer that keeps a connection
+across a swap commits into the replaced file. So every process that writes
+the live database (CLI runs, the watcher, API runs and uploads) holds an
+exclusive lock on a file next to it (safety.db.lock) while it writes, and
+swap_database takes it before renaming. The lock is released by the OS when
+its holder exits, so a killed writer never leaves it stale.
+
+The lock is re-entrant within a thread (a run that swaps in its rebuild
+already holds it); other threads of the same process wait like other
+processes do.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_SUFFIX = ".lock"
+
+# Seconds between attempts while waiting for the lock
+LOCK_POLL_SECONDS = 0.2
+
+_held = threading.local()
+
+
+class WriterLockTimeout(RuntimeError):
+    """Raised when the writer lock stays held by another writer past the timeout."""
+
+
+def lock_path(db_path: Path) -> Path:
+    """Path of the writer lock file of db_path."""
+    return db_path.with_name(db_path.name + LOCK_SUFFIX)
+
+
+def _held_counts() -> Dict[str, int]:
+    if not hasattr(_held, "counts"):
+        _held.counts = {}
+    return _held.counts
+
+
+def _try_lock(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def writer_lock(db_path: Path, timeout: Optional[float] = None,
+                wait_message: Optional[str] = None) -> Iterator[None]:
+    """
+    Hold the writer lock of db_path for the duration of the block.
+
+    Args:
+        db_path: Database the caller writes
+        timeout: Seconds to wait for another writer (None: as long as it takes)
+        wait_message: Printed once if the lock is busy and the caller has to wait
+
+    Raises:
+        WriterLockTimeout: the lock was not free within timeout
+    """
+    key = str(Path(db_path).resolve())
+    counts = _held_counts()
+    if counts.get(key):
+        counts[key] += 1
+        try:
+            yield
+        finally:
+            counts[key] -= 1
+        return
+
+    path = lock_path(db_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waiting = False
+        while not _try_lock(fd):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise WriterLockTimeout(f"{db_path.name} is being written by another ETL process")
+            if wait_message and not waiting:
+                print(wait_message, flush=True)
+            waiting = True
+            time.sleep(LOCK_POLL_SECONDS)
+
+        counts[key] = 1
+        try:
+            yield
+        finally:
+            del counts[key]
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+def writer_lock_busy(db_path: Path) -> bool:
+    """Whether another process (or thread) currently holds the writer lock of db_path."""
+    try:
+        with writer_lock(db_path, timeout=0):
+            return False
+    except WriterLockTimeout:
+        return True
@@ -0,0 +1,182 @@
+"""
+Zip archives of source files.
+
+Field offices send daily batches as zip archives of workbooks. An archive
+placed in a data directory is read in place: every member with a suffix
+the directory's parser reads is a source file of its own, addressed as
+
+    <archive path>::<member name>
+
+and tracked in processed_files (and as the source file of its rows) as
+"<archive name>::<member name>". Members are read into memory when they are
+hashed or parsed; nothing is extracted to disk. The string form is what
+crosses process boundaries, so parser workers open the member themselves.
+
+Member names are used as written: zipfile decodes names stored without the
+UTF-8 flag as cp437, but the zip CLI and Windows Explorer (Korean Windows)
+write UTF-8 or CP949 bytes there, so those names are re-decoded (see
+member_name) before they become tracking names or file name metadata.
+
+For change detection a member's FileState is its uncompressed size, the
+archive's mtime and a hash of the member content (see tracking): rewriting
+an archive re-hashes its members, but only changed members are re-parsed.
+"""
+
+import io
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+ARCHIVE_SUFFIXES = (".zip",)
+MEMBER_SEPARATOR = "::"
+
+# Member paths of archive tooling, not source files
+IGNORED_MEMBER_DIRS = ("__MACOSX",)
+
+# General purpose flag bit: member name is UTF-8 (else cp437 per the zip spec)
+UTF8_NAME_FLAG = 0x800
+
+# Tried in order on names stored without the UTF-8 flag
+LEGACY_NAME_ENCODINGS = ("utf-8", "cp949")
+
+
+def member_name(info: zipfile.ZipInfo) -> str:
+    """Name of an archive member as written (legacy names re-decoded, see LEGACY_NAME_ENCODINGS)."""
+    if info.flag_bits & UTF8_NAME_FLAG:
+        return info.filename
+    try:
+        raw = info.filename.encode("cp437")
+    except UnicodeEncodeError:
+        return info.filename
+    for encoding in LEGACY_NAME_ENCODINGS:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return info.filename
+
+
+class ArchiveMember:
+    """A source file inside a zip archive; Path-like where the ETL needs it."""
+
+    __slots__ = ("archive", "member", "size", "raw_name")
+
+    def __init__(self, archive: Path, member: str, size: Optional[int] = None,
+                 raw_name: Optional[str] = None):
+        self.archive = Path(archive)
+        self.member = member  # decoded name (see member_name)
+        self.size = size  # uncompressed size, from the archive listing
+        self.raw_name = raw_name  # ZipInfo.filename, looked up if not known
+
+    @property
+    def name(self) -> str:
+        """Tracking name: '<archive name>::<member name>'."""
+        return f"{self.archive.name}{MEMBER_SEPARATOR}{self.member}"
+
+    @property
+    def stem(self) -> str:
+        return PurePosixPath(self.member).stem
+
+    @property
+    def suffix(self) -> str:
+        return PurePosixPath(self.member).suffix
+
+    @property
+    def parent(self) -> Path:
+        return self.archive.parent
+
+    def _info(self, archive: zipfile.ZipFile) -> zipfile.ZipInfo:
+        if self.raw_name is not None:
+            return archive.getinfo(self.raw_name)
+        try:
+            info = archive.getinfo(self.member)
+            if member_name(info) == self.member:
+                return info
+        except KeyError:
+            pass
+        # A legacy-encoded name (e.g. a member opened in a parser worker from its string form)
+        for info in archive.infolist():
+            if member_name(info) == self.member:
+                self.raw_name = info.filename
+                return info
+        raise KeyError(f"There is no item named {self.member!r} in the archive")
+
+    def exists(self) -> bool:
+        try:
+            with zipfile.ZipFile(self.archive) as archive:
+                self._info(archive)
+            return True
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return False
+
+    def file_size(self) -> int:
+        if self.size is None:
+            with zipfile.ZipFile(self.archive) as archive:
+                self.size = self._info(archive).file_size
+        return self.size
+
+    def read_bytes(self) -> bytes:
+        with zipfile.ZipFile(self.archive) as archive:
+            return archive.read(self._info(archive))
+
+    def open(self) -> BinaryIO:
+        """The member content as an in-memory binary file."""
+        return io.BytesIO(self.read_bytes())
+
+    def __str__(self) -> str:
+        return f"{self.archive}{MEMBER_SEPARATOR}{self.member}"
+
+    def __repr__(self) -> str:
+        return f"ArchiveMember({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ArchiveMember) and str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+SourcePath = Union[Path, ArchiveMember]
+
+
+def is_archive(path: Path) -> bool:
+    """Whether a path is a zip archive of source files (by suffix)."""
+    return path.suffix.lower() in ARCHIVE_SUFFIXES
+
+
+def source_path(value: Union[str, Path, ArchiveMember]) -> SourcePath:
+    """Source file from its string form (archive members: '<archive>::<member>')."""
+    if isinstance(value, ArchiveMember):
+        return value
+    text = str(value)
+    if MEMBER_SEPARATOR in text:
+        archive, member = text.split(MEMBER_SEPARATOR, 1)
+        return ArchiveMember(Path(archive), member)
+    return Path(text)
+
+
+def tracked_source(directory: Path, filename: str) -> SourcePath:
+    """Source file in a data directory for a processed_files name."""
+    if MEMBER_SEPARATOR in filename:
+        archive, member = filename.split(MEMBER_SEPARATOR, 1)
+        return ArchiveMember(directory / archive, member)
+    return directory / filename
+
+
+def list_members(archive: Path, suffixes: Tuple[str, ...]) -> List[ArchiveMember]:
+    """
+    Source files in an archive: members with one of the suffixes (Excel
+    lock files, hidden files and __MACOSX entries skipped).
+
+    Raises zipfile.BadZipFile / OSError if the archive cannot be read.
+    """
+    members = []
+    with zipfile.ZipFile(archive) as zf:
+        for info in zf.infolist():
+            name = member_name(info)
+            path = PurePosixPath(name)
+            if info.is_dir() or path.name.startswith(("~$", ".")) or path.parts[0] in IGNORED_MEMBER_DIRS:
+                continue
+            if path.suffix.lower() in suffixes:
+                members.append(ArchiveMember(archive, name, info.file_size, info.filename))
+    return members
@@ -16,6 +16,9 @@ New Excel Structure (as of 2025-12):
   - Col 17: 출근 시간 (HH:MM:SS)
   - Col 20: 퇴근 시간 (HH:MM:SS or '-')
   - Col 23: 상태 (무사고/사고)
+
+These are the defaults; the header row and columns are located by their
+labels (see discover_layout) and cached per layout template.
 """
 
 import re
@@ -24,6 +27,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .base_parser import BaseExcelParser
+from .csv_reader import CSV_DELIMITERS
+from .profiling import profiled
+from .records import AttendanceRecord
+from .templates import Signature, row_signature
 from .utils import (
     parse_yymmdd,
     parse_birth_date,
@@ -31,13 +38,20 @@ from .utils import (
     calculate_age,
     is_senior,
     normalize_text,
-    clean_cell_value
+    clean_cell_value,
+    strip_upload_counter
 )
 
 
 class AttendanceParser(BaseExcelParser):
     """Parser for attendance Excel files."""
 
+    PARSER_VERSION = 5  # 2: duplicate-upload counter stripped from file names
+                        # 3: rows as record NamedTuples (see records)
+                        # 4: header row and columns located by label (layout templates)
+                        # 5: layout templates per parser version
+    FILE_TYPE = "attendance"
+    SOURCE_SUFFIXES = (".xlsx",) + tuple(CSV_DELIMITERS)  # CSV/TSV exports of the sheet too
     SHEET_NAME = "출퇴근 무사고 확인서"
     HEADER_ROW = 14
     DATA_START_ROW = 15
@@ -53,6 +67,40 @@ class AttendanceParser(BaseExcelParser):
     COL_CHECK_OUT = 20    # 퇴근 시간
     COL_STATUS = 23       # 상태 (무사고/사고)
 
+    # Rows searched for the header row (must have 이름 and 출근 labels)
+    HEADER_SEARCH_ROWS = 30
+
+    @classmethod
+    def _default_columns(cls) -> Dict[str, int]:
+        return {
+            "no": cls.COL_NO,
+            "role": cls.COL_ROLE,
+            "name": cls.COL_NAME,
+            "position": cls.COL_POSITION,
+            "birth": cls.COL_BIRTH,
+            "phone": cls.COL_PHONE,
+            "check_in": cls.COL_CHECK_IN,
+            "check_out": cls.COL_CHECK_OUT,
+            "status": cls.COL_STATUS,
+        }
+
+    @staticmethod
+    def _header_key(label: str) -> Optional[str]:
+        """Column key of a header label, or None."""
+        text = label.strip().replace("\n", "")
+        compact = text.upper().replace(" ", "")
+        if compact in ("NO", "NO.", "번호"):
+            return "no"
+        if text in ("이름", "성명"):
+            return "name"
+        for keyword, key in (("구분", "role"), ("직책", "position"), ("직종", "position"),
+                             ("생년월일", "birth"), ("휴대폰", "phone"), ("연락처", "phone"),
+                             ("출근", "check_in"), ("퇴근", "check_out"), ("상태", "status")):
+            if keyword in text:
+                return key
+        return None
+
+    @profiled("parse_filename")
     def parse_filename(self) -> Dict[str, Any]:
         """
         Parse filename to extract metadata.
@@ -63,8 +111,8 @@ class AttendanceParser(BaseExcelParser):
         # Remove the prefix
         name = basename.replace("출퇴근무사고_", "")
 
-        # Split by underscore
-        parts = name.split("_")
+        # Split by underscore (ignoring a duplicate-upload counter)
+        parts = strip_upload_counter(name.split("_"))
 
         # Last part is the date (YYMMDD)
         date_str = parts[-1] if parts else ""
@@ -83,6 +131,7 @@ class AttendanceParser(BaseExcelParser):
             "partner_name": partner_name
         }
 
+    @profiled("metadata")
     def extract_metadata(self) -> Dict[str, Any]:
         """Extract metadata from header rows."""
         return {}
@@ -113,18 +162,39 @@ class AttendanceParser(BaseExcelParser):
         # Fallback to utility function
         return parse_time(value)
 
+    @profiled("header_discovery")
+    def discover_layout(self) -> Dict[str, Any]:
+        """Locate the header row by its labels and map each label to its column."""
+        for row, values in enumerate(self.grid[:self.HEADER_SEARCH_ROWS], 1):
+            columns: Dict[str, int] = {}
+            for col, value in enumerate(values, 1):
+                if isinstance(value, str):
+                    key = self._header_key(value)
+                    if key and key not in columns:
+                        columns[key] = col
+            if "name" in columns and "check_in" in columns:
+                return {"header_row": row, "columns": {**self._default_columns(), **columns}}
+
+        return {"header_row": self.HEADER_ROW, "columns": self._default_columns()}
+
+    def layout_signature(self, layout: Dict[str, Any]) -> Signature:
+        return row_signature(self.grid, layout["header_row"])
+
+    @profiled("header_discovery")
     def _find_data_section_end(self, start_row: int) -> int:
         """Find where the data section ends (before 사고발생자 명단)."""
-        for row in range(start_row, self.worksheet.max_row + 1):
-            # Check column 2 for section markers
-            val = self.get_cell_value(row, 2)
+        no_col = self.layout["columns"]["no"]
+        for row in range(start_row, self.max_row + 1):
+            # Check the NO column for section markers
+            val = self.get_cell_value(row, no_col)
             if val:
                 val_str = str(val).strip()
                 if '사고발생자' in val_str or '명단' in val_str:
                     return row - 1
-        return self.worksheet.max_row
+        return self.max_row
 
-    def extract_data_rows(self) -> List[Dict[str, Any]]:
+    @profiled("row_extraction")
+    def extract_data_rows(self) -> List[AttendanceRecord]:
         """Extract attendance data from the worksheet."""
         records = []
 
@@ -132,17 +202,22 @@ class AttendanceParser(BaseExcelParser):
         file_meta = self.parse_filename()
         work_date = file_meta.get("work_date")
 
+        # Header row and columns (cached template positions, or discover_layout())
+        layout = self.layout
+        cols = layout["columns"]
+        data_start_row = layout["header_row"] + 1
+
         # Find the end of the data section
-        data_end_row = self._find_data_section_end(self.DATA_START_ROW)
+        data_end_row = self._find_data_section_end(data_start_row)
 
-        for row in range(self.DATA_START_ROW, data_end_row + 1):
+        for row in range(data_start_row, data_end_row + 1):
             # Get NO - skip if empty (means end of data)
-            no_val = self.get_cell_value(row, self.COL_NO)
+            no_val = self.get_cell_value(row, cols["no"])
             if not no_val or not str(no_val).strip() or not str(no_val).strip().isdigit():
                 continue
 
             # Get name - skip empty rows
-            worker_name = clean_cell_value(self.get_cell_value(row, self.COL_NAME))
+            worker_name = clean_cell_value(self.get_cell_value(row, cols["name"]))
             if not worker_name:
                 continue
 
@@ -151,14 +226,14 @@ class AttendanceParser(BaseExcelParser):
                 continue
 
             # Extract role (구분)
-            role_value = clean_cell_value(self.get_cell_value(row, self.COL_ROLE))
+            role_value = clean_cell_value(self.get_cell_value(row, cols["role"]))
             role = "근로자"  # Default
             if role_value:
                 if "관리" in role_value:
                     role = "관리자"
 
             # Extract birth date (YY.MM.DD format)
-            birth_value = self.get_cell_value(row, self.COL_BIRTH)
+            birth_value = self.get_cell_value(row, cols["birth"])
             birth_date = parse_birth_date(birth_value)
 
             # Calculate age and senior status
@@ -169,30 +244,29 @@ class AttendanceParser(BaseExcelParser):
                 senior = is_senior(birth_date, work_date)
 
             # Extract check-in time
-            check_in = self._parse_time_value(self.get_cell_value(row, self.COL_CHECK_IN))
+            check_in = self._parse_time_value(self.get_cell_value(row, cols["check_in"]))
 
             # Extract check-out time
-            check_out = self._parse_time_value(self.get_cell_value(row, self.COL_CHECK_OUT))
+            check_out = self._parse_time_value(self.get_cell_value(row, cols["check_out"]))
 
             # Extract accident status from 상태 column
-            status_value = clean_cell_value(self.get_cell_value(row, self.COL_STATUS))
+            status_value = clean_cell_value(self.get_cell_value(row, cols["status"]))
             has_accident = False
             if status_value:
                 status_str = status_value.lower()
                 # "무사고" means no accident, anything else (like "사고") means accident
                 has_accident = '사고' in status_str and '무사고' not in status_str
 
-            record = {
-                "worker_name": worker_name,
-                "role": role,
-                "birth_date": birth_date.isoformat() if birth_date else None,
-                "age": age,
-                "is_senior": senior,
-                "check_in_time": check_in.isoformat() if check_in else None,
-                "check_out_time": check_out.isoformat() if check_out else None,
-                "has_accident": has_accident
-            }
-            records.append(record)
+            records.append(AttendanceRecord(
+                worker_name,
+                role,
+                birth_date.isoformat() if birth_date else None,
+                age,
+                senior,
+                check_in.isoformat() if check_in else None,
+                check_out.isoformat() if check_out else None,
+                has_accident
+            ))
 
         return records
 
@@ -2,12 +2,40 @@
 Base parser class for Excel file parsing
 """
 
+import io
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
+from backend.config import LAYOUT_TEMPLATES_PATH
+
+from .archives import ArchiveMember, source_path
+from .csv_reader import CsvWorkbook, is_csv_file
+from .profiling import StageProfiler, profiled
+from .templates import LayoutTemplate, Signature, get_registry, layout_fingerprint, matches
+from .xlsx_reader import XlsxWorkbook
+
+# Workbook reader engines:
+# - "openpyxl": load_workbook(read_only=True, data_only=True)
+# - "stream": backend.etl.xlsx_reader, cell values only (no styles/object model)
+# CSV/TSV sources are always read with backend.etl.csv_reader.
+ENGINES = ("openpyxl", "stream")
+DEFAULT_ENGINE = "openpyxl"
+
+# Sheet scanning bounds. Exported files often declare bogus dimensions
+# (A1:XFD1048576) or carry thousands of formatted empty rows, so the grid is
+# read without the declared dimension, capped at MAX_SCAN_COLUMNS and cut
+# off after MAX_EMPTY_ROW_RUN consecutive empty rows.
+MAX_SCAN_COLUMNS = 256
+MAX_EMPTY_ROW_RUN = 1000
+
+# A declared dimension is reported when it exceeds the real data extent by
+# this factor and at least DIMENSION_SLACK rows/columns
+DIMENSION_WARN_FACTOR = 10
+DIMENSION_SLACK = 100
+
 
 class BaseExcelParser(ABC):
     """Abstract base class for Excel file parsing using Template Method pattern."""
@@ -15,16 +43,60 @@ class BaseExcelParser(ABC):
     SHEET_NAME: str = ""  # Override in subclass
     METADATA_ROWS: int = 0  # Number of header/metadata rows to skip
     DATA_START_ROW: int = 1  # Row where data begins (1-indexed)
+    PARSER_VERSION: int = 1  # Bump when output changes (invalidates parse cache)
+    FILE_TYPE: str = ""  # processed_files.file_type; keys layout templates
+    SOURCE_SUFFIXES: Tuple[str, ...] = (".xlsx",)  # Source files this parser reads
+    RECORDS_PER_ROW: int = 1  # Records per data row (run_metadata row_count estimate)
 
-    def __init__(self, file_path: str):
-        self.file_path = Path(file_path)
+    def __init__(self, file_path: str, engine: str = DEFAULT_ENGINE, profile: bool = False,
+                 templates_path: Path = LAYOUT_TEMPLATES_PATH):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown reader engine: {engine}")
+        # A file on disk, or a member of a zip archive ("<archive>::<member>")
+        self.file_path = source_path(file_path)
+        self.engine = engine
+        self.templates_path = templates_path  # layout template registry (see templates.py)
         self.workbook = None
         self.worksheet: Optional[Worksheet] = None
 
+        # Profiling (run_etl --profile): stage timings and cell-read counts.
+        # The counting accessor is bound per instance so normal runs pay nothing.
+        self.profiler: Optional[StageProfiler] = StageProfiler() if profile else None
+        if profile:
+            self.get_cell_value = self._counted_get_cell_value
+
+    @property
+    def worksheet(self) -> Optional[Worksheet]:
+        return self._worksheet
+
+    @worksheet.setter
+    def worksheet(self, worksheet: Optional[Worksheet]) -> None:
+        self._worksheet = worksheet
+        self._grid: Optional[List[Tuple[Any, ...]]] = None
+        self._layout: Optional[Dict[str, Any]] = None
+        self.warnings: List[str] = []
+        # Layout template used for this worksheet (see templates.py)
+        self.template_info: Optional[Dict[str, Any]] = None
+
+    def _member_content(self) -> Optional[bytes]:
+        """Content of an archive member source file (read into memory); None for files on disk."""
+        if isinstance(self.file_path, ArchiveMember):
+            return self.file_path.read_bytes()
+        return None
+
+    @profiled("load_workbook")
     def open_workbook(self) -> None:
-        """Open the Excel workbook."""
-        self.workbook = load_workbook(str(self.file_path), data_only=True, read_only=True)
+        """Open the Excel workbook with the selected reader engine (CSV/TSV: csv_reader)."""
+        content = self._member_content()
+        source = str(self.file_path) if content is None else io.BytesIO(content)
+        if is_csv_file(self.file_path):
+            self.workbook = CsvWorkbook(str(self.file_path), content)
+        elif self.engine == "stream":
+            self.workbook = XlsxWorkbook(source)
+        else:
+            self.workbook = load_workbook(source, data_only=True, read_only=True)
 
+    @profiled("close_workbook")
     def close_workbook(self) -> None:
         """Close the workbook."""
         if self.workbook:
@@ -47,35 +119,162 @@ class BaseExcelParser(ABC):
         # Fall back to first sheet
         return self.workbook.active
 
-    def get_cell_value(self, row: int, col: int) -> Any:
-        """Get cell value by row and column (1-indexed)."""
+    @profiled("read_grid")
+    def _load_grid(self) -> List[Tuple[Any, ...]]:
+        """
+        Read the worksheet once into an in-memory grid of cell values.
+
+        In read_only mode every worksheet.cell() lookup re-scans the sheet XML,
+        so all cell access is served from this snapshot instead. Trailing empty
+        cells of each row and trailing empty rows are trimmed.
+
+        The declared dimension is ignored (rows are not padded out to it);
+        reading stops after MAX_EMPTY_ROW_RUN empty rows and at
+        MAX_SCAN_COLUMNS columns. A declared dimension far beyond the real
+        extent is noted in self.warnings.
+        """
         if self.worksheet is None:
             raise RuntimeError("Worksheet not set")
-        return self.worksheet.cell(row=row, column=col).value
+
+        declared_rows, declared_cols = self.worksheet.max_row, self.worksheet.max_column
+        self.worksheet.reset_dimensions()
+
+        grid = []
+        empty_run = 0
+        truncated = False
+        for values in self.worksheet.iter_rows(min_row=1, min_col=1, max_col=MAX_SCAN_COLUMNS, values_only=True):
+            end = len(values)
+            while end and values[end - 1] is None:
+                end -= 1
+            if end:
+                empty_run = 0
+            else:
+                empty_run += 1
+                if empty_run > MAX_EMPTY_ROW_RUN:
+                    truncated = True
+                    break
+            grid.append(values[:end])
+
+        while grid and not grid[-1]:
+            grid.pop()
+
+        self._grid = grid
+        self._check_dimension(declared_rows, declared_cols, truncated)
+        return grid
+
+    def _check_dimension(self, declared_rows: Optional[int], declared_cols: Optional[int], truncated: bool) -> None:
+        """Note a declared dimension that differs wildly from the data extent."""
+        rows, cols = self.max_row, self.max_column
+
+        def oversized(declared: Optional[int], real: int) -> bool:
+            return bool(declared) and declared > real * DIMENSION_WARN_FACTOR and declared - real >= DIMENSION_SLACK
+
+        if truncated or oversized(declared_rows, rows) or oversized(declared_cols, cols):
+            note = f"declared dimension {declared_rows or '?'}x{declared_cols or '?'}, data ends at {rows}x{cols}"
+            if truncated:
+                note += f" (scan stopped after {MAX_EMPTY_ROW_RUN} empty rows)"
+            self.warnings.append(note)
+
+    @property
+    def grid(self) -> List[Tuple[Any, ...]]:
+        """Cached cell values of the worksheet (row-major, 0-indexed)."""
+        if self._grid is None:
+            return self._load_grid()
+        return self._grid
+
+    @property
+    def max_row(self) -> int:
+        """Last row containing a value (1-indexed)."""
+        return len(self.grid)
+
+    @property
+    def max_column(self) -> int:
+        """Last column containing a value in any row (1-indexed)."""
+        return max(map(len, self.grid), default=0)
+
+    def discover_layout(self) -> Optional[Dict[str, Any]]:
+        """Find header/column positions by scanning the sheet. Override in subclass."""
+        return None
+
+    def layout_signature(self, layout: Dict[str, Any]) -> Signature:
+        """Header cells identifying the template of a discovered layout. Override in subclass."""
+        return ()
+
+    @property
+    def layout(self) -> Optional[Dict[str, Any]]:
+        """Header/column positions of the worksheet (cached template or discovery)."""
+        if self._layout is None:
+            self._layout = self._resolve_layout()
+        return self._layout
+
+    @profiled("template_match")
+    def _resolve_layout(self) -> Optional[Dict[str, Any]]:
+        """
+        Use the positions of a known template whose signature matches this
+        sheet; otherwise discover them and learn the new template.
+        """
+        registry = get_registry(self.templates_path)
+        sheet_name = self.worksheet.title
+        max_column = self.max_column
+
+        for template in registry.candidates(self.FILE_TYPE, self.PARSER_VERSION, sheet_name, max_column):
+            if matches(self.grid, template.signature):
+                self.template_info = {**template._asdict(), "matched": True}
+                return template.layout
+
+        layout = self.discover_layout()
+        signature = self.layout_signature(layout) if layout is not None else ()
+        if signature:
+            fingerprint = layout_fingerprint(self.FILE_TYPE, self.PARSER_VERSION, sheet_name, max_column, signature)
+            template = LayoutTemplate(fingerprint, self.FILE_TYPE, self.PARSER_VERSION, sheet_name, max_column,
+                                      signature, layout)
+            registry.learn(template)
+            self.template_info = {**template._asdict(), "matched": False}
+        return layout
+
+    def get_cell_value(self, row: int, col: int) -> Any:
+        """Get cell value by row and column (1-indexed)."""
+        grid = self._grid
+        if grid is None:
+            grid = self._load_grid()
+        if 0 < row <= len(grid):
+            values = grid[row - 1]
+            if 0 < col <= len(values):
+                return values[col - 1]
+        return None
+
+    def _counted_get_cell_value(self, row: int, col: int) -> Any:
+        """get_cell_value variant that counts reads (profiling only)."""
+        self.profiler.cell_reads += 1
+        return BaseExcelParser.get_cell_value(self, row, col)
 
     def get_row_values(self, row: int, start_col: int = 1, end_col: Optional[int] = None) -> List[Any]:
-        """Get all values from a row."""
+        """Get all values from a row (up to the last column with data by default)."""
         if self.worksheet is None:
             raise RuntimeError("Worksheet not set")
 
         if end_col is None:
-            end_col = self.worksheet.max_column
+            end_col = self.max_column
 
-        return [self.worksheet.cell(row=row, column=c).value for c in range(start_col, end_col + 1)]
+        return [self.get_cell_value(row, c) for c in range(start_col, end_col + 1)]
 
     @abstractmethod
     def parse_filename(self) -> Dict[str, Any]:
         """Extract metadata from filename pattern. Override in subclass."""
         pass
 
+    def sheet_name_metadata(self) -> Dict[str, Any]:
+        """Metadata known from the sheet name alone (no cells); run_metadata() includes it."""
+        return {}
+
     @abstractmethod
     def extract_metadata(self) -> Dict[str, Any]:
         """Extract header/metadata from worksheet. Override in subclass."""
         pass
 
     @abstractmethod
-    def extract_data_rows(self) -> List[Dict[str, Any]]:
-        """Extract data rows from worksheet. Override in subclass."""
+    def extract_data_rows(self) -> List[tuple]:
+        """Extract data rows from worksheet (record NamedTuples, see records). Override in subclass."""
         pass
 
     def run(self) -> Dict[str, Any]:
@@ -99,7 +298,38 @@ class BaseExcelParser(ABC):
             return {
                 "filename": self.file_path.name,
                 "metadata": metadata,
-                "records": records
+                "records": records,
+                "template": self.template_info,  # layout template (None if not templated)
+                "warnings": self.warnings  # sheet problems worth reporting (e.g. bogus dimension)
+            }
+        finally:
+            self.close_workbook()
+
+    def run_metadata(self) -> Dict[str, Any]:
+        """
+        First tier of a tiered load: file name and sheet name metadata and an
+        estimated record count.
+
+        No cell values are decoded, so this takes a fraction of run().
+        row_count estimates the records run() would return: the rows from
+        DATA_START_ROW to the last row holding a value (found in the sheet
+        data, not the declared dimension) times RECORDS_PER_ROW. It counts
+        footer and section rows too.
+        """
+        content = self._member_content()
+        if is_csv_file(self.file_path):
+            self.workbook = CsvWorkbook(str(self.file_path), content)
+        else:
+            source = str(self.file_path) if content is None else io.BytesIO(content)
+            self.workbook = XlsxWorkbook(source, read_values=False)
+        try:
+            self.worksheet = self.get_sheet()
+            data_rows = max(0, self.worksheet.last_value_row() - self.DATA_START_ROW + 1)
+            return {
+                "filename": self.file_path.name,
+                "metadata": {**self.parse_filename(), **self.sheet_name_metadata()},
+                "records": [],
+                "row_count": data_rows * self.RECORDS_PER_ROW
             }
         finally:
             self.close_workbook()
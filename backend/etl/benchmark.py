@@ -0,0 +1,192 @@
+"""
+ETL throughput benchmark.
+
+Measures files/sec and rows/sec for each parser on its own (parse only, no
+cache) and for a cold full run_full_etl (parse + load into a fresh SQLite
+database), on a synthetic corpus (see synthetic.py) or an existing data
+repository. Results can be written as JSON to compare changes over time.
+With --csv the attendance/TBM workbooks are also exported to CSV (the cell
+grid the parser reads) and parsed again, to compare the CSV fast path with
+the xlsx path on the same data.
+
+Usage:
+    python -m backend.etl.benchmark                       # 100 synthetic files per type
+    python -m backend.etl.benchmark --count 1000 --workers 4
+    python -m backend.etl.benchmark --data-dir data_repository --json bench.json
+    python -m backend.etl.benchmark --csv                 # CSV vs xlsx parse throughput
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add parent directory to path for imports when running as script
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from backend.etl.base_parser import DEFAULT_ENGINE, ENGINES
+from backend.etl.parallel import PARSERS, iter_parsed_files
+from backend.etl.run_etl import run_full_etl
+from backend.etl.synthetic import TYPE_DIRS, generate_corpus
+
+# Tables counted as loaded rows (parsed records plus risk worker confirmations)
+ROW_TABLES = ["attendance_logs", "risk_items", "risk_confirmations", "tbm_participants"]
+
+
+def _result(files: int, rows: int, seconds: float, errors: int = 0) -> Dict[str, Any]:
+    return {
+        "files": files,
+        "rows": rows,
+        "errors": errors,
+        "seconds": seconds,
+        "files_per_sec": files / seconds if seconds else 0.0,
+        "rows_per_sec": rows / seconds if seconds else 0.0,
+    }
+
+
+def bench_parser(file_type: str, file_paths: List[Path], workers: int = 1,
+                 engine: str = DEFAULT_ENGINE) -> Dict[str, Any]:
+    """Parse every file of one type (no cache, no database) and time it."""
+    rows = 0
+    errors = 0
+    started = time.perf_counter()
+    for _path, parsed, error in iter_parsed_files(file_type, file_paths, workers, engine=engine):
+        if error is not None:
+            errors += 1
+            continue
+        rows += len(parsed["records"]) + len(parsed.get("confirmations", []))
+    return _result(len(file_paths) - errors, rows, time.perf_counter() - started, errors)
+
+
+def export_csv(file_type: str, file_path: Path, target: Path) -> None:
+    """Write the cell grid the parser reads from a workbook as a CSV file."""
+    parser = PARSERS[file_type](str(file_path), engine="stream")
+    parser.open_workbook()
+    try:
+        parser.worksheet = parser.get_sheet()
+        with open(target, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            for values in parser.grid:
+                writer.writerow(["" if value is None else value for value in values])
+    finally:
+        parser.close_workbook()
+
+
+def bench_csv(file_type: str, file_paths: List[Path], workers: int = 1) -> Dict[str, Any]:
+    """Export the workbooks to CSV (not timed) and time parsing the CSV copies."""
+    with tempfile.TemporaryDirectory(prefix="etl_csv_") as tmp:
+        csv_paths = []
+        for path in file_paths:
+            target = Path(tmp) / (path.stem + ".csv")
+            export_csv(file_type, path, target)
+            csv_paths.append(target)
+        return bench_parser(file_type, csv_paths, workers)
+
+
+def bench_full_etl(data_dir: Path, workers: int = 1, engine: str = DEFAULT_ENGINE) -> Dict[str, Any]:
+    """Run a cold run_full_etl into a temporary database and time it."""
+    with tempfile.TemporaryDirectory(prefix="etl_bench_") as tmp:
+        db_path = Path(tmp) / "bench.db"
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_full_etl(reset_db=True, workers=workers, engine=engine, use_cache=False,
+                         database_path=db_path, data_dir=data_dir)
+        seconds = time.perf_counter() - started
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            files = conn.execute("SELECT COUNT(*) FROM processed_files").fetchone()[0]
+            rows = sum(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in ROW_TABLES)
+        finally:
+            conn.close()
+    return _result(files, rows, seconds)
+
+
+def run_benchmark(data_dir: Path, workers: int = 1, engine: str = DEFAULT_ENGINE,
+                  repeat: int = 1, csv_copies: bool = False) -> Dict[str, Any]:
+    """
+    Benchmark each parser and the full ETL; the best of `repeat` runs is kept.
+
+    With csv_copies, parsers that read CSV are also timed on CSV exports of
+    their workbooks (report["csv"]).
+    """
+    report: Dict[str, Any] = {"data_dir": str(data_dir), "workers": workers, "engine": engine, "parsers": {}}
+    if csv_copies:
+        report["csv"] = {}
+
+    def best(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return min(runs, key=lambda r: r["seconds"])
+
+    for file_type, sub in TYPE_DIRS.items():
+        file_paths = sorted(p for p in (data_dir / sub).glob("*.xlsx") if not p.name.startswith("~$"))
+        if not file_paths:
+            continue
+        report["parsers"][file_type] = best([
+            bench_parser(file_type, file_paths, workers, engine) for _ in range(repeat)
+        ])
+        if csv_copies and ".csv" in PARSERS[file_type].SOURCE_SUFFIXES:
+            report["csv"][file_type] = best([bench_csv(file_type, file_paths, workers) for _ in range(repeat)])
+
+    report["full_etl"] = best([bench_full_etl(data_dir, workers, engine) for _ in range(repeat)])
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        "=" * 72,
+        f"ETL BENCHMARK  workers={report['workers']}  engine={report['engine']}",
+        f"Data: {report['data_dir']}",
+        "=" * 72,
+        f"{'Stage':<22}{'Files':>8}{'Rows':>10}{'Errors':>8}{'Seconds':>10}{'Files/s':>11}{'Rows/s':>11}",
+    ]
+    entries = [(f"parse:{t}", r) for t, r in report["parsers"].items()]
+    entries += [(f"parse:{t}.csv", r) for t, r in report.get("csv", {}).items()]
+    entries.append(("full_etl", report["full_etl"]))
+    for name, r in entries:
+        lines.append(f"{name:<22}{r['files']:>8}{r['rows']:>10}{r['errors']:>8}{r['seconds']:>10.3f}"
+                     f"{r['files_per_sec']:>11.1f}{r['rows_per_sec']:>11.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ETL throughput (files/sec, rows/sec)")
+    parser.add_argument("--data-dir", type=Path, default=None,
+                        help="Existing data repository to benchmark (default: generate a synthetic corpus)")
+    parser.add_argument("--count", type=int, default=100, metavar="N",
+                        help="Synthetic files per type (default: 100)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=1, metavar="N")
+    parser.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE)
+    parser.add_argument("--repeat", type=int, default=1, metavar="N", help="Runs per measurement, best kept")
+    parser.add_argument("--csv", action="store_true",
+                        help="Also time parsing CSV exports of the attendance/TBM workbooks")
+    parser.add_argument("--json", type=Path, default=None, metavar="PATH", help="Also write results as JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="etl_corpus_") as tmp:
+        data_dir = args.data_dir
+        if data_dir is None:
+            data_dir = Path(tmp)
+            print(f"Generating synthetic corpus ({args.count} files per type)...")
+            generate_corpus(data_dir, attendance=args.count, risk=args.count, tbm=args.count, seed=args.seed)
+
+        report = run_benchmark(data_dir, max(1, args.workers), args.engine, max(1, args.repeat), args.csv)
+        if args.data_dir is None:
+            report["synthetic"] = {"count": args.count, "seed": args.seed}
+
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
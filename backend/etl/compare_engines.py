@@ -0,0 +1,119 @@
+"""
+Compare the openpyxl and stream reader engines on data_repository.
+
+For every workbook the cell grid and the full parser output must match
+between engines; timings are reported per file type.
+
+Usage:
+    python -m backend.etl.compare_engines              # all files
+    python -m backend.etl.compare_engines --limit 50   # first 50 files per type
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add parent directory to path for imports when running as script
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from backend.config import ATTENDANCE_DIR, RISK_ASSESSMENT_DIR, TBM_DIR
+from backend.etl.parallel import PARSERS
+
+TYPE_DIRS = {
+    "attendance": ATTENDANCE_DIR,
+    "risk": RISK_ASSESSMENT_DIR,
+    "tbm": TBM_DIR,
+}
+
+
+def _timed_run(file_type: str, file_path: Path, engine: str) -> Tuple[float, Any, Dict[str, Any]]:
+    """Run the parser with one engine; return (seconds, grid, parsed)."""
+    parser = PARSERS[file_type](str(file_path), engine=engine)
+    started = time.perf_counter()
+    parsed = parser.run()
+    elapsed = time.perf_counter() - started
+    return elapsed, parser.grid, parsed
+
+
+def compare_file(file_type: str, file_path: Path) -> Dict[str, Any]:
+    """Parse one file with both engines and compare grids and parser output."""
+    openpyxl_time, openpyxl_grid, openpyxl_parsed = _timed_run(file_type, file_path, "openpyxl")
+    stream_time, stream_grid, stream_parsed = _timed_run(file_type, file_path, "stream")
+
+    problems: List[str] = []
+    if openpyxl_grid != stream_grid:
+        for row, (expected, actual) in enumerate(zip(openpyxl_grid, stream_grid), start=1):
+            if expected != actual:
+                problems.append(f"row {row}: openpyxl={expected!r} stream={actual!r}")
+                break
+        else:
+            problems.append(f"row count: openpyxl={len(openpyxl_grid)} stream={len(stream_grid)}")
+    if openpyxl_parsed != stream_parsed:
+        problems.append("parser output differs")
+
+    return {"openpyxl": openpyxl_time, "stream": stream_time, "problems": problems}
+
+
+def compare_directory(file_type: str, directory: Path, limit: int = 0) -> Dict[str, Any]:
+    """Compare engines on all workbooks of one file type."""
+    stats = {"files": 0, "mismatches": 0, "errors": 0, "openpyxl": 0.0, "stream": 0.0}
+
+    if not directory.exists():
+        print(f"Warning: {file_type} directory not found: {directory}")
+        return stats
+
+    files = sorted(f for f in directory.glob("*.xlsx") if not f.name.startswith("~$"))
+    if limit:
+        files = files[:limit]
+
+    for file_path in files:
+        try:
+            result = compare_file(file_type, file_path)
+        except Exception as e:
+            stats["errors"] += 1
+            print(f"  Error comparing {file_path.name}: {e}")
+            continue
+
+        stats["files"] += 1
+        stats["openpyxl"] += result["openpyxl"]
+        stats["stream"] += result["stream"]
+        if result["problems"]:
+            stats["mismatches"] += 1
+            print(f"  MISMATCH {file_path.name}: {'; '.join(result['problems'])}")
+
+    return stats
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Compare openpyxl and stream reader engines")
+    parser.add_argument("--limit", type=int, default=0, help="Max files per type (default: all)")
+    args = parser.parse_args()
+
+    results = {}
+    for file_type, directory in TYPE_DIRS.items():
+        print(f"Comparing {file_type} files...")
+        results[file_type] = compare_directory(file_type, directory, args.limit)
+
+    print("\n" + "=" * 72)
+    print(f"{'Type':<12}{'Files':>7}{'Mismatch':>10}{'Errors':>8}"
+          f"{'openpyxl ms':>13}{'stream ms':>12}{'Speedup':>10}")
+    print("-" * 72)
+    failed = False
+    for file_type, stats in results.items():
+        files = stats["files"] or 1
+        speedup = stats["openpyxl"] / stats["stream"] if stats["stream"] else 0.0
+        print(f"{file_type:<12}{stats['files']:>7}{stats['mismatches']:>10}{stats['errors']:>8}"
+              f"{stats['openpyxl'] / files * 1000:>13.1f}{stats['stream'] / files * 1000:>12.1f}"
+              f"{speedup:>9.2f}x")
+        failed = failed or stats["mismatches"] > 0 or stats["errors"] > 0
+    print("=" * 72)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
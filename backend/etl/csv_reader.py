@@ -0,0 +1,134 @@
+"""
+Streaming reader for CSV/TSV exports of the attendance and TBM sheets.
+
+A CSV file holds the cells of one sheet as text, either the whole sheet as
+saved by Excel (same rows and columns as the workbook) or just the header
+row and the data rows; the parsers find their columns by the header labels
+either way and already accept the text forms of every value (NO, YY.MM.DD
+birth dates, HH:MM times). There is no zip archive or XML to decode, so a
+CSV export parses several times faster than the equivalent workbook.
+
+Like xlsx_reader it mirrors the part of openpyxl's read-only API that
+BaseExcelParser uses. Rows are streamed with the csv module; empty cells
+are None and rows are not padded to a width. The delimiter comes from the
+file suffix; the encoding is UTF-8 (with or without BOM, as written by
+Excel's "CSV UTF-8") or CP949 (Excel's plain CSV on Korean Windows).
+"""
+
+import codecs
+import csv
+import io
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple
+
+# Source file suffix -> delimiter
+CSV_DELIMITERS = {".csv": ",", ".tsv": "\t"}
+
+# Tried in order on the first ENCODING_PROBE_BYTES of the file
+CSV_ENCODINGS = ("utf-8-sig", "cp949")
+ENCODING_PROBE_BYTES = 64 * 1024
+
+# Title of the single sheet (layout templates are keyed by sheet name)
+CSV_SHEET_TITLE = "csv"
+
+
+def is_csv_file(file_path: Path) -> bool:
+    """Whether a source file (path or archive member) is a CSV/TSV export (by suffix)."""
+    return file_path.suffix.lower() in CSV_DELIMITERS
+
+
+def detect_encoding(head: bytes) -> str:
+    """First of CSV_ENCODINGS that decodes the start of a file."""
+    for encoding in CSV_ENCODINGS:
+        try:
+            # Incremental decode: a character cut off at the end of the probe is not an error
+            codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"Unsupported text encoding (expected one of {', '.join(CSV_ENCODINGS)})")
+
+
+class CsvWorksheet:
+    """The single sheet of a CSV file, streamed on demand."""
+
+    def __init__(self, workbook: "CsvWorkbook"):
+        self.parent = workbook
+        self.title = CSV_SHEET_TITLE
+
+    # CSV files declare no dimension
+    max_row: Optional[int] = None
+    max_column: Optional[int] = None
+
+    def reset_dimensions(self) -> None:
+        """No-op (there is no declared dimension to ignore)."""
+
+    def last_value_row(self) -> int:
+        """Number of the last row holding a value (0 if none)."""
+        last = 0
+        with self.parent.open_text() as f:
+            for row_number, row in enumerate(csv.reader(f, delimiter=self.parent.delimiter), 1):
+                if any(row):
+                    last = row_number
+        return last
+
+    def iter_rows(self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+                  min_col: Optional[int] = None, max_col: Optional[int] = None,
+                  values_only: bool = False) -> Iterator[Tuple[Any, ...]]:
+        """Yield row value tuples (empty cells as None, trailing cells not padded)."""
+        if not values_only:
+            raise ValueError("CsvWorksheet only supports values_only=True")
+
+        min_row = min_row or 1
+        start = (min_col or 1) - 1
+        with self.parent.open_text() as f:
+            for row_number, row in enumerate(csv.reader(f, delimiter=self.parent.delimiter), 1):
+                if row_number < min_row:
+                    continue
+                if max_row is not None and row_number > max_row:
+                    break
+                yield tuple(value if value != "" else None for value in row[start:max_col])
+
+
+class CsvWorkbook:
+    """Minimal read-only workbook view of a CSV/TSV file (one sheet)."""
+
+    def __init__(self, file_path: str, data: Optional[bytes] = None):
+        """
+        Args:
+            file_path: Path of the file (its suffix selects the delimiter)
+            data: File content already in memory (archive members); read
+                  from file_path when None
+        """
+        self.file_path = Path(file_path)
+        self.data = data
+        self.delimiter = CSV_DELIMITERS.get(self.file_path.suffix.lower(), ",")
+        if data is None:
+            with open(self.file_path, "rb") as f:
+                head = f.read(ENCODING_PROBE_BYTES)
+        else:
+            head = data[:ENCODING_PROBE_BYTES]
+        self.encoding = detect_encoding(head)
+        self._sheet = CsvWorksheet(self)
+
+    def open_text(self) -> io.TextIOBase:
+        """A new text stream over the file content."""
+        if self.data is None:
+            return open(self.file_path, newline="", encoding=self.encoding)
+        return io.TextIOWrapper(io.BytesIO(self.data), newline="", encoding=self.encoding)
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return [self._sheet.title]
+
+    def __getitem__(self, name: str) -> CsvWorksheet:
+        if name != self._sheet.title:
+            raise KeyError(f"Worksheet {name} does not exist.")
+        return self._sheet
+
+    @property
+    def active(self) -> CsvWorksheet:
+        return self._sheet
+
+    def close(self) -> None:
+        """Nothing to release (rows are read from a stream opened per iteration)."""
@@ -0,0 +1,125 @@
+"""
+Source file discovery: date partitions and the discovery manifest.
+
+New files arrive in the top level of each type directory. With
+run_etl --partition, files that are fully processed are moved into
+YYYY/MM sub-folders of their directory by the date in their file name
+(zip archives: their newest member), e.g. 01_attendance/2025/02/. The
+source_manifest table records where each moved file went.
+
+Incremental runs list only the top level of a directory, so once processed
+files are partitioned they list and stat just the new arrivals, and the
+recorded state is looked up for those names only: startup no longer grows
+with the history. Full rebuilds also list every partition, and selective
+runs list the partitions their date window can reach. Tracked files are
+resolved through the manifest (see resolve_tracked).
+"""
+
+import os
+import sqlite3
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .archives import ArchiveMember, SourcePath, tracked_source
+from .scheduling import file_date
+from .tracking import get_file_states, get_pending_files, stat_state
+
+
+def partition_location(day: date) -> str:
+    """Partition folder of a file date, relative to its type directory (YYYY/MM)."""
+    return f"{day:%Y}/{day:%m}"
+
+
+def list_partitions(directory: Path, since: Optional[date] = None) -> List[Path]:
+    """Partition folders of a type directory, newest first (only months from since's on, if given)."""
+    partitions = []
+    for year in directory.glob("[0-9][0-9][0-9][0-9]"):
+        for month in year.glob("[0-9][0-9]"):
+            if month.is_dir() and (since is None or (int(year.name), int(month.name)) >= (since.year, since.month)):
+                partitions.append(month)
+    return sorted(partitions, reverse=True)
+
+
+def _disk_file(path: SourcePath) -> Path:
+    """The file on disk holding a source file (an archive member's archive)."""
+    return path.archive if isinstance(path, ArchiveMember) else path
+
+
+def get_manifest(conn: sqlite3.Connection, file_type: str) -> Dict[str, str]:
+    """filename -> partition location of the partitioned files of a type."""
+    cursor = conn.execute("SELECT filename, location FROM source_manifest WHERE file_type = ?", (file_type,))
+    return dict(cursor.fetchall())
+
+
+def resolve_tracked(directory: Path, filename: str, location: Optional[str]) -> SourcePath:
+    """
+    Source file of a processed_files name: the top-level copy if there is
+    one (a re-upload not yet partitioned), else the manifest location.
+    """
+    top_level = tracked_source(directory, filename)
+    if location is None or top_level.exists():
+        return top_level
+    return tracked_source(directory / location, filename)
+
+
+def record_locations(conn: sqlite3.Connection, file_type: str, directory: Path,
+                     file_paths: Iterable[SourcePath]) -> None:
+    """Record the partition of every listed file that is not in the top level (full rebuilds)."""
+    rows = []
+    for path in file_paths:
+        folder = _disk_file(path).parent
+        if folder != directory:
+            rows.append((path.name, file_type, folder.relative_to(directory).as_posix()))
+    conn.executemany(
+        "INSERT OR REPLACE INTO source_manifest (filename, file_type, location) VALUES (?, ?, ?)", rows
+    )
+
+
+def partition_files(conn: sqlite3.Connection, file_type: str, directory: Path,
+                    file_paths: Iterable[SourcePath]) -> int:
+    """
+    Move the fully processed top-level files of a type into their partition.
+
+    A file moves once processed_files holds it fully parsed with its current
+    size and mtime (an archive: all of its members); files that failed,
+    wait for deep parsing or have no date in their name stay. The manifest
+    is committed before the moves, so an interrupted run leaves at most
+    files that are still in the top level and moved again by the next run.
+
+    Returns:
+        Number of files (archives) moved
+    """
+    groups: Dict[Path, List[SourcePath]] = defaultdict(list)
+    for path in file_paths:
+        if _disk_file(path).parent == directory:
+            groups[_disk_file(path)].append(path)
+    names = [path.name for paths in groups.values() for path in paths]
+    states = get_file_states(conn, file_type, names)
+    pending = set(get_pending_files(conn, file_type))
+
+    moves: List[Tuple[Path, str]] = []
+    rows = []
+    for disk_file, paths in groups.items():
+        if any(path.name not in states or path.name in pending
+               or states[path.name][:2] != stat_state(path)[:2] for path in paths):
+            continue
+        dates = [day for day in (file_date(file_type, path) for path in paths) if day is not None]
+        if not dates:
+            continue
+        location = partition_location(max(dates))
+        moves.append((disk_file, location))
+        rows.extend((path.name, file_type, location) for path in paths)
+
+    conn.executemany(
+        "INSERT OR REPLACE INTO source_manifest (filename, file_type, location) VALUES (?, ?, ?)", rows
+    )
+    conn.commit()
+
+    for disk_file, location in moves:
+        target = directory / location
+        target.mkdir(parents=True, exist_ok=True)
+        # Replaces an older copy under the same name (its rows were replaced too)
+        os.replace(disk_file, target / disk_file.name)
+    return len(moves)
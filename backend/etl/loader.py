@@ -0,0 +1,562 @@
+"""
+Bulk loading layer for the ETL pipeline.
+
+Parsed rows (record tuples, see records) are bulk-inserted with
+executemany() into TEMP staging tables and merged into the main tables with a few set-based statements per
+transaction chunk. The merge matches rows on their natural keys, so loading
+the same data twice (a re-ingested file, or a duplicate upload such as
+..._250614_1.xlsx next to ..._250614.xlsx) never adds a second copy:
+
+- attendance_logs: (work_date, site, partner, worker_name, check_in_time);
+  existing rows of a key are replaced by the newer copy's rows
+- risk_docs: (site, partner, start_date, end_date, doc_index); an existing
+  document's items and confirmations are replaced by the newer version
+- tbm_logs: (work_date, site, partner); an existing log's participants are
+  replaced by the newer version's
+
+Only copies from different files are merged: rows repeated within one file
+(two workers of the same name without a check-in time, a name listed twice
+on a TBM sheet) are all kept, as the file lists them.
+
+A merged row keeps the source file that first loaded it (source_file /
+filename), so a modified file's delete_file_rows() also removes the rows a
+duplicate upload merged into, instead of leaving them behind under the
+duplicate's name next to the file's re-parsed rows.
+
+Site/partner IDs are resolved from in-memory maps that live for the whole
+run instead of a SELECT per file.
+
+Each file is loaded inside its own SAVEPOINT: a failure rolls back the
+file's staged rows without touching the rest of the batch, and commits only
+ever contain complete files with their processed_files marks, so
+processed_files doubles as the resume checkpoint.
+"""
+
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+from .tracking import PARSE_STAGE_FULL, FileState
+
+# Staged rows merged per transaction (flush + commit)
+DEFAULT_CHUNK_SIZE = 5000
+
+# Files per transaction; bounds the work lost on a crash
+DEFAULT_BATCH_FILES = 100
+
+# Per-connection staging tables (NOT NULL constraints mirror the main tables,
+# so invalid rows fail while their file is loaded, not during the merge)
+STAGING_TABLES_SQL = [
+    """
+    CREATE TEMP TABLE IF NOT EXISTS stage_attendance (
+        seq INTEGER NOT NULL,
+        work_date DATE NOT NULL,
+        site_id INTEGER NOT NULL,
+        partner_id INTEGER NOT NULL,
+        worker_name TEXT NOT NULL,
+        role TEXT NOT NULL,
+        birth_date DATE,
+        age INTEGER,
+        is_senior BOOLEAN,
+        check_in_time TIME,
+        check_out_time TIME,
+        has_accident BOOLEAN,
+        source_file TEXT
+    )
+    """,
+    """
+    CREATE TEMP TABLE IF NOT EXISTS stage_risk_docs (
+        seq INTEGER PRIMARY KEY,
+        site_id INTEGER NOT NULL,
+        partner_id INTEGER NOT NULL,
+        start_date DATE NOT NULL,
+        end_date DATE NOT NULL,
+        doc_index INTEGER,
+        risk_type TEXT NOT NULL,
+        action_result_count INTEGER,
+        filename TEXT
+    )
+    """,
+    "CREATE TEMP TABLE IF NOT EXISTS stage_risk_items (seq INTEGER NOT NULL, risk_factor TEXT, measure TEXT)",
+    """
+    CREATE TEMP TABLE IF NOT EXISTS stage_risk_confirmations (
+        seq INTEGER NOT NULL, worker_name TEXT NOT NULL, position TEXT
+    )
+    """,
+    """
+    CREATE TEMP TABLE IF NOT EXISTS stage_tbm (
+        seq INTEGER PRIMARY KEY,
+        work_date DATE NOT NULL,
+        site_id INTEGER NOT NULL,
+        partner_id INTEGER NOT NULL,
+        content TEXT,
+        source_file TEXT
+    )
+    """,
+    "CREATE TEMP TABLE IF NOT EXISTS stage_tbm_participants (seq INTEGER NOT NULL, worker_name TEXT NOT NULL)",
+]
+
+STAGING_TABLES = [
+    "stage_attendance", "stage_risk_docs", "stage_risk_items",
+    "stage_risk_confirmations", "stage_tbm", "stage_tbm_participants",
+]
+
+STAGE_ATTENDANCE_SQL = """
+    INSERT INTO stage_attendance (
+        seq, work_date, site_id, partner_id, worker_name, role,
+        birth_date, age, is_senior, check_in_time, check_out_time, has_accident, source_file
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+STAGE_RISK_DOC_SQL = """
+    INSERT INTO stage_risk_docs (site_id, partner_id, start_date, end_date, doc_index, risk_type, action_result_count, filename)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+STAGE_RISK_ITEM_SQL = "INSERT INTO stage_risk_items (seq, risk_factor, measure) VALUES (?, ?, ?)"
+STAGE_RISK_CONFIRMATION_SQL = "INSERT INTO stage_risk_confirmations (seq, worker_name, position) VALUES (?, ?, ?)"
+STAGE_TBM_SQL = "INSERT INTO stage_tbm (work_date, site_id, partner_id, content, source_file) VALUES (?, ?, ?, ?, ?)"
+STAGE_TBM_PARTICIPANT_SQL = "INSERT INTO stage_tbm_participants (seq, worker_name) VALUES (?, ?)"
+
+INSERT_PROCESSED_FILE_SQL = """
+    INSERT INTO processed_files (filename, file_type, file_size, mtime_ns, content_hash, parse_stage, row_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(filename) DO UPDATE SET
+        file_type = excluded.file_type,
+        file_size = excluded.file_size,
+        mtime_ns = excluded.mtime_ns,
+        content_hash = excluded.content_hash,
+        parse_stage = excluded.parse_stage,
+        row_count = excluded.row_count,
+        processed_at = CURRENT_TIMESTAMP
+"""
+
+# Natural-key join conditions between a main table and its staging table (s)
+ATTENDANCE_KEY = """
+    attendance_logs.work_date = s.work_date AND attendance_logs.site_id = s.site_id
+    AND attendance_logs.partner_id = s.partner_id AND attendance_logs.worker_name = s.worker_name
+    AND attendance_logs.check_in_time IS s.check_in_time
+"""
+RISK_DOC_KEY = """
+    d.site_id = s.site_id AND d.partner_id = s.partner_id AND d.start_date = s.start_date
+    AND d.end_date = s.end_date AND d.doc_index IS s.doc_index
+"""
+TBM_KEY = "d.work_date = s.work_date AND d.site_id = s.site_id AND d.partner_id = s.partner_id"
+
+# Data tables whose merged rows are reported per file type (see BulkLoader.merged_rows)
+MERGED_ROW_TABLES = {
+    "attendance": ("attendance_logs",),
+    "risk": ("risk_items", "risk_confirmations"),
+    "tbm": ("tbm_participants",),
+}
+
+# Set-based merge of the staging tables, as (counted table, statement). Row
+# counts of INSERTs are added to BulkLoader.inserted and of DELETEs to
+# BulkLoader.deleted; statements without a table are not counted.
+MERGE_SQL = [
+    # Attendance: the last staged copy (seq) of a natural key wins, with the
+    # source file of the first; existing rows of the key are replaced by it
+    (None, """
+        UPDATE stage_attendance AS s SET source_file = f.source_file
+        FROM (
+            -- source_file is taken from the MIN(rowid) row of each group
+            SELECT MIN(rowid), work_date, site_id, partner_id, worker_name, check_in_time, source_file
+            FROM stage_attendance
+            GROUP BY work_date, site_id, partner_id, worker_name, check_in_time
+            HAVING COUNT(DISTINCT seq) > 1
+        ) AS f
+        WHERE s.work_date = f.work_date AND s.site_id = f.site_id AND s.partner_id = f.partner_id
+          AND s.worker_name = f.worker_name AND s.check_in_time IS f.check_in_time
+    """),
+    (None, """
+        DELETE FROM stage_attendance WHERE rowid IN (
+            SELECT s.rowid FROM stage_attendance s
+            JOIN (
+                SELECT MAX(seq) AS seq, work_date, site_id, partner_id, worker_name, check_in_time
+                FROM stage_attendance
+                GROUP BY work_date, site_id, partner_id, worker_name, check_in_time
+            ) AS f
+            ON s.work_date = f.work_date AND s.site_id = f.site_id AND s.partner_id = f.partner_id
+               AND s.worker_name = f.worker_name AND s.check_in_time IS f.check_in_time
+            WHERE s.seq != f.seq
+        )
+    """),
+    (None, f"""
+        UPDATE stage_attendance AS s SET source_file = attendance_logs.source_file
+        FROM attendance_logs
+        WHERE {ATTENDANCE_KEY} AND attendance_logs.source_file IS NOT NULL
+    """),
+    ("attendance_logs", f"""
+        DELETE FROM attendance_logs WHERE id IN (
+            SELECT attendance_logs.id FROM stage_attendance s JOIN attendance_logs ON {ATTENDANCE_KEY}
+        )
+    """),
+    ("attendance_logs", """
+        INSERT INTO attendance_logs (
+            work_date, site_id, partner_id, worker_name, role,
+            birth_date, age, is_senior, check_in_time, check_out_time, has_accident, source_file
+        )
+        SELECT work_date, site_id, partner_id, worker_name, role,
+               birth_date, age, is_senior, check_in_time, check_out_time, has_accident, source_file
+        FROM stage_attendance
+        ORDER BY rowid
+    """),
+
+    # Risk documents: the last staged version of a document wins (with the
+    # filename of the first); an existing document keeps its id and gets the
+    # new version's children
+    (None, """
+        UPDATE stage_risk_docs AS s SET filename = f.filename
+        FROM (
+            SELECT MIN(seq), site_id, partner_id, start_date, end_date, doc_index, filename
+            FROM stage_risk_docs
+            GROUP BY site_id, partner_id, start_date, end_date, doc_index
+            HAVING COUNT(*) > 1
+        ) AS f
+        WHERE s.site_id = f.site_id AND s.partner_id = f.partner_id AND s.start_date = f.start_date
+          AND s.end_date = f.end_date AND s.doc_index IS f.doc_index
+    """),
+    (None, """
+        DELETE FROM stage_risk_docs WHERE seq NOT IN (
+            SELECT MAX(seq) FROM stage_risk_docs
+            GROUP BY site_id, partner_id, start_date, end_date, doc_index
+        )
+    """),
+    ("risk_items", f"""
+        DELETE FROM risk_items WHERE doc_id IN (
+            SELECT d.id FROM risk_docs d JOIN stage_risk_docs s ON {RISK_DOC_KEY}
+        )
+    """),
+    ("risk_confirmations", f"""
+        DELETE FROM risk_confirmations WHERE doc_id IN (
+            SELECT d.id FROM risk_docs d JOIN stage_risk_docs s ON {RISK_DOC_KEY}
+        )
+    """),
+    (None, f"""
+        UPDATE risk_docs AS d SET
+            risk_type = s.risk_type, action_result_count = s.action_result_count,
+            filename = COALESCE(d.filename, s.filename)
+        FROM stage_risk_docs s
+        WHERE {RISK_DOC_KEY}
+    """),
+    ("risk_docs", f"""
+        INSERT INTO risk_docs (site_id, partner_id, start_date, end_date, doc_index, risk_type, action_result_count, filename)
+        SELECT site_id, partner_id, start_date, end_date, doc_index, risk_type, action_result_count, filename
+        FROM stage_risk_docs s
+        WHERE NOT EXISTS (SELECT 1 FROM risk_docs d WHERE {RISK_DOC_KEY})
+        ORDER BY s.seq
+    """),
+    ("risk_items", f"""
+        INSERT INTO risk_items (doc_id, risk_factor, measure)
+        SELECT d.id, i.risk_factor, i.measure
+        FROM stage_risk_items i
+        JOIN stage_risk_docs s ON s.seq = i.seq
+        JOIN risk_docs d ON {RISK_DOC_KEY}
+        ORDER BY i.rowid
+    """),
+    ("risk_confirmations", f"""
+        INSERT INTO risk_confirmations (doc_id, worker_name, position)
+        SELECT d.id, c.worker_name, c.position
+        FROM stage_risk_confirmations c
+        JOIN stage_risk_docs s ON s.seq = c.seq
+        JOIN risk_docs d ON {RISK_DOC_KEY}
+        ORDER BY c.rowid
+    """),
+
+    # TBM: the last staged log per natural key wins (with the source file of
+    # the first); an existing log keeps its id and gets its participants
+    (None, """
+        UPDATE stage_tbm AS s SET source_file = f.source_file
+        FROM (
+            SELECT MIN(seq), work_date, site_id, partner_id, source_file
+            FROM stage_tbm
+            GROUP BY work_date, site_id, partner_id
+            HAVING COUNT(*) > 1
+        ) AS f
+        WHERE s.work_date = f.work_date AND s.site_id = f.site_id AND s.partner_id = f.partner_id
+    """),
+    (None, """
+        DELETE FROM stage_tbm WHERE seq NOT IN (
+            SELECT MAX(seq) FROM stage_tbm GROUP BY work_date, site_id, partner_id
+        )
+    """),
+    ("tbm_participants", f"""
+        DELETE FROM tbm_participants WHERE tbm_id IN (
+            SELECT d.id FROM tbm_logs d JOIN stage_tbm s ON {TBM_KEY}
+        )
+    """),
+    (None, f"""
+        UPDATE tbm_logs AS d SET content = s.content, source_file = COALESCE(d.source_file, s.source_file)
+        FROM stage_tbm s
+        WHERE {TBM_KEY}
+    """),
+    ("tbm_logs", f"""
+        INSERT INTO tbm_logs (work_date, site_id, partner_id, content, source_file)
+        SELECT work_date, site_id, partner_id, content, source_file
+        FROM stage_tbm s
+        WHERE NOT EXISTS (SELECT 1 FROM tbm_logs d WHERE {TBM_KEY})
+        ORDER BY s.seq
+    """),
+    ("tbm_participants", f"""
+        INSERT INTO tbm_participants (tbm_id, worker_name)
+        SELECT d.id, p.worker_name
+        FROM stage_tbm_participants p
+        JOIN stage_tbm s ON s.seq = p.seq
+        JOIN tbm_logs d ON {TBM_KEY}
+        ORDER BY p.rowid
+    """),
+]
+
+# Statements removing every row loaded from one source file, children first
+DELETE_FILE_ROWS_SQL = {
+    "attendance": [
+        "DELETE FROM attendance_logs WHERE source_file = ?",
+    ],
+    "risk": [
+        "DELETE FROM risk_items WHERE doc_id IN (SELECT id FROM risk_docs WHERE filename = ?)",
+        "DELETE FROM risk_confirmations WHERE doc_id IN (SELECT id FROM risk_docs WHERE filename = ?)",
+        "DELETE FROM risk_docs WHERE filename = ?",
+    ],
+    "tbm": [
+        "DELETE FROM tbm_participants WHERE tbm_id IN (SELECT id FROM tbm_logs WHERE source_file = ?)",
+        "DELETE FROM tbm_logs WHERE source_file = ?",
+    ],
+}
+
+
+def to_iso(value: Any) -> Any:
+    """Convert date/time values to ISO strings, leaving empty values untouched."""
+    if not value:
+        return value
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+class DimensionCache:
+    """In-memory name -> id map for a master table (sites or partners)."""
+
+    def __init__(self, conn: sqlite3.Connection, table: str):
+        self.conn = conn
+        self.table = table
+        self._ids: Dict[str, int] = {
+            name: row_id
+            for row_id, name in conn.execute(f"SELECT id, name FROM {table}")
+        }
+        self._added: List[str] = []  # names inserted by this cache, in order
+
+    def get_id(self, name: str) -> int:
+        """Get ID for name, inserting a new row on first use."""
+        row_id = self._ids.get(name)
+        if row_id is None:
+            cursor = self.conn.execute(f"INSERT INTO {self.table} (name) VALUES (?)", (name,))
+            row_id = cursor.lastrowid
+            self._ids[name] = row_id
+            self._added.append(name)
+        return row_id
+
+    def checkpoint(self) -> int:
+        """Position to roll back to with rollback()."""
+        return len(self._added)
+
+    def rollback(self, checkpoint: int) -> None:
+        """Forget names inserted after checkpoint (their rows were rolled back)."""
+        for name in self._added[checkpoint:]:
+            del self._ids[name]
+        del self._added[checkpoint:]
+
+
+class BulkLoader:
+    """
+    Stages parsed rows with executemany() and merges them in chunks.
+
+    Per file: begin_file(), add_*/delete_file_rows(), then mark_processed()
+    on success or abort_file() on failure; maybe_flush() between files
+    merges and commits full batches, so chunk boundaries always fall
+    between files. With commit_batches=False full batches are merged but
+    not committed, and the caller commits the whole load at once.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 batch_files: int = DEFAULT_BATCH_FILES, commit_batches: bool = True):
+        self.conn = conn
+        self.chunk_size = chunk_size
+        self.batch_files = batch_files
+        self.commit_batches = commit_batches
+        self.sites = DimensionCache(conn, "sites")
+        self.partners = DimensionCache(conn, "partners")
+        for sql in STAGING_TABLES_SQL:
+            conn.execute(sql)
+        self._pending = 0
+        self._batch_files = 0
+        self._attendance_seq = 0  # staged attendance copies (one per file)
+        # Rows merged into / removed from the main tables, per table (for
+        # rebuild verification)
+        self.inserted: Dict[str, int] = {}
+        self.deleted: Dict[str, int] = {}
+        # Part of deleted: existing rows the merge replaced by a newer copy
+        self.replaced: Dict[str, int] = {}
+        # Rollback point of the file being loaded (see begin_file)
+        self._file_checkpoint: Optional[tuple] = None
+        # Time spent in flush() (reported by run_etl --profile)
+        self.flush_seconds = 0.0
+
+    def _stage(self, sql: str, rows: List[tuple]) -> None:
+        if rows:
+            self.conn.executemany(sql, rows)
+            self._pending += len(rows)
+
+    @staticmethod
+    def _count(counts: Dict[str, int], table: str, rowcount: int) -> None:
+        counts[table] = counts.get(table, 0) + rowcount
+
+    def merged_rows(self, file_type: str) -> int:
+        """Data rows of a file type the merge has added so far (replacements of existing rows not counted)."""
+        return sum(self.inserted.get(table, 0) - self.replaced.get(table, 0)
+                   for table in MERGED_ROW_TABLES[file_type])
+
+    def maybe_flush(self) -> None:
+        """Merge (and commit, see commit_batches) once the batch is full (call between files)."""
+        if self._pending >= self.chunk_size or self._batch_files >= self.batch_files:
+            self.flush(commit=self.commit_batches)
+            self._batch_files = 0
+
+    def begin_file(self) -> None:
+        """Start loading one file; its changes are undone by abort_file()."""
+        if not self.conn.in_transaction:
+            # Open the batch transaction first, so releasing the file's
+            # savepoint does not commit
+            self.conn.execute("BEGIN")
+        self.conn.execute("SAVEPOINT etl_file")
+        self._file_checkpoint = (
+            self._pending,
+            dict(self.deleted),
+            self.sites.checkpoint(),
+            self.partners.checkpoint(),
+        )
+
+    def abort_file(self) -> None:
+        """Roll back everything written or staged since begin_file()."""
+        if self._file_checkpoint is None:
+            return
+        pending, deleted, sites, partners = self._file_checkpoint
+        self._file_checkpoint = None
+
+        # The staging tables are TEMP tables in the same transaction, so this
+        # drops the file's staged rows as well
+        self.conn.execute("ROLLBACK TO etl_file")
+        self.conn.execute("RELEASE etl_file")
+        self._pending = pending
+        self.deleted = deleted
+        self.sites.rollback(sites)
+        self.partners.rollback(partners)
+
+    def _dimension_ids(self, meta: Dict[str, Any], site_fallback: Optional[str]) -> tuple:
+        site_name = meta.get("site_name") or site_fallback
+        partner_name = meta.get("partner_name", "Unknown")
+        return self.sites.get_id(site_name), self.partners.get_id(partner_name)
+
+    def add_attendance(self, parsed_data: Dict[str, Any]) -> int:
+        """Stage attendance records. Returns number of records."""
+        meta = parsed_data["metadata"]
+        records = parsed_data["records"]
+
+        if not records:
+            return 0
+
+        site_id, partner_id = self._dimension_ids(meta, meta.get("raw_site_project", "Unknown"))
+        self._attendance_seq += 1
+        file_columns = (self._attendance_seq, to_iso(meta.get("work_date")), site_id, partner_id)
+        source_file = (parsed_data.get("filename"),)
+
+        # AttendanceRecord fields are the staging columns between these
+        self._stage(STAGE_ATTENDANCE_SQL, [file_columns + record + source_file for record in records])
+        return len(records)
+
+    def add_risk(self, parsed_data: Dict[str, Any]) -> Dict[str, int]:
+        """Stage a risk document with its items and confirmations."""
+        meta = parsed_data["metadata"]
+        records = parsed_data["records"]
+        confirmations = parsed_data.get("confirmations", [])
+        action_results = parsed_data.get("action_results", [])
+        filename = parsed_data.get("filename", "")
+
+        site_id, partner_id = self._dimension_ids(meta, "Unknown")
+
+        cursor = self.conn.execute(STAGE_RISK_DOC_SQL, (
+            site_id,
+            partner_id,
+            to_iso(meta.get("start_date")),
+            to_iso(meta.get("end_date")),
+            meta.get("doc_index", 0),
+            meta.get("risk_type", "최초"),
+            len(action_results),  # 조치이행결과 수
+            filename
+        ))
+        seq = cursor.lastrowid
+        self._pending += 1
+
+        key = (seq,)
+        self._stage(STAGE_RISK_ITEM_SQL, [key + record for record in records])
+        self._stage(STAGE_RISK_CONFIRMATION_SQL, [key + confirm for confirm in confirmations])
+        return {"items": len(records), "confirmations": len(confirmations)}
+
+    def add_tbm(self, parsed_data: Dict[str, Any]) -> int:
+        """Stage a TBM log and its participants. Returns participant count."""
+        meta = parsed_data["metadata"]
+        records = parsed_data["records"]
+
+        site_id, partner_id = self._dimension_ids(meta, meta.get("raw_site_project", "Unknown"))
+
+        cursor = self.conn.execute(STAGE_TBM_SQL, (
+            to_iso(meta.get("work_date")),
+            site_id,
+            partner_id,
+            meta.get("content", ""),
+            parsed_data.get("filename")
+        ))
+        seq = cursor.lastrowid
+        self._pending += 1
+
+        key = (seq,)
+        self._stage(STAGE_TBM_PARTICIPANT_SQL, [key + record for record in records])
+        return len(records)
+
+    def delete_file_rows(self, file_type: str, filename: str) -> None:
+        """
+        Delete rows previously loaded from a file before loading its new version.
+
+        Runs in the current transaction, which is committed only together with
+        the file's new rows and processed_files mark.
+        """
+        for sql in DELETE_FILE_ROWS_SQL[file_type]:
+            cursor = self.conn.execute(sql, (filename,))
+            self._count(self.deleted, sql.split()[2], cursor.rowcount)
+
+    def mark_processed(self, filename: str, file_type: str, state: Optional[FileState] = None,
+                       stage: str = PARSE_STAGE_FULL, row_count: Optional[int] = None) -> None:
+        """Record a processed_files mark (committed with the file's rows) and end the file."""
+        state = state or FileState(None, None, None)
+        self.conn.execute(INSERT_PROCESSED_FILE_SQL, (filename, file_type, *state, stage, row_count))
+        if self._file_checkpoint is not None:
+            self._file_checkpoint = None
+            self.conn.execute("RELEASE etl_file")
+        self._batch_files += 1
+
+    def flush(self, commit: bool = True) -> None:
+        """Merge the staged rows into the main tables and optionally commit."""
+        started = time.perf_counter()
+        if self._pending:
+            cursor = self.conn.cursor()
+            for table, sql in MERGE_SQL:
+                cursor.execute(sql)
+                if table is None:
+                    continue
+                if sql.lstrip().startswith("INSERT"):
+                    self._count(self.inserted, table, cursor.rowcount)
+                else:
+                    self._count(self.deleted, table, cursor.rowcount)
+                    self._count(self.replaced, table, cursor.rowcount)
+            for table in STAGING_TABLES:
+                cursor.execute(f"DELETE FROM {table}")
+        self._pending = 0
+        if commit:
+            self._batch_files = 0
+            self.conn.commit()
+        self.flush_seconds += time.perf_counter() - started
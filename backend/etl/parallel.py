@@ -0,0 +1,172 @@
+"""
+Process-pool parsing for the ETL pipeline.
+
+Workbooks are parsed in worker processes while the main process stays the
+single SQLite writer. Parsed results come back through a bounded FIFO window
+of pending futures, so at most `queue_size` parsed files are held in memory
+and results are handed to the writer in the same order as the input files.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+from backend.config import LAYOUT_TEMPLATES_PATH
+
+from .base_parser import DEFAULT_ENGINE
+from .parse_cache import ParseCache
+from .attendance_parser import AttendanceParser
+from .risk_parser import RiskAssessmentParser
+from .tbm_parser import TbmParser
+
+# file_type -> parser class (file_type matches processed_files.file_type)
+PARSERS = {
+    "attendance": AttendanceParser,
+    "risk": RiskAssessmentParser,
+    "tbm": TbmParser,
+}
+
+ParseResult = Tuple[Path, Optional[Dict[str, Any]], Optional[Exception]]
+
+# Upper bound of parser processes per run (one per CPU)
+MAX_WORKERS = os.cpu_count() or 1
+
+
+def clamp_workers(workers: int) -> int:
+    """Parser process count limited to 1..MAX_WORKERS."""
+    return max(1, min(workers, MAX_WORKERS))
+
+
+def parser_versions() -> Dict[str, int]:
+    """Current PARSER_VERSION per file type."""
+    return {file_type: parser.PARSER_VERSION for file_type, parser in PARSERS.items()}
+
+
+def parse_file(file_type: str, file_path: Path, engine: str = DEFAULT_ENGINE,
+               cache: Optional[ParseCache] = None, content_hash: Optional[str] = None,
+               profile: bool = False, templates_path: Path = LAYOUT_TEMPLATES_PATH) -> Dict[str, Any]:
+    """
+    Parse a single file with the parser registered for file_type.
+
+    With a cache and content hash, a cached result is returned without
+    opening the workbook, and fresh results are stored for the next run.
+    With profile=True the result carries a "profile" entry (stage timings,
+    cell reads); it is never written to the cache.
+    """
+    parser_cls = PARSERS[file_type]
+    use_cache = cache is not None and content_hash is not None
+    started = time.perf_counter()
+
+    if use_cache:
+        cached = cache.get(file_type, parser_cls.PARSER_VERSION, file_path.name, content_hash)
+        if cached is not None:
+            if profile:
+                elapsed = time.perf_counter() - started
+                cached["profile"] = {"stages": {"cache_load": elapsed}, "cell_reads": 0,
+                                     "cached": True, "total": elapsed}
+            return cached
+
+    parser = parser_cls(str(file_path), engine=engine, profile=profile, templates_path=templates_path)
+    parsed = parser.run()
+
+    if use_cache:
+        cache.put(file_type, parser_cls.PARSER_VERSION, file_path.name, content_hash, parsed)
+    if profile:
+        parsed["profile"] = {**parser.profiler.to_dict(), "total": time.perf_counter() - started}
+    return parsed
+
+
+def parse_metadata(file_type: str, file_path: Path) -> Dict[str, Any]:
+    """First-tier parse of a single file (see BaseExcelParser.run_metadata)."""
+    return PARSERS[file_type](str(file_path)).run_metadata()
+
+
+def iter_metadata_files(file_type: str, file_paths: Iterable[Path]) -> Iterator[ParseResult]:
+    """
+    First-tier parse files inline and yield (file_path, parsed, error) in input order.
+
+    This reads no cell values, so it is not worth a process pool.
+    """
+    for file_path in file_paths:
+        try:
+            yield file_path, parse_metadata(file_type, file_path), None
+        except Exception as e:
+            yield file_path, None, e
+
+
+def iter_parsed_files(
+    file_type: str,
+    file_paths: Iterable[Path],
+    workers: int = 1,
+    queue_size: Optional[int] = None,
+    engine: str = DEFAULT_ENGINE,
+    cache: Optional[ParseCache] = None,
+    content_hashes: Optional[Dict[str, str]] = None,
+    profile: bool = False,
+    executor: Optional[Executor] = None,
+    templates_path: Path = LAYOUT_TEMPLATES_PATH
+) -> Iterator[ParseResult]:
+    """
+    Parse files and yield (file_path, parsed, error) in input order.
+
+    Args:
+        file_type: 'attendance', 'risk' or 'tbm'
+        file_paths: Files to parse
+        workers: Number of parser processes (1 = parse inline, no pool)
+        queue_size: Max parsed-but-not-yet-consumed files (default: workers * 4)
+        engine: Workbook reader engine ('openpyxl' or 'stream')
+        cache: Parse-result cache (looked up in the worker processes)
+        content_hashes: filename -> content hash, required for cache lookups
+        profile: Attach per-file stage timings to each result
+        executor: Long-lived process pool to parse in (e.g. the API's upload
+                  pool); it is left running. By default a pool of `workers`
+                  processes is created for this call.
+        templates_path: Layout template registry the parsers read
+
+    Exactly one of parsed/error is set for every yielded file, so the caller
+    can keep its per-file error handling.
+    """
+    content_hashes = content_hashes or {}
+
+    if executor is None and workers <= 1:
+        for file_path in file_paths:
+            try:
+                content_hash = content_hashes.get(file_path.name)
+                parsed = parse_file(file_type, file_path, engine, cache, content_hash, profile, templates_path)
+                yield file_path, parsed, None
+            except Exception as e:
+                yield file_path, None, e
+        return
+
+    queue_size = queue_size or workers * 4
+    pending: Deque[Tuple[Path, Future]] = deque()
+
+    def pop_result() -> ParseResult:
+        file_path, future = pending.popleft()
+        try:
+            return file_path, future.result(), None
+        except Exception as e:
+            return file_path, None, e
+
+    def submit_all(pool: Executor) -> Iterator[ParseResult]:
+        for file_path in file_paths:
+            content_hash = content_hashes.get(file_path.name)
+            future = pool.submit(parse_file, file_type, file_path, engine, cache, content_hash, profile,
+                                 templates_path)
+            pending.append((file_path, future))
+            # Bounded queue: block on the oldest result before submitting more
+            if len(pending) >= queue_size:
+                yield pop_result()
+
+        while pending:
+            yield pop_result()
+
+    if executor is not None:
+        yield from submit_all(executor)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from submit_all(pool)
@@ -0,0 +1,116 @@
+"""
+Persistent cache of parser output.
+
+Parsed results are stored as zlib-compressed pickles keyed by parser
+version, filename and content hash:
+
+    PARSE_CACHE_DIR/<file_type>/v<PARSER_VERSION>/<key[:2]>/<key>.pkl.z
+
+The filename is part of the key because parse_filename() metadata (site,
+partner, dates) and values derived from it (e.g. worker age) are part of
+the output. Bumping a parser's PARSER_VERSION therefore invalidates only
+that parser's entries, and prune() removes the stale version directories.
+
+Entries of files that were modified, renamed or deleted are never read
+again, so the cache is also bounded in size: a hit touches the entry's
+mtime, and evict() removes the least recently used entries once the cache
+exceeds PARSE_CACHE_MAX_BYTES. run_full_etl calls both before loading.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import PARSE_CACHE_DIR, PARSE_CACHE_MAX_BYTES
+
+COMPRESSION_LEVEL = 6
+ENTRY_SUFFIX = ".pkl.z"
+
+
+class ParseCache:
+    """On-disk cache of parser.run() results (safe to share across processes)."""
+
+    def __init__(self, root: Path = PARSE_CACHE_DIR, max_bytes: int = PARSE_CACHE_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def _path(self, file_type: str, version: int, filename: str, content_hash: str) -> Path:
+        key = hashlib.blake2b(f"{filename}\0{content_hash}".encode("utf-8"), digest_size=20).hexdigest()
+        return self.root / file_type / f"v{version}" / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, file_type: str, version: int, filename: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result, or None on a miss or unreadable entry."""
+        path = self._path(file_type, version, filename, content_hash)
+        try:
+            with open(path, "rb") as f:
+                parsed = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry: treat as a miss, it will be rewritten
+            return None
+        try:
+            os.utime(path)  # recently used (see evict)
+        except OSError:
+            pass
+        return parsed
+
+    def put(self, file_type: str, version: int, filename: str, content_hash: str,
+            parsed: Dict[str, Any]) -> None:
+        """Store a result atomically (write to a temp file, then rename)."""
+        path = self._path(file_type, version, filename, content_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = zlib.compress(pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL), COMPRESSION_LEVEL)
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def prune(self, versions: Dict[str, int]) -> int:
+        """Remove entries of parser versions other than the current ones. Returns dirs removed."""
+        removed = 0
+        for file_type, version in versions.items():
+            type_dir = self.root / file_type
+            if not type_dir.is_dir():
+                continue
+            for version_dir in type_dir.iterdir():
+                if version_dir.is_dir() and version_dir.name != f"v{version}":
+                    shutil.rmtree(version_dir, ignore_errors=True)
+                    removed += 1
+        return removed
+
+    def evict(self) -> int:
+        """Remove the least recently used entries until the cache fits in max_bytes. Returns entries removed."""
+        entries: List[Tuple[float, int, str]] = []
+        for dirpath, _dirnames, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith(ENTRY_SUFFIX):
+                    continue  # a put() in progress
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _mtime, size, _path in entries)
+        removed = 0
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,138 @@
+"""
+Opt-in ETL instrumentation (run_etl --profile).
+
+Parsers record exclusive wall time per stage (workbook load, grid read,
+header discovery, row extraction, ...) and the number of cell reads. The
+run collects those per-file profiles together with writer-side timings
+(change detection, inserts, SQLite flushes) and reports stage totals per
+file type plus the slowest files, as a table and as JSON.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class StageProfiler:
+    """Accumulates exclusive time per stage; nested stages are not double-counted."""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.cell_reads = 0
+        self._stack: List[List[Any]] = []  # [stage name, start, time spent in children]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        entry = [name, time.perf_counter(), 0.0]
+        self._stack.append(entry)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - entry[1]
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed - entry[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"stages": dict(self.stages), "cell_reads": self.cell_reads}
+
+
+def profiled(stage: str) -> Callable:
+    """Time a parser method as `stage` when the parser has a profiler attached."""
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if profiler is None:
+                return method(self, *args, **kwargs)
+            with profiler.stage(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class EtlProfile:
+    """Run-level collector of per-file parser profiles and writer timings."""
+
+    def __init__(self, top_n: int = 10):
+        self.top_n = top_n
+        self.types: Dict[str, Dict[str, Any]] = {}
+        self.run_stages: Dict[str, float] = {}
+        self.started = time.perf_counter()
+
+    def _type(self, file_type: str) -> Dict[str, Any]:
+        if file_type not in self.types:
+            self.types[file_type] = {"files": 0, "cached": 0, "cell_reads": 0, "stages": {}, "file_times": []}
+        return self.types[file_type]
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        """Record writer-side/run-level time (e.g. change detection, flush)."""
+        self.run_stages[name] = self.run_stages.get(name, 0.0) + seconds
+
+    def add_file(self, file_type: str, filename: str, file_profile: Optional[Dict[str, Any]],
+                 insert_seconds: float) -> None:
+        """Record one loaded file's parse profile and its insert time."""
+        entry = self._type(file_type)
+        file_profile = file_profile or {"stages": {}, "cell_reads": 0}
+        stages = dict(file_profile["stages"])
+        stages["insert"] = insert_seconds
+
+        entry["files"] += 1
+        entry["cached"] += 1 if file_profile.get("cached") else 0
+        entry["cell_reads"] += file_profile["cell_reads"]
+        for name, seconds in stages.items():
+            entry["stages"][name] = entry["stages"].get(name, 0.0) + seconds
+        entry["file_times"].append({
+            "filename": filename,
+            "seconds": file_profile.get("total", 0.0) + insert_seconds,
+            "cell_reads": file_profile["cell_reads"],
+            "stages": stages,
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        report = {
+            "total_seconds": time.perf_counter() - self.started,
+            "run_stages": dict(self.run_stages),
+            "types": {},
+        }
+        for file_type, entry in self.types.items():
+            slowest = sorted(entry["file_times"], key=lambda f: f["seconds"], reverse=True)[:self.top_n]
+            report["types"][file_type] = {
+                "files": entry["files"],
+                "cached": entry["cached"],
+                "cell_reads": entry["cell_reads"],
+                "stages": dict(entry["stages"]),
+                "slowest": slowest,
+            }
+        return report
+
+    def format_table(self) -> str:
+        """Human-readable summary: stage totals per type and the slowest files."""
+        report = self.to_dict()
+        lines = ["=" * 72, "ETL PROFILE", "=" * 72]
+
+        for file_type, entry in report["types"].items():
+            total = sum(entry["stages"].values()) or 1e-9
+            lines.append(f"\n[{file_type}] {entry['files']} files ({entry['cached']} from cache), "
+                         f"{entry['cell_reads']} cell reads")
+            lines.append(f"  {'Stage':<24}{'Total s':>10}{'ms/file':>10}{'Share':>8}")
+            for name, seconds in sorted(entry["stages"].items(), key=lambda s: s[1], reverse=True):
+                per_file = seconds / max(entry["files"], 1) * 1000
+                lines.append(f"  {name:<24}{seconds:>10.3f}{per_file:>10.2f}{seconds / total:>8.1%}")
+            lines.append(f"  Slowest {len(entry['slowest'])} files:")
+            for item in entry["slowest"]:
+                lines.append(f"    {item['seconds'] * 1000:>8.1f} ms {item['cell_reads']:>8} reads  {item['filename']}")
+
+        if report["run_stages"]:
+            lines.append("\n[run]")
+            for name, seconds in sorted(report["run_stages"].items(), key=lambda s: s[1], reverse=True):
+                lines.append(f"  {name:<24}{seconds:>10.3f}")
+        lines.append(f"\nTotal wall time: {report['total_seconds']:.3f}s")
+        return "\n".join(lines)
+
+    def write_json(self, path: Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
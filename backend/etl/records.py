@@ -0,0 +1,42 @@
+"""
+Record types of parsed rows.
+
+Parsers return their rows as these NamedTuples instead of one dict per row:
+a tuple has no per-row key strings or hash table, so a parsed file takes
+less memory and a smaller pickle (worker-to-writer IPC and the parse
+cache). Values are already in their database form (ISO strings for dates
+and times, computed in the parser processes), and the fields are in the
+column order of the matching staging table, so BulkLoader binds a record
+positionally behind the file-level columns without unpacking it.
+"""
+
+from typing import NamedTuple, Optional
+
+
+class AttendanceRecord(NamedTuple):
+    """One worker row of an attendance sheet (stage_attendance columns)."""
+    worker_name: str
+    role: str  # '관리자' or '근로자'
+    birth_date: Optional[str]  # ISO date
+    age: Optional[int]
+    is_senior: bool  # 65세 이상
+    check_in_time: Optional[str]  # ISO time
+    check_out_time: Optional[str]  # ISO time
+    has_accident: bool
+
+
+class RiskItem(NamedTuple):
+    """A risk factor with its improvement measure (stage_risk_items columns)."""
+    risk_factor: str
+    measure: str  # 개선대책
+
+
+class RiskConfirmation(NamedTuple):
+    """A worker's confirmation of a risk assessment (stage_risk_confirmations columns)."""
+    worker_name: str
+    position: Optional[str]  # 직종
+
+
+class TbmParticipant(NamedTuple):
+    """A TBM participant (stage_tbm_participants columns)."""
+    worker_name: str
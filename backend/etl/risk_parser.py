@@ -9,25 +9,121 @@ Two types of risk assessments:
 """
 
 import re
+from bisect import bisect_left
 from datetime import date
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .base_parser import BaseExcelParser
+from .profiling import profiled
+from .records import RiskConfirmation, RiskItem
+from .templates import Signature, row_signature
 from .utils import (
     parse_yymmdd,
     normalize_text,
-    clean_cell_value
+    clean_cell_value,
+    strip_upload_counter
 )
 
 
+# Section markers that end the risk item table (checked in columns 1-9)
+DATA_END_MARKERS = ["추가", "조치", "위험성평가", "아차사고"]
+
+
+class RiskSectionIndex:
+    """
+    Positions of the section markers and labels of a risk assessment sheet.
+
+    Built in one pass over the cell grid so every extraction step is a
+    lookup instead of its own sheet scan. Each field keeps the search window
+    of the scan it replaces (e.g. the NO header within rows 1-14, columns
+    1-4); row-major order means "first match" is the same cell as before.
+
+    With header (the HEADER_FIELDS of a known layout template) the header
+    fields are taken from it instead of being searched for.
+    """
+
+    HEADER_FIELDS = ("no_header_row", "risk_factor_col", "measure_col")
+
+    def __init__(self, grid: List[tuple], header: Optional[Dict[str, Any]] = None):
+        self.grid = grid
+        self.no_header_row: Optional[int] = None       # "NO"/"번호" header (rows 1-14, cols 1-4)
+        self.risk_factor_col: Optional[int] = None     # "위험요인" (rows 1-9, cols 1-19)
+        self.measure_col: Optional[int] = None         # "개선대책" (rows 1-9, cols 1-49)
+        self.end_marker_rows: List[int] = []           # DATA_END_MARKERS in cols 1-9
+        self.action_header_row: Optional[int] = None   # "조치결과 ... 이행" in col 1
+        self.confirm_header_row: Optional[int] = None  # "위험성평가 ... 확인" in col 1
+        self.action_label_cells: List[tuple] = []      # (row, col) of "N번 조치결과", cols 1-49
+        self.registration_cells: List[tuple] = []      # (row, col, value) containing "등록일", cols 1-49
+        self.header_cells: List[tuple] = []            # (row, col, text) the header fields were found from
+
+        self._find_header = header is None
+        if header is not None:
+            for field in self.HEADER_FIELDS:
+                setattr(self, field, header[field])
+
+        for row, values in enumerate(grid, 1):
+            is_end_marker = False
+            for col, value in enumerate(values[:49], 1):
+                if not value or not isinstance(value, str):
+                    continue
+                self._index_cell(row, col, value)
+                if col < 10 and not is_end_marker:
+                    text = value.replace(" ", "").strip()
+                    is_end_marker = any(marker in text for marker in DATA_END_MARKERS)
+            if is_end_marker:
+                self.end_marker_rows.append(row)
+
+    def header(self) -> Dict[str, Any]:
+        """Header field positions (the cacheable part of the index)."""
+        return {field: getattr(self, field) for field in self.HEADER_FIELDS}
+
+    def _index_cell(self, row: int, col: int, value: str) -> None:
+        if row < 15 and self._find_header:
+            self._index_header_cell(row, col, value)
+
+        if col == 1:
+            text = value.replace(" ", "")
+            if self.action_header_row is None and "조치결과" in text and "이행" in text:
+                self.action_header_row = row
+            if self.confirm_header_row is None and "위험성평가" in value and "확인" in value:
+                self.confirm_header_row = row
+
+        if "조치결과" in value and "번" in value:
+            self.action_label_cells.append((row, col))
+        if "등록일" in value:
+            self.registration_cells.append((row, col, value))
+
+    def _index_header_cell(self, row: int, col: int, value: str) -> None:
+        if col < 5 and self.no_header_row is None:
+            text = value.strip().upper().replace("\n", "").replace(" ", "")
+            if text in ("NO", "NO.", "번호"):
+                self.no_header_row = row
+                self.header_cells.append((row, col, value.strip()))
+
+        if row < 10:
+            text = value.strip()
+            if col < 20 and self.risk_factor_col is None and ("위험요인" in text or "위험 요인" in text):
+                self.risk_factor_col = col
+                self.header_cells.append((row, col, text))
+            if self.measure_col is None and ("개선대책" in text or "개선 대책" in text):
+                self.measure_col = col
+                self.header_cells.append((row, col, text))
+
+
 class RiskAssessmentParser(BaseExcelParser):
     """Parser for risk assessment Excel files."""
 
+    PARSER_VERSION = 5  # 2: duplicate-upload counter stripped from file names
+                        # 3: rows as record NamedTuples (see records)
+                        # 4: header row and columns located by label (layout templates)
+                        # 5: layout templates per parser version; signature covers the label columns
+    FILE_TYPE = "risk"
     SHEET_NAME = "위험성"  # Will match both 최초 and 수시
     METADATA_ROWS = 6
     DATA_START_ROW = 7
 
+    @profiled("parse_filename")
     def parse_filename(self) -> Dict[str, Any]:
         """
         Parse filename to extract metadata.
@@ -38,8 +134,8 @@ class RiskAssessmentParser(BaseExcelParser):
         # Remove the prefix
         name = basename.replace("위험성평가_", "")
 
-        # Split by underscore
-        parts = name.split("_")
+        # Split by underscore (ignoring a duplicate-upload counter)
+        parts = strip_upload_counter(name.split("_"), fixed_tail=1)
 
         # Extract from end: index, end_date, start_date
         doc_index = 0
@@ -86,69 +182,69 @@ class RiskAssessmentParser(BaseExcelParser):
             return "정기"
         return "최초"
 
+    def sheet_name_metadata(self) -> Dict[str, Any]:
+        """Document type (최초/수시/정기), from the sheet name."""
+        return {"risk_type": self._determine_risk_type()}
+
+    @profiled("metadata")
     def extract_metadata(self) -> Dict[str, Any]:
         """Extract metadata from header rows."""
-        risk_type = self._determine_risk_type()
-        return {"risk_type": risk_type}
+        return self.sheet_name_metadata()
+
+    @profiled("header_discovery")
+    def _build_section_index(self, header: Optional[Dict[str, Any]] = None) -> "RiskSectionIndex":
+        """Index section markers and labels in a single pass over the grid."""
+        return RiskSectionIndex(self.grid, header)
+
+    def discover_layout(self) -> Dict[str, Any]:
+        # Full index including the header search; kept for this worksheet
+        self._section_index = self._build_section_index()
+        return self._section_index.header()
+
+    def layout_signature(self, layout: Dict[str, Any]) -> Signature:
+        # The item table header row ("N O", 위험요인, 개선대책 labels), plus the
+        # label cells the columns were found from (rows 1-9, not always that row)
+        if not layout["no_header_row"]:
+            return ()
+        signature = row_signature(self.grid, layout["no_header_row"])
+        return signature + tuple(cell for cell in self._section_index.header_cells if cell not in signature)
+
+    @property
+    def section_index(self) -> "RiskSectionIndex":
+        """Section index of the current worksheet (built on first use)."""
+        index = getattr(self, "_section_index", None)
+        if index is None or index.grid is not self.grid:
+            # Header positions come from a matching template, or from the
+            # full index built by discover_layout()
+            header = self.layout
+            index = getattr(self, "_section_index", None)
+            if index is None or index.grid is not self.grid:
+                index = self._section_index = self._build_section_index(header)
+        return index
 
     def _find_data_rows(self) -> tuple:
         """Find the start and end of data section."""
-        start_row = None
-        end_row = None
-
-        # Find header row with "NO" or similar (handle "N O" with space)
-        for row in range(1, min(15, self.worksheet.max_row + 1)):
-            for col in range(1, min(5, self.worksheet.max_column + 1)):
-                value = self.get_cell_value(row, col)
-                if value and isinstance(value, str):
-                    text = value.strip().upper().replace("\n", "").replace(" ", "")
-                    if text in ("NO", "NO.", "번호"):
-                        start_row = row + 1
-                        break
-            if start_row:
-                break
-
-        if not start_row:
-            start_row = self.DATA_START_ROW
+        index = self.section_index
 
-        # Find end of data (before 추가 위험 요인, 조치 결과, 아차사고 section)
-        end_row = self.worksheet.max_row
-        for row in range(start_row, self.worksheet.max_row + 1):
-            # Check first few columns for section markers
-            for col in range(1, min(10, self.worksheet.max_column + 1)):
-                val = self.get_cell_value(row, col)
-                if val and isinstance(val, str):
-                    text = val.replace(" ", "").strip()
-                    # 데이터 영역 종료 마커들
-                    if any(marker in text for marker in ["추가", "조치", "위험성평가", "아차사고"]):
-                        end_row = row - 1
-                        return start_row, end_row
+        # Header row with "NO" or similar (handle "N O" with space)
+        start_row = index.no_header_row + 1 if index.no_header_row else self.DATA_START_ROW
 
-        return start_row, end_row
+        # End of data (before 추가 위험 요인, 조치 결과, 아차사고 section)
+        pos = bisect_left(index.end_marker_rows, start_row)
+        if pos < len(index.end_marker_rows):
+            return start_row, index.end_marker_rows[pos] - 1
+        return start_row, self.max_row
 
     def _find_risk_factor_column(self) -> int:
         """Find the column containing risk factors."""
-        for row in range(1, min(10, self.worksheet.max_row + 1)):
-            for col in range(1, min(20, self.worksheet.max_column + 1)):
-                value = self.get_cell_value(row, col)
-                if value and isinstance(value, str):
-                    text = value.strip()
-                    if "위험요인" in text or "위험 요인" in text:
-                        return col
-        return 8  # Default for 수시
+        return self.section_index.risk_factor_col or 8  # Default for 수시
 
     def _find_measure_column(self) -> int:
         """Find the column containing improvement measures (개선대책)."""
-        for row in range(1, min(10, self.worksheet.max_row + 1)):
-            for col in range(1, min(50, self.worksheet.max_column + 1)):
-                value = self.get_cell_value(row, col)
-                if value and isinstance(value, str):
-                    text = value.strip()
-                    if "개선대책" in text or "개선 대책" in text:
-                        return col
-        return 25  # Default for 수시 type
-
-    def extract_data_rows(self) -> List[Dict[str, Any]]:
+        return self.section_index.measure_col or 25  # Default for 수시 type
+
+    @profiled("row_extraction")
+    def extract_data_rows(self) -> List[RiskItem]:
         """Extract risk assessment items from the worksheet."""
         records = []
 
@@ -173,13 +269,11 @@ class RiskAssessmentParser(BaseExcelParser):
 
             # 위험요인과 개선대책 둘 다 있는 행만 유효한 레코드로 포함
             if risk_factor and measure:
-                records.append({
-                    "risk_factor": risk_factor,
-                    "measure": measure  # 개선대책
-                })
+                records.append(RiskItem(risk_factor, measure))
 
         return records
 
+    @profiled("action_results")
     def extract_action_results(self) -> List[Dict[str, Any]]:
         """Extract action results from 조치결과 section (수시/정기 only).
 
@@ -194,44 +288,39 @@ class RiskAssessmentParser(BaseExcelParser):
         if risk_type == "최초":
             return action_results
 
-        # Find "조치결과" or "이행확인" section header (위치는 가변적)
-        action_section_row = None
-        for row in range(1, self.worksheet.max_row + 1):
-            val = self.get_cell_value(row, 1)
-            if val and isinstance(val, str):
-                text = val.replace(" ", "")
-                if "조치결과" in text and "이행" in text:
-                    action_section_row = row
-                    break
+        index = self.section_index
 
+        # "조치결과"/"이행확인" section header (위치는 가변적)
+        action_section_row = index.action_header_row
         if not action_section_row:
             return action_results
 
-        # Find rows with "N번 조치결과" labels and count actual data
-        for row in range(action_section_row, min(action_section_row + 10, self.worksheet.max_row + 1)):
-            # Check all columns for action result labels
-            for col in range(1, 50):
-                val = self.get_cell_value(row, col)
-                if val and isinstance(val, str) and "조치결과" in val and "번" in val:
-                    # This cell has action result labels (e.g., "1번 조치결과" or "1번 조치결과\n2번 조치결과")
-                    # Check next rows for actual data entries
-                    for data_row in range(row + 1, min(row + 10, self.worksheet.max_row + 1)):
-                        # Scan all columns for actual data (등록일, 내용 등)
-                        for data_col in range(1, 50):
-                            data_val = self.get_cell_value(data_row, data_col)
-                            if data_val and isinstance(data_val, str):
-                                # 등록일이 포함된 데이터만 조치결과로 카운트
-                                if "등록일" in data_val:
-                                    action_results.append({
-                                        "row": data_row,
-                                        "col": data_col,
-                                        "content": clean_cell_value(data_val)
-                                    })
-                    return action_results  # Found action section, return results
+        # First "N번 조치결과" label cell within 10 rows of the header
+        # (a single cell may hold several labels, e.g. "1번 조치결과\n2번 조치결과")
+        label_row = None
+        for row, _col in index.action_label_cells:
+            if row >= action_section_row:
+                if row < action_section_row + 10:
+                    label_row = row
+                break
+        if label_row is None:
+            return action_results
+
+        # 등록일이 포함된 데이터만 조치결과로 카운트 (label 아래 9행 이내)
+        for row, col, value in index.registration_cells:
+            if label_row < row < label_row + 10:
+                action_results.append({
+                    "row": row,
+                    "col": col,
+                    "content": clean_cell_value(value)
+                })
+            elif row >= label_row + 10:
+                break
 
         return action_results
 
-    def extract_confirmations(self) -> List[Dict[str, Any]]:
+    @profiled("confirmations")
+    def extract_confirmations(self) -> List[RiskConfirmation]:
         """Extract worker confirmations (only for 수시 type)."""
         confirmations = []
 
@@ -239,15 +328,10 @@ class RiskAssessmentParser(BaseExcelParser):
             return confirmations
 
         # Find "위험성평가 근로자 확인" section
-        confirm_start = None
-        for row in range(1, self.worksheet.max_row + 1):
-            val = self.get_cell_value(row, 1)
-            if val and isinstance(val, str) and "위험성평가" in val and "확인" in val:
-                confirm_start = row + 1  # Skip header row
-                break
-
-        if not confirm_start:
+        confirm_header_row = self.section_index.confirm_header_row
+        if not confirm_header_row:
             return confirmations
+        confirm_start = confirm_header_row + 1  # Skip header row
 
         # Skip the column header row (직종, 이름, 서명...)
         confirm_start += 1
@@ -255,7 +339,7 @@ class RiskAssessmentParser(BaseExcelParser):
         # Parse confirmation rows - workers repeat every 12 columns
         # Column structure: C1=직종, C5=이름, C9=서명, C13=직종, C17=이름, C21=서명, ...
         # Pattern: position at col N, name at col N+4, for N = 1, 13, 25, 37, 49...
-        for row in range(confirm_start, self.worksheet.max_row + 1):
+        for row in range(confirm_start, self.max_row + 1):
             # Scan all worker column groups (up to column 60 to cover many workers)
             for base_col in range(1, 61, 12):  # 1, 13, 25, 37, 49
                 pos_col = base_col
@@ -265,10 +349,10 @@ class RiskAssessmentParser(BaseExcelParser):
                 worker_name = clean_cell_value(self.get_cell_value(row, name_col))
 
                 if worker_name and not any(kw in worker_name for kw in ["직종", "이름", "서명"]):
-                    confirmations.append({
-                        "worker_name": worker_name.strip(),
-                        "position": position.strip() if position else None
-                    })
+                    confirmations.append(RiskConfirmation(
+                        worker_name.strip(),
+                        position.strip() if position else None
+                    ))
 
         return confirmations
 
@@ -291,7 +375,9 @@ class RiskAssessmentParser(BaseExcelParser):
                 "metadata": metadata,
                 "records": records,  # 위험요인 + 개선대책 (measure)
                 "confirmations": confirmations,  # 근로자 확인
-                "action_results": action_results  # 조치이행결과
+                "action_results": action_results,  # 조치이행결과
+                "template": self.template_info,  # layout template (None if not templated)
+                "warnings": self.warnings  # sheet problems worth reporting (e.g. bogus dimension)
             }
         finally:
             self.close_workbook()
@@ -1,21 +1,35 @@
 """
 ETL Orchestration Script for HyunJangTong 2.0
 Processes Excel files from data_repository and loads into SQLite database.
+Attendance and TBM data may also be CSV/TSV exports of the sheet (see csv_reader).
+Zip archives in the data directories are read in place, member by member (see archives).
+Processed files can be moved into YYYY/MM partition folders (--partition, see discovery).
 
 Usage:
     python -m backend.etl.run_etl           # 증분 처리 (새 파일만)
     python -m backend.etl.run_etl --reset   # 전체 재처리 (DB 초기화)
+    python -m backend.etl.run_etl --workers 8   # 8개 프로세스로 병렬 파싱
+    python -m backend.etl.run_etl --watch   # 상시 실행, 새 파일 자동 적재
+    python -m backend.etl.run_etl --tiered  # 메타데이터 우선 적재, 상세 파싱은 후순위
+    python -m backend.etl.run_etl --since 250301 --until 250331 --site 부산   # 선택 재처리
+    python -m backend.etl.run_etl --reset --bulk   # 벌크 모드 재구축 (빠름, 비정상 종료 시 처음부터 재구축)
+    python -m backend.etl.run_etl --partition   # 처리 완료 파일을 YYYY/MM 하위 폴더로 이동
+    python -m backend.etl.run_etl --reset --profile   # 단계별 소요시간 리포트
 
     or
     python backend/etl/run_etl.py
     python backend/etl/run_etl.py --reset
 """
 
+import os
 import sys
 import argparse
 import sqlite3
+import time
+import zipfile
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Dict, Any, Optional, Set
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 
 # Add parent directory to path for imports when running as script
@@ -24,157 +38,80 @@ if __name__ == "__main__":
 
 from backend.config import (
     DATABASE_PATH,
+    DATA_REPOSITORY,
     ATTENDANCE_DIR,
     RISK_ASSESSMENT_DIR,
-    TBM_DIR
+    TBM_DIR,
+    ETL_HOT_WINDOW_DAYS
 )
-from backend.database.schema import init_db, drop_all_tables
-from backend.database.connection import get_or_create_site, get_or_create_partner
-from backend.etl.attendance_parser import AttendanceParser
-from backend.etl.risk_parser import RiskAssessmentParser
-from backend.etl.tbm_parser import TbmParser
-
-
-def insert_attendance_records(conn: sqlite3.Connection, parsed_data: Dict[str, Any]) -> int:
-    """Insert attendance records into database."""
-    cursor = conn.cursor()
-    meta = parsed_data["metadata"]
-    records = parsed_data["records"]
-
-    if not records:
-        return 0
-
-    # Get or create site and partner
-    site_name = meta.get("site_name") or meta.get("raw_site_project", "Unknown")
-    partner_name = meta.get("partner_name", "Unknown")
-
-    site_id = get_or_create_site(conn, site_name)
-    partner_id = get_or_create_partner(conn, partner_name)
-
-    work_date = meta.get("work_date")
-    if work_date:
-        work_date = work_date.isoformat() if hasattr(work_date, 'isoformat') else str(work_date)
-
-    count = 0
-    for record in records:
-        cursor.execute("""
-            INSERT INTO attendance_logs (
-                work_date, site_id, partner_id, worker_name, role,
-                birth_date, age, is_senior, check_in_time, check_out_time, has_accident
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            work_date,
-            site_id,
-            partner_id,
-            record.get("worker_name"),
-            record.get("role", "근로자"),
-            record.get("birth_date"),
-            record.get("age"),
-            1 if record.get("is_senior") else 0,
-            record.get("check_in_time"),
-            record.get("check_out_time"),
-            1 if record.get("has_accident") else 0
-        ))
-        count += 1
-
-    return count
-
-
-def insert_risk_records(conn: sqlite3.Connection, parsed_data: Dict[str, Any]) -> Dict[str, int]:
-    """Insert risk assessment records into database."""
-    cursor = conn.cursor()
-    meta = parsed_data["metadata"]
-    records = parsed_data["records"]
-    confirmations = parsed_data.get("confirmations", [])
-    action_results = parsed_data.get("action_results", [])
-    filename = parsed_data.get("filename", "")
-
-    # Get or create site and partner
-    site_name = meta.get("site_name") or "Unknown"
-    partner_name = meta.get("partner_name", "Unknown")
-
-    site_id = get_or_create_site(conn, site_name)
-    partner_id = get_or_create_partner(conn, partner_name)
-
-    start_date = meta.get("start_date")
-    end_date = meta.get("end_date")
-    doc_index = meta.get("doc_index", 0)
-    risk_type = meta.get("risk_type", "최초")
-    action_result_count = len(action_results)  # 조치이행결과 수
-
-    if start_date:
-        start_date = start_date.isoformat() if hasattr(start_date, 'isoformat') else str(start_date)
-    if end_date:
-        end_date = end_date.isoformat() if hasattr(end_date, 'isoformat') else str(end_date)
-
-    # Insert risk document with action_result_count
-    cursor.execute("""
-        INSERT INTO risk_docs (site_id, partner_id, start_date, end_date, doc_index, risk_type, action_result_count, filename)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (site_id, partner_id, start_date, end_date, doc_index, risk_type, action_result_count, filename))
-
-    doc_id = cursor.lastrowid
-
-    # Insert risk items (위험요인 + 개선대책)
-    item_count = 0
-    for record in records:
-        cursor.execute("""
-            INSERT INTO risk_items (doc_id, risk_factor, measure)
-            VALUES (?, ?, ?)
-        """, (doc_id, record.get("risk_factor"), record.get("measure")))
-        item_count += 1
-
-    # Insert confirmations (for 수시/정기 type)
-    confirm_count = 0
-    for confirm in confirmations:
-        cursor.execute("""
-            INSERT INTO risk_confirmations (doc_id, worker_name, position)
-            VALUES (?, ?, ?)
-        """, (doc_id, confirm.get("worker_name"), confirm.get("position")))
-        confirm_count += 1
-
-    return {"items": item_count, "confirmations": confirm_count}
-
-
-def insert_tbm_records(conn: sqlite3.Connection, parsed_data: Dict[str, Any]) -> int:
-    """Insert TBM records into database."""
-    cursor = conn.cursor()
-    meta = parsed_data["metadata"]
-    records = parsed_data["records"]
-
-    # Get or create site and partner
-    site_name = meta.get("site_name") or meta.get("raw_site_project", "Unknown")
-    partner_name = meta.get("partner_name", "Unknown")
-
-    site_id = get_or_create_site(conn, site_name)
-    partner_id = get_or_create_partner(conn, partner_name)
-
-    work_date = meta.get("work_date")
-    if work_date:
-        work_date = work_date.isoformat() if hasattr(work_date, 'isoformat') else str(work_date)
-
-    content = meta.get("content", "")
-
-    # Insert TBM log
-    cursor.execute("""
-        INSERT INTO tbm_logs (work_date, site_id, partner_id, content)
-        VALUES (?, ?, ?, ?)
-    """, (work_date, site_id, partner_id, content))
-
-    tbm_id = cursor.lastrowid
-
-    # Insert participants
-    count = 0
-    for record in records:
-        worker_name = record.get("worker_name")
-        if worker_name:
-            cursor.execute("""
-                INSERT INTO tbm_participants (tbm_id, worker_name)
-                VALUES (?, ?)
-            """, (tbm_id, worker_name))
-            count += 1
-
-    return count
+from backend.database.schema import apply_bulk_pragmas, finish_bulk_load, init_db
+from backend.database.shadow import (
+    REBUILD_BUILDING,
+    REBUILD_BULK_LOADING,
+    REBUILD_FAILED,
+    discard_rebuild,
+    read_rebuild_state,
+    shadow_path,
+    swap_database,
+    table_counts,
+    verify_database,
+    write_rebuild_state,
+)
+from backend.database.writer_lock import writer_lock
+from backend.etl.archives import ARCHIVE_SUFFIXES, SourcePath, is_archive, list_members, tracked_source
+from backend.etl.base_parser import DEFAULT_ENGINE, ENGINES
+from backend.etl.discovery import get_manifest, list_partitions, partition_files, record_locations, resolve_tracked
+from backend.etl.loader import BulkLoader
+from backend.etl.parallel import PARSERS, clamp_workers, iter_metadata_files, iter_parsed_files, parser_versions
+from backend.etl.parse_cache import ParseCache
+from backend.etl.profiling import EtlProfile
+from backend.etl.scheduling import FileFilter, file_metadata, newest_first, schedule_files, select_files
+from backend.etl.templates import get_registry, templates_path
+from backend.etl.tracking import (
+    PARSE_STAGE_FULL,
+    PARSE_STAGE_METADATA,
+    ChangeSet,
+    content_hash,
+    detect_changes,
+    get_file_states,
+    get_pending_files,
+    stat_state,
+)
+from backend.etl.utils import parse_yymmdd
+from backend.etl.watcher import Debouncer, create_watcher
+
+
+def insert_attendance_records(conn: sqlite3.Connection, parsed_data: Dict[str, Any],
+                              loader: Optional[BulkLoader] = None) -> int:
+    """Insert attendance records into database (buffered when a loader is given)."""
+    if loader is None:
+        loader = BulkLoader(conn)
+        count = loader.add_attendance(parsed_data)
+        loader.flush(commit=False)
+        return count
+    return loader.add_attendance(parsed_data)
+
+
+def insert_risk_records(conn: sqlite3.Connection, parsed_data: Dict[str, Any],
+                        loader: Optional[BulkLoader] = None) -> Dict[str, int]:
+    """Insert risk assessment records into database (buffered when a loader is given)."""
+    if loader is None:
+        loader = BulkLoader(conn)
+        counts = loader.add_risk(parsed_data)
+        loader.flush(commit=False)
+        return counts
+    return loader.add_risk(parsed_data)
+
+
+def insert_tbm_records(conn: sqlite3.Connection, parsed_data: Dict[str, Any],
+                       loader: Optional[BulkLoader] = None) -> int:
+    """Insert TBM records into database (buffered when a loader is given)."""
+    if loader is None:
+        loader = BulkLoader(conn)
+        count = loader.add_tbm(parsed_data)
+        loader.flush(commit=False)
+        return count
+    return loader.add_tbm(parsed_data)
 
 
 def get_processed_files(conn: sqlite3.Connection, file_type: str) -> Set[str]:
@@ -196,181 +133,576 @@ def mark_file_processed(conn: sqlite3.Connection, filename: str, file_type: str)
     )
 
 
-def process_attendance_files(conn: sqlite3.Connection, directory: Path, incremental: bool = True) -> Dict[str, int]:
-    """Process attendance Excel files. If incremental=True, skip already processed files."""
-    stats = {"files": 0, "records": 0, "errors": 0, "skipped": 0}
+# Labels used in progress output
+FILE_LABELS = {
+    "attendance": "attendance",
+    "risk": "risk assessment",
+    "tbm": "TBM",
+}
+
+
+# Progress callback: (file_type, stats so far, files to load of this type);
+# the deep-parsing stage of a tiered run reports as "<file_type>:deep"
+ProgressCallback = Callable[[str, Dict[str, int], int], None]
+
+# File types a tiered run loads metadata-first. Attendance rows are the KPI
+# data themselves, so attendance files are always parsed in full.
+TIERED_TYPES = ("risk", "tbm")
+
+# Niceness of the ETL process during the deep-parsing stage of a tiered run
+DEEP_STAGE_NICE = 10
 
-    if not directory.exists():
-        print(f"Warning: Attendance directory not found: {directory}")
-        return stats
 
-    xlsx_files = list(directory.glob("*.xlsx"))
-    total_files = len(xlsx_files)
+def _empty_stats(file_type: str) -> Dict[str, int]:
+    """
+    Per-type counters reported by the process_*_files functions. records/items/
+    confirmations count parsed rows; merged is the loader's running total of
+    rows the merge inserted for the type (see BulkLoader.merged_rows).
+    """
+    if file_type == "risk":
+        return {"files": 0, "items": 0, "confirmations": 0, "errors": 0, "skipped": 0, "updated": 0, "deferred": 0,
+                "merged": 0}
+    return {"files": 0, "records": 0, "errors": 0, "skipped": 0, "updated": 0, "deferred": 0, "merged": 0}
+
+
+def _loaded_rows(stats: Dict[str, int]) -> int:
+    """Data rows counted in stats (risk: items + confirmations)."""
+    return stats.get("records", 0) + stats.get("items", 0) + stats.get("confirmations", 0)
+
+
+def _files_loaded(stats: Dict[str, int]) -> str:
+    """'N new files, M updated' from stats (files counts new and modified files)."""
+    return f"{stats['files'] - stats['updated']} new files, {stats['updated']} updated"
 
-    # Get already processed files if incremental mode
-    processed = get_processed_files(conn, "attendance") if incremental else set()
-    if incremental and processed:
-        print(f"Found {total_files} attendance files ({len(processed)} already processed)")
+
+def _insert_parsed(conn: sqlite3.Connection, file_type: str, parsed: Dict[str, Any],
+                   loader: BulkLoader, stats: Dict[str, int]) -> None:
+    """Insert one parsed file and add its row counts to stats."""
+    if file_type == "attendance":
+        stats["records"] += insert_attendance_records(conn, parsed, loader)
+    elif file_type == "risk":
+        counts = insert_risk_records(conn, parsed, loader)
+        stats["items"] += counts["items"]
+        stats["confirmations"] += counts["confirmations"]
     else:
-        print(f"Found {total_files} attendance files")
+        stats["records"] += insert_tbm_records(conn, parsed, loader)
+
+
+def _file_result(filename: str, file_type: str, status: str, rows: int = 0,
+                 error: Optional[str] = None) -> Dict[str, Any]:
+    """Per-file outcome: status is loaded, updated, unchanged or error."""
+    return {"filename": filename, "file_type": file_type, "status": status, "rows": rows, "error": error}
+
+
+def _database_file(conn: sqlite3.Connection) -> Path:
+    """File of the connection's main database."""
+    return Path(conn.execute("PRAGMA database_list").fetchone()[2])
 
-    for file_path in xlsx_files:
-        # Skip already processed files in incremental mode
-        if incremental and file_path.name in processed:
-            stats["skipped"] += 1
+
+def _process_files(conn: sqlite3.Connection, file_type: str, file_paths: List[Path], stats: Dict[str, int],
+                   incremental: bool = True, workers: int = 1, loader: Optional[BulkLoader] = None,
+                   engine: str = DEFAULT_ENGINE, cache: Optional[ParseCache] = None,
+                   profile: Optional[EtlProfile] = None,
+                   progress: Optional[ProgressCallback] = None,
+                   executor: Optional[Executor] = None,
+                   results: Optional[List[Dict[str, Any]]] = None,
+                   metadata_only: bool = False,
+                   changes: Optional[ChangeSet] = None) -> Dict[str, int]:
+    """
+    Parse and load files of one type.
+
+    In incremental mode unchanged files are skipped; modified files (same
+    name, different content) have their old rows replaced in the same
+    transaction that loads the new version. Each file is loaded atomically
+    (see BulkLoader.begin_file): a file that fails leaves no rows behind.
+    The layout template of every loaded file is recorded in the registry
+    next to the database (see templates.py); new templates are reported. progress is called with the running stats once before loading and after
+    every file (loaded or failed). Files are loaded in the given order and
+    counts are added to stats, so one stats dict can span several calls
+    (scheduling phases). With a results list, one entry per file is
+    appended (see _file_result).
+
+    With metadata_only, files of the TIERED_TYPES are loaded from their file
+    name metadata only (document rows without items/participants) and left
+    pending for complete_pending_files. A precomputed changes set replaces
+    change detection (used by the deep-parsing stage).
+    """
+    label = FILE_LABELS[file_type]
+    if changes is None:
+        started = time.perf_counter()
+        changes = detect_changes(conn, file_type, file_paths, incremental)
+        if profile is not None:
+            profile.add_stage("change_detection", time.perf_counter() - started)
+
+        if incremental and (changes.skipped or changes.modified):
+            print(f"Found {len(file_paths)} {label} files "
+                  f"({changes.skipped} unchanged, {len(changes.modified)} modified)")
+        else:
+            print(f"Found {len(file_paths)} {label} files")
+    stats["skipped"] += changes.skipped
+
+    metadata_only = metadata_only and file_type in TIERED_TYPES
+    stage = PARSE_STAGE_METADATA if metadata_only else PARSE_STAGE_FULL
+
+    owns_loader = loader is None
+    if owns_loader:
+        loader = BulkLoader(conn)
+
+    # Running total when stats already holds an earlier scheduling phase
+    total = stats["files"] + stats["errors"] + len(changes.pending)
+    if progress is not None:
+        progress(file_type, stats, total)
+    if results is not None:
+        pending_names = {path.name for path in changes.pending}
+        results.extend(_file_result(path.name, file_type, "unchanged")
+                       for path in file_paths if path.name not in pending_names)
+
+    templates_file = templates_path(_database_file(conn))
+    templates = get_registry(templates_file)
+    content_hashes = {name: state.content_hash for name, state in changes.states.items()}
+    if metadata_only:
+        parsed_files = iter_metadata_files(file_type, changes.pending)
+    else:
+        parsed_files = iter_parsed_files(
+            file_type, changes.pending, workers, engine=engine, cache=cache, content_hashes=content_hashes,
+            profile=profile is not None, executor=executor, templates_path=templates_file
+        )
+    for file_path, parsed, error in parsed_files:
+        if error is not None:
+            stats["errors"] += 1
+            print(f"  Error processing {file_path.name}: {error}")
+            if results is not None:
+                results.append(_file_result(file_path.name, file_type, "error", error=str(error)))
+            if progress is not None:
+                progress(file_type, stats, total)
             continue
 
+        # Counts of this file only; merged into stats once the file is loaded
+        file_stats = _empty_stats(file_type)
+        loader.begin_file()
         try:
-            parser = AttendanceParser(str(file_path))
-            parsed = parser.run()
-            count = insert_attendance_records(conn, parsed)
-            mark_file_processed(conn, file_path.name, "attendance")
-            stats["files"] += 1
-            stats["records"] += count
-            if stats["files"] % 100 == 0:
-                print(f"  Processed {stats['files']} new attendance files...")
+            if file_path.name in changes.modified:
+                loader.delete_file_rows(file_type, file_path.name)
+                file_stats["updated"] += 1
+            started = time.perf_counter()
+            _insert_parsed(conn, file_type, parsed, loader, file_stats)
+            insert_seconds = time.perf_counter() - started
+            row_count = parsed.get("row_count") if metadata_only else _loaded_rows(file_stats)
+            loader.mark_processed(file_path.name, file_type, changes.states[file_path.name], stage, row_count)
         except Exception as e:
+            loader.abort_file()
             stats["errors"] += 1
             print(f"  Error processing {file_path.name}: {e}")
+            if results is not None:
+                results.append(_file_result(file_path.name, file_type, "error", error=str(e)))
+            if progress is not None:
+                progress(file_type, stats, total)
+            continue
+        except BaseException:
+            # Ctrl-C etc.: drop the partial file, keep the completed ones
+            loader.abort_file()
+            raise
+
+        loader.maybe_flush()
+        for key, value in file_stats.items():
+            stats[key] += value
+        stats["files"] += 1
+        stats["merged"] = loader.merged_rows(file_type)
+        stats["deferred"] += 1 if metadata_only else 0
+        template = parsed.get("template")
+        if templates.record(template, file_path.name):
+            print(f"  New {label} layout template {template['fingerprint']} "
+                  f"(sheet '{template['sheet_name']}', {template['max_column']} columns): {file_path.name}")
+        for warning in parsed.get("warnings", []):
+            print(f"  Warning {file_path.name}: {warning}")
+        if profile is not None:
+            profile.add_file(file_type, file_path.name, parsed.get("profile"), insert_seconds)
+        if results is not None:
+            status = "updated" if file_stats["updated"] else "loaded"
+            results.append(_file_result(file_path.name, file_type, status, _loaded_rows(file_stats)))
+        if progress is not None:
+            progress(file_type, stats, total)
+        if stats["files"] % 100 == 0:
+            print(f"  Processed {stats['files']} {label} files...")
+
+    if owns_loader:
+        loader.flush(commit=False)
+        stats["merged"] = loader.merged_rows(file_type)
+    templates.save()
 
     return stats
 
 
-def process_risk_files(conn: sqlite3.Connection, directory: Path, incremental: bool = True) -> Dict[str, int]:
-    """Process risk assessment Excel files. If incremental=True, skip already processed files."""
-    stats = {"files": 0, "items": 0, "confirmations": 0, "errors": 0, "skipped": 0}
+def load_files(conn: sqlite3.Connection, file_type: str, file_paths: List[Path], loader: BulkLoader,
+               workers: int = 1, engine: str = DEFAULT_ENGINE, cache: Optional[ParseCache] = None,
+               executor: Optional[Executor] = None) -> List[Dict[str, Any]]:
+    """
+    Incrementally load specific files of one type (e.g. uploaded workbooks).
 
+    New files are loaded, modified ones replace their old rows and unchanged
+    ones are skipped, exactly like a directory scan. The caller flushes the
+    loader. Returns one result per file (see _file_result).
+    """
+    results: List[Dict[str, Any]] = []
+    _process_files(conn, file_type, file_paths, _empty_stats(file_type), workers=workers, loader=loader,
+                   engine=engine, cache=cache, executor=executor, results=results)
+    return results
+
+
+def expand_archives(paths: Iterable[Path], suffixes: Tuple[str, ...]) -> List[SourcePath]:
+    """Source files among paths: files with the given suffixes and those members of zip archives."""
+    files: List[SourcePath] = []
+    for path in paths:
+        if is_archive(path):
+            try:
+                files.extend(list_members(path, suffixes))
+            except (OSError, zipfile.BadZipFile) as e:
+                print(f"  Warning: cannot read archive {path.name}: {e}")
+        elif path.suffix.lower() in suffixes:
+            files.append(path)
+    return files
+
+
+def list_source_files(directory: Path, suffixes: Tuple[str, ...] = (".xlsx",),
+                      partitions: Iterable[Path] = ()) -> List[SourcePath]:
+    """
+    Source files with the given suffixes in the top level of a data directory
+    and in the given partition folders of it, including the members of zip
+    archives (Excel lock files skipped; [] if it does not exist). A name found
+    in several folders is listed once: the top-level copy, else the newest
+    partition's.
+    """
     if not directory.exists():
-        print(f"Warning: Risk assessment directory not found: {directory}")
+        return []
+    files: List[SourcePath] = []
+    seen: Set[str] = set()
+    for folder in [directory, *partitions]:
+        paths = [f for suffix in suffixes + ARCHIVE_SUFFIXES for f in folder.glob(f"*{suffix}")
+                 if not f.name.startswith("~$")]
+        for path in expand_archives(paths, suffixes):
+            if path.name not in seen:
+                seen.add(path.name)
+                files.append(path)
+    return files
+
+
+def _print_completed(file_type: str, stats: Dict[str, int], incremental: bool) -> None:
+    """Per-type completion line of run_full_etl."""
+    if file_type == "attendance":
+        rows = f"{stats['records']} records"
+    elif file_type == "risk":
+        rows = f"{stats['items']} items"
+    else:
+        rows = f"{stats['records']} participants"
+
+    label = FILE_LABELS[file_type]
+    if incremental:
+        print(f"  Completed {label}: {_files_loaded(stats)}, {rows} (skipped {stats['skipped']} unchanged)")
+    elif file_type == "risk":
+        print(f"  Completed {label}: {stats['files']} files, {rows}, {stats['confirmations']} confirmations")
+    else:
+        print(f"  Completed {label}: {stats['files']} files, {rows}, {stats['errors']} errors")
+
+
+def process_attendance_files(conn: sqlite3.Connection, directory: Path, incremental: bool = True,
+                             workers: int = 1, loader: Optional[BulkLoader] = None,
+                             engine: str = DEFAULT_ENGINE, cache: Optional[ParseCache] = None,
+                             profile: Optional[EtlProfile] = None,
+                             progress: Optional[ProgressCallback] = None,
+                             metadata_only: bool = False) -> Dict[str, int]:
+    """Process attendance Excel files. If incremental=True, skip unchanged files."""
+    stats = _empty_stats("attendance")
+
+    if not directory.exists():
+        print(f"Warning: Attendance directory not found: {directory}")
         return stats
 
-    xlsx_files = [f for f in directory.glob("*.xlsx") if not f.name.startswith("~$")]
-    total_files = len(xlsx_files)
+    xlsx_files = newest_first("attendance", list_source_files(directory, PARSERS["attendance"].SOURCE_SUFFIXES))
+    return _process_files(conn, "attendance", xlsx_files, stats, incremental, workers, loader, engine, cache, profile,
+                          progress, metadata_only=metadata_only)
 
-    # Get already processed files if incremental mode
-    processed = get_processed_files(conn, "risk") if incremental else set()
-    if incremental and processed:
-        print(f"Found {total_files} risk assessment files ({len(processed)} already processed)")
-    else:
-        print(f"Found {total_files} risk assessment files")
 
-    for file_path in xlsx_files:
-        # Skip already processed files in incremental mode
-        if incremental and file_path.name in processed:
-            stats["skipped"] += 1
-            continue
+def process_risk_files(conn: sqlite3.Connection, directory: Path, incremental: bool = True,
+                       workers: int = 1, loader: Optional[BulkLoader] = None,
+                       engine: str = DEFAULT_ENGINE, cache: Optional[ParseCache] = None,
+                       profile: Optional[EtlProfile] = None,
+                       progress: Optional[ProgressCallback] = None,
+                       metadata_only: bool = False) -> Dict[str, int]:
+    """Process risk assessment Excel files. If incremental=True, skip unchanged files."""
+    stats = _empty_stats("risk")
 
-        try:
-            parser = RiskAssessmentParser(str(file_path))
-            parsed = parser.run()
-            counts = insert_risk_records(conn, parsed)
-            mark_file_processed(conn, file_path.name, "risk")
-            stats["files"] += 1
-            stats["items"] += counts["items"]
-            stats["confirmations"] += counts["confirmations"]
-        except Exception as e:
-            stats["errors"] += 1
-            print(f"  Error processing {file_path.name}: {e}")
+    if not directory.exists():
+        print(f"Warning: Risk assessment directory not found: {directory}")
+        return stats
 
-    return stats
+    xlsx_files = newest_first("risk", list_source_files(directory, PARSERS["risk"].SOURCE_SUFFIXES))
+    return _process_files(conn, "risk", xlsx_files, stats, incremental, workers, loader, engine, cache, profile,
+                          progress, metadata_only=metadata_only)
 
 
-def process_tbm_files(conn: sqlite3.Connection, directory: Path, incremental: bool = True) -> Dict[str, int]:
-    """Process TBM Excel files. If incremental=True, skip already processed files."""
-    stats = {"files": 0, "records": 0, "errors": 0, "skipped": 0}
+def process_tbm_files(conn: sqlite3.Connection, directory: Path, incremental: bool = True,
+                      workers: int = 1, loader: Optional[BulkLoader] = None,
+                      engine: str = DEFAULT_ENGINE, cache: Optional[ParseCache] = None,
+                      profile: Optional[EtlProfile] = None,
+                      progress: Optional[ProgressCallback] = None,
+                      metadata_only: bool = False) -> Dict[str, int]:
+    """Process TBM Excel files. If incremental=True, skip unchanged files."""
+    stats = _empty_stats("tbm")
 
     if not directory.exists():
         print(f"Warning: TBM directory not found: {directory}")
         return stats
 
-    xlsx_files = list(directory.glob("*.xlsx"))
-    total_files = len(xlsx_files)
+    xlsx_files = newest_first("tbm", list_source_files(directory, PARSERS["tbm"].SOURCE_SUFFIXES))
+    return _process_files(conn, "tbm", xlsx_files, stats, incremental, workers, loader, engine, cache, profile,
+                          progress, metadata_only=metadata_only)
 
-    # Get already processed files if incremental mode
-    processed = get_processed_files(conn, "tbm") if incremental else set()
-    if incremental and processed:
-        print(f"Found {total_files} TBM files ({len(processed)} already processed)")
-    else:
-        print(f"Found {total_files} TBM files")
 
-    for file_path in xlsx_files:
-        # Skip already processed files in incremental mode
-        if incremental and file_path.name in processed:
-            stats["skipped"] += 1
+def complete_pending_files(conn: sqlite3.Connection, file_type: str, directory: Path, loader: BulkLoader,
+                           workers: int = 1, engine: str = DEFAULT_ENGINE, cache: Optional[ParseCache] = None,
+                           profile: Optional[EtlProfile] = None,
+                           progress: Optional[ProgressCallback] = None) -> Dict[str, int]:
+    """
+    Deep-parse the files of one type that a tiered run loaded metadata-first.
+
+    The full parse is merged onto the first-tier document rows by natural
+    key (risk documents get their type, items and confirmations, TBM logs
+    their content and participants) and the files are marked fully parsed.
+    Files no longer in directory stay pending.
+    """
+    stats = _empty_stats(file_type)
+    pending = get_pending_files(conn, file_type)
+    if not pending:
+        return stats
+
+    print(f"\nDeep parsing {len(pending)} {FILE_LABELS[file_type]} files loaded metadata-first...")
+    file_paths = []
+    states = {}
+    for filename in pending:
+        file_path = tracked_source(directory, filename)
+        if not file_path.exists():
+            print(f"  Warning: {filename} is pending deep parsing but missing from {directory}")
             continue
+        file_paths.append(file_path)
+        states[filename] = stat_state(file_path)._replace(content_hash=content_hash(file_path))
 
-        try:
-            parser = TbmParser(str(file_path))
-            parsed = parser.run()
-            count = insert_tbm_records(conn, parsed)
-            mark_file_processed(conn, file_path.name, "tbm")
-            stats["files"] += 1
-            stats["records"] += count
-            if stats["files"] % 100 == 0:
-                print(f"  Processed {stats['files']} new TBM files...")
-        except Exception as e:
-            stats["errors"] += 1
-            print(f"  Error processing {file_path.name}: {e}")
+    deep_progress = None
+    if progress is not None:
+        def deep_progress(_file_type: str, deep_stats: Dict[str, int], total: int) -> None:
+            progress(f"{file_type}:deep", deep_stats, total)
 
+    _process_files(conn, file_type, file_paths, stats, workers=workers, loader=loader, engine=engine, cache=cache,
+                   profile=profile, progress=deep_progress, changes=ChangeSet(file_paths, set(), states, 0))
     return stats
 
 
-def run_full_etl(reset_db: bool = False) -> None:
+def _lower_priority() -> None:
+    """Lower this process's CPU priority (inherited by parser processes started later)."""
+    try:
+        os.nice(DEEP_STAGE_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+# file_type -> data repository directory (run_full_etl uses the same
+# sub-directory names under data_dir)
+SOURCE_DIRS = {
+    "attendance": ATTENDANCE_DIR,
+    "risk": RISK_ASSESSMENT_DIR,
+    "tbm": TBM_DIR,
+}
+
+
+# Tables compared against the load's own counts before a rebuild is swapped in
+VERIFIED_TABLES = [
+    "processed_files", "attendance_logs", "risk_docs", "risk_items",
+    "risk_confirmations", "tbm_logs", "tbm_participants",
+]
+
+
+def run_full_etl(reset_db: bool = False, workers: int = 1, engine: str = DEFAULT_ENGINE,
+                 use_cache: bool = True, profile: Optional[EtlProfile] = None,
+                 database_path: Path = DATABASE_PATH, data_dir: Path = DATA_REPOSITORY,
+                 resume: bool = True, progress: Optional[ProgressCallback] = None,
+                 tiered: bool = False, hot_days: int = ETL_HOT_WINDOW_DAYS,
+                 bulk: bool = False, partition: bool = False) -> Dict[str, Dict[str, int]]:
     """
     Main ETL orchestration function.
 
     Args:
-        reset_db: If True, drop all tables and recreate schema (full re-process)
+        reset_db: If True, rebuild everything into a shadow database and swap it
+                  in atomically once verified (full re-process; the live
+                  database keeps serving until then). Files are committed
+                  in batches, so an interrupted rebuild is resumed.
                   If False (default), incremental processing (new files only)
+        workers: Number of parser processes. Parsing runs in a process pool
+                 while this process remains the single database writer.
+        engine: Workbook reader engine ('openpyxl' or 'stream')
+        use_cache: Reuse cached parse results of unchanged files (see parse_cache)
+        profile: Collect per-stage timings into this EtlProfile (see profiling)
+        database_path: Target SQLite database (default: config.DATABASE_PATH)
+        data_dir: Data repository with the 01_attendance/02_risk_assessment/03_tbm
+                  sub-directories (default: config.DATA_REPOSITORY)
+        resume: With reset_db, continue an interrupted rebuild instead of
+                starting over
+        progress: Called as progress(file_type, stats, files_to_load) while
+                  files are loaded (see _process_files)
+        tiered: Incremental runs only. Load new risk/TBM files from their
+                file name metadata first and commit, so dashboard counts
+                update at once; then deep-parse them at lower CPU priority.
+                Files left pending (e.g. by an interrupted tiered run) are
+                deep-parsed by every incremental run.
+        hot_days: Files are loaded newest first (date in the file name);
+                  those dated within the last hot_days days are loaded and
+                  committed for all file types before older ones (0 = one
+                  newest-first pass)
+        bulk: With reset_db, load the shadow with bulk settings (in-memory
+              journal, no syncs, large cache) and only the indexes the merge
+              needs, then build the other indexes and run ANALYZE at the end.
+              Faster, but only a cleanly interrupted (Ctrl-C) bulk rebuild is
+              resumed; after a crash, kill or power loss it starts over. The
+              default journaled rebuild can always be resumed.
+        partition: Afterwards move fully processed top-level files into
+                   YYYY/MM partition folders (see discovery). Incremental
+                   runs list only the top level; a reset lists the
+                   partitions too.
+
+    The whole run holds the writer lock of database_path (see
+    database.writer_lock); it waits for a watcher batch, upload or other run
+    that is writing.
+
+    Returns:
+        Stats per file type ({"attendance": {...}, "risk": {...}, "tbm": {...}});
+        deep-parsing stats as "risk:deep"/"tbm:deep" when files were pending
     """
-    incremental = not reset_db
+    with writer_lock(database_path, wait_message=f"Waiting for another ETL writer of {database_path.name}..."):
+        return _run_full_etl(reset_db, workers, engine, use_cache, profile, database_path, data_dir,
+                             resume, progress, tiered, hot_days, bulk, partition)
+
+
+def _run_full_etl(reset_db: bool, workers: int, engine: str, use_cache: bool, profile: Optional[EtlProfile],
+                  database_path: Path, data_dir: Path, resume: bool, progress: Optional[ProgressCallback],
+                  tiered: bool, hot_days: int, bulk: bool, partition: bool) -> Dict[str, Dict[str, int]]:
+    """run_full_etl with the writer lock held."""
+    workers = clamp_workers(workers)
+    target_path = shadow_path(database_path) if reset_db else database_path
+    rebuild_state = read_rebuild_state(target_path) if reset_db else None
+    resuming = (resume and target_path.exists() and rebuild_state is not None
+                and rebuild_state.get("status") == REBUILD_BUILDING)
+    bulk = bulk and reset_db
+
+    # A resumed rebuild only loads the files not yet committed to the shadow
+    incremental = not reset_db or resuming
+    tiered = tiered and not reset_db
     mode_str = "FULL RESET" if reset_db else "INCREMENTAL"
+    if resuming:
+        mode_str += " (RESUMED)"
+    if tiered:
+        mode_str += " (TIERED)"
 
     print("=" * 60)
     print(f"HyunJangTong 2.0 ETL Process [{mode_str}]")
+    if workers > 1:
+        print(f"Parser workers: {workers}")
+    if engine != DEFAULT_ENGINE:
+        print(f"Reader engine: {engine}")
     print("=" * 60)
     start_time = datetime.now()
 
-    # Initialize database
-    if reset_db:
-        print("\n[1/5] Resetting database (full re-process)...")
-        drop_all_tables(DATABASE_PATH)
+    files = {}
+    for file_type, directory in SOURCE_DIRS.items():
+        source = data_dir / directory.name
+        if not source.exists():
+            print(f"Warning: {FILE_LABELS[file_type]} directory not found: {source}")
+        partitions = list_partitions(source) if reset_db and source.exists() else []
+        files[file_type] = list_source_files(source, PARSERS[file_type].SOURCE_SUFFIXES, partitions)
+    phases = schedule_files(files, hot_days)
+    steps = 2 + len(phases)
+
+    cache = None
+    if use_cache:
+        cache = ParseCache()
+        cache.prune(parser_versions())
+        cache.evict()
+
+    # Initialize database (a reset loads into a shadow file, see database.shadow)
+    if resuming:
+        print(f"\n[1/{steps}] Resuming rebuild of {target_path.name} started {rebuild_state['started_at']}...")
+        started_at = rebuild_state["started_at"]
+    elif reset_db:
+        print(f"\n[1/{steps}] Rebuilding into shadow database {target_path.name} (full re-process)...")
+        if rebuild_state is not None and rebuild_state.get("status") == REBUILD_BULK_LOADING:
+            print("  Previous bulk rebuild did not stop cleanly; starting over")
+        discard_rebuild(target_path)
+        started_at = None
     else:
-        print("\n[1/5] Incremental mode - keeping existing data...")
+        print(f"\n[1/{steps}] Incremental mode - keeping existing data...")
 
-    print("\n[2/5] Initializing database schema...")
-    init_db(DATABASE_PATH)
+    print(f"\n[2/{steps}] Initializing database schema...")
+    init_db(target_path, bulk=bulk)
+    if reset_db:
+        write_rebuild_state(target_path, REBUILD_BULK_LOADING if bulk else REBUILD_BUILDING, started_at)
+    baseline = table_counts(target_path, VERIFIED_TABLES) if reset_db else {}
 
     # Connect to database
-    conn = sqlite3.connect(str(DATABASE_PATH))
+    conn = sqlite3.connect(str(target_path))
+    if bulk:
+        apply_bulk_pragmas(conn)
 
     try:
-        # Process attendance files
-        print("\n[3/5] Processing attendance files...")
-        att_stats = process_attendance_files(conn, ATTENDANCE_DIR, incremental=incremental)
-        if incremental:
-            print(f"  Completed: {att_stats['files']} new files, {att_stats['records']} records (skipped {att_stats['skipped']} existing)")
-        else:
-            print(f"  Completed: {att_stats['files']} files, {att_stats['records']} records, {att_stats['errors']} errors")
-
-        # Process risk assessment files
-        print("\n[4/5] Processing risk assessment files...")
-        risk_stats = process_risk_files(conn, RISK_ASSESSMENT_DIR, incremental=incremental)
-        if incremental:
-            print(f"  Completed: {risk_stats['files']} new files, {risk_stats['items']} items (skipped {risk_stats['skipped']} existing)")
-        else:
-            print(f"  Completed: {risk_stats['files']} files, {risk_stats['items']} items, {risk_stats['confirmations']} confirmations")
-
-        # Process TBM files
-        print("\n[5/5] Processing TBM files...")
-        tbm_stats = process_tbm_files(conn, TBM_DIR, incremental=incremental)
-        if incremental:
-            print(f"  Completed: {tbm_stats['files']} new files, {tbm_stats['records']} participants (skipped {tbm_stats['skipped']} existing)")
-        else:
-            print(f"  Completed: {tbm_stats['files']} files, {tbm_stats['records']} participants, {tbm_stats['errors']} errors")
-
-        # Commit all changes
-        conn.commit()
+        # Single writer: rows from all file types are batched through one loader
+        loader = BulkLoader(conn)
+
+        # Newest files first; the hot window is loaded and committed for
+        # every file type before any older file (see scheduling)
+        stats = {file_type: _empty_stats(file_type) for file_type in SOURCE_DIRS}
+        for step, phase in enumerate(phases, 3):
+            print(f"\n[{step}/{steps}] Processing {phase.description}...")
+            for file_type, file_paths in phase.files.items():
+                before = dict(stats[file_type])
+                _process_files(conn, file_type, file_paths, stats[file_type], incremental, workers, loader, engine,
+                               cache, profile, progress, metadata_only=tiered)
+                _print_completed(file_type, {key: stats[file_type][key] - before[key] for key in before}, incremental)
+            loader.flush()
+        att_stats, risk_stats, tbm_stats = stats["attendance"], stats["risk"], stats["tbm"]
+
+        if reset_db:
+            # Rebuild the discovery manifest from where the files were found
+            for file_type, file_paths in files.items():
+                record_locations(conn, file_type, data_dir / SOURCE_DIRS[file_type].name, file_paths)
+            conn.commit()
+
+        if bulk:
+            print("\nBuilding indexes and statistics...")
+            index_started = time.perf_counter()
+            finish_bulk_load(conn)
+            if profile is not None:
+                profile.add_stage("sqlite_index", time.perf_counter() - index_started)
+
+        # Deep-parse files loaded metadata-first; the first tier is already
+        # committed and visible to the dashboards
+        deep_stats: Dict[str, Dict[str, int]] = {}
+        if not reset_db:
+            if tiered:
+                _lower_priority()
+            for file_type in TIERED_TYPES:
+                type_stats = complete_pending_files(
+                    conn, file_type, data_dir / SOURCE_DIRS[file_type].name, loader, workers=workers, engine=engine,
+                    cache=cache, profile=profile, progress=progress
+                )
+                if type_stats["files"] or type_stats["errors"]:
+                    deep_stats[f"{file_type}:deep"] = type_stats
+                    print(f"  Completed: {type_stats['files']} files deep-parsed, {type_stats['errors']} errors")
+            loader.flush()
+
+        # Merge totals including the last batch
+        for file_type, type_stats in stats.items():
+            type_stats["merged"] = loader.merged_rows(file_type)
+
+        if reset_db:
+            expected = _expected_counts(baseline, loader, att_stats, risk_stats, tbm_stats)
+        if profile is not None:
+            profile.add_stage("sqlite_flush", loader.flush_seconds)
 
         # Print summary
         elapsed = datetime.now() - start_time
@@ -378,12 +710,15 @@ def run_full_etl(reset_db: bool = False) -> None:
         print("ETL COMPLETE")
         print("=" * 60)
         print(f"Mode: {mode_str}")
-        print(f"Database: {DATABASE_PATH}")
+        print(f"Database: {database_path}")
         print(f"Total time: {elapsed}")
-        print("\nNew files processed:")
-        print(f"  Attendance: {att_stats['files']} files, {att_stats['records']} records")
-        print(f"  Risk Assessment: {risk_stats['files']} files, {risk_stats['items']} items")
-        print(f"  TBM: {tbm_stats['files']} files, {tbm_stats['records']} participants")
+        print("\nFiles processed:")
+        print(f"  Attendance: {_files_loaded(att_stats)}, {att_stats['records']} records")
+        print(f"  Risk Assessment: {_files_loaded(risk_stats)}, {risk_stats['items']} items")
+        print(f"  TBM: {_files_loaded(tbm_stats)}, {tbm_stats['records']} participants")
+        pending = sum(len(get_pending_files(conn, file_type)) for file_type in TIERED_TYPES)
+        if pending:
+            print(f"  Pending deep parsing: {pending} files (retried by the next incremental run)")
 
         # Print record counts
         cursor = conn.cursor()
@@ -408,9 +743,226 @@ def run_full_etl(reset_db: bool = False) -> None:
         print(f"  TBM logs: {tbm_count}")
         print(f"  Processed files tracked: {processed_count}")
 
+    except KeyboardInterrupt:
+        # Completed files are kept; the file in progress was rolled back
+        loader.flush()
+        if bulk:
+            # Everything up to here is committed, so the shadow can be resumed
+            write_rebuild_state(target_path, REBUILD_BUILDING, read_rebuild_state(target_path)["started_at"])
+        done = conn.execute("SELECT COUNT(*) FROM processed_files").fetchone()[0]
+        print(f"\nInterrupted: {done} files committed to {target_path.name}.")
+        print("Run the same command again to continue where it stopped.")
+        raise
+
     finally:
         conn.close()
 
+    if reset_db:
+        _swap_in_rebuild(target_path, database_path, expected)
+
+    if partition:
+        print("\nMoving processed files into date partitions...")
+        conn = sqlite3.connect(str(database_path))
+        try:
+            for file_type, file_paths in files.items():
+                moved = partition_files(conn, file_type, data_dir / SOURCE_DIRS[file_type].name, file_paths)
+                print(f"  {FILE_LABELS[file_type]}: {moved} files moved")
+        finally:
+            conn.close()
+
+    return {"attendance": att_stats, "risk": risk_stats, "tbm": tbm_stats, **deep_stats}
+
+
+def _expected_counts(baseline: Dict[str, int], loader: BulkLoader, att_stats: Dict[str, int],
+                     risk_stats: Dict[str, int], tbm_stats: Dict[str, int]) -> Dict[str, int]:
+    """Row counts the database should have after this load (for verification)."""
+    # Re-loaded (modified) files replace their existing processed_files row
+    counts = {
+        "processed_files": baseline["processed_files"]
+        + sum(s["files"] - s["updated"] for s in (att_stats, risk_stats, tbm_stats)),
+    }
+    # Data rows are merged on natural keys, so only rows the merge actually
+    # inserted count (duplicates of existing rows update them in place)
+    for table in VERIFIED_TABLES:
+        if table != "processed_files":
+            counts[table] = baseline[table] + loader.inserted.get(table, 0) - loader.deleted.get(table, 0)
+    return counts
+
+
+def _swap_in_rebuild(shadow: Path, database_path: Path, expected: Dict[str, int]) -> None:
+    """Verify a rebuilt shadow database and atomically replace the live one with it."""
+    print("\nVerifying rebuilt database...")
+    problems = verify_database(shadow, expected)
+
+    # An empty rebuild over a populated database usually means a missing data mount
+    if expected["processed_files"] == 0 and table_counts(database_path, ["processed_files"])["processed_files"]:
+        problems.append("rebuild loaded no files but the live database is not empty")
+
+    if problems:
+        for problem in problems:
+            print(f"  Check failed: {problem}")
+        print(f"  Live database left unchanged; rebuild kept at {shadow}")
+        write_rebuild_state(shadow, REBUILD_FAILED)
+        raise RuntimeError("Rebuilt database failed verification")
+
+    swap_database(shadow, database_path)
+    print(f"  Checks passed; swapped rebuilt database into {database_path}")
+
+
+def run_selective_etl(file_filter: FileFilter, workers: int = 1, engine: str = DEFAULT_ENGINE,
+                      use_cache: bool = True, database_path: Path = DATABASE_PATH,
+                      data_dir: Path = DATA_REPOSITORY) -> Dict[str, Dict[str, int]]:
+    """
+    Re-process only the files selected by file name metadata (date window, site, partner).
+
+    Files are chosen without opening them, from the top level of each data
+    directory and the date partitions the window reaches. Every selected file is reloaded
+    whether it changed or not: the rows it loaded before are deleted and
+    its new rows merged, per file, like a modified file. Tracked files that
+    match but are gone from the data repository lose their rows. The run
+    is one transaction, so the dashboards see either the old or the
+    corrected data. It holds the writer lock of database_path throughout.
+
+    Returns:
+        Stats per file type, plus "removed" (files no longer on disk)
+    """
+    print("=" * 60)
+    print(f"HyunJangTong 2.0 ETL Process [SELECTIVE: {file_filter.describe()}]")
+    print("=" * 60)
+    workers = clamp_workers(workers)
+    start_time = datetime.now()
+
+    with writer_lock(database_path, wait_message=f"Waiting for another ETL writer of {database_path.name}..."):
+        init_db(database_path)
+        cache = ParseCache() if use_cache else None
+        conn = sqlite3.connect(str(database_path))
+        results: Dict[str, Dict[str, int]] = {}
+
+        try:
+            loader = BulkLoader(conn, commit_batches=False)
+            removed = 0
+            for file_type, directory in SOURCE_DIRS.items():
+                source = data_dir / directory.name
+                # Partitions are by file date, so only those from the window's start can hold selected files
+                partitions = list_partitions(source, file_filter.since) if source.exists() else []
+                source_files = list_source_files(source, PARSERS[file_type].SOURCE_SUFFIXES, partitions)
+                file_paths = newest_first(file_type, select_files(file_type, source_files, file_filter))
+                known = get_file_states(conn, file_type)
+                manifest = get_manifest(conn, file_type)
+                present = {path.name for path in file_paths}
+
+                # Tracked files that match the selection but no longer exist
+                for filename in known:
+                    tracked = resolve_tracked(source, filename, manifest.get(filename))
+                    if filename not in present and not tracked.exists() \
+                            and file_filter.matches(file_metadata(file_type, tracked)):
+                        loader.delete_file_rows(file_type, filename)
+                        conn.execute("DELETE FROM processed_files WHERE filename = ?", (filename,))
+                        conn.execute("DELETE FROM source_manifest WHERE filename = ?", (filename,))
+                        print(f"  Removed rows of missing file {filename}")
+                        removed += 1
+
+                states = {path.name: stat_state(path)._replace(content_hash=content_hash(path))
+                          for path in file_paths}
+                modified = {name for name in present if name in known}
+                print(f"\nSelected {len(file_paths)} {FILE_LABELS[file_type]} files ({len(modified)} already loaded)")
+                stats = _process_files(conn, file_type, file_paths, _empty_stats(file_type), workers=workers,
+                                       loader=loader, engine=engine, cache=cache,
+                                       changes=ChangeSet(file_paths, modified, states, 0))
+                _print_completed(file_type, stats, incremental=True)
+                results[file_type] = stats
+
+            loader.flush(commit=False)
+            conn.commit()
+            for file_type in SOURCE_DIRS:
+                results[file_type]["merged"] = loader.merged_rows(file_type)
+            results["removed"] = {"files": removed}
+        except BaseException:
+            conn.rollback()
+            print("\nSelective run failed; no changes were committed.")
+            raise
+        finally:
+            conn.close()
+
+    print(f"\nSelective run complete in {datetime.now() - start_time}")
+    return results
+
+
+def run_watch(engine: str = DEFAULT_ENGINE, settle_seconds: float = 2.0,
+              idle_timeout: float = 1.0, use_inotify: bool = True, use_cache: bool = True) -> None:
+    """
+    Continuous ingest: watch the data directories and load new workbooks.
+
+    Existing files are caught up with an incremental pass first. After that
+    each file reported by the watcher is debounced until fully written, then
+    parsed and committed on its own so it shows up on the dashboards within
+    seconds (a zip archive: its new or changed members). Stop with Ctrl-C.
+    """
+    directories = {
+        ATTENDANCE_DIR: "attendance",
+        RISK_ASSESSMENT_DIR: "risk",
+        TBM_DIR: "tbm",
+    }
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # Start watching before the catch-up pass so no arrival is missed
+    watcher = create_watcher(directories, use_inotify=use_inotify)
+    debouncer = Debouncer(settle_seconds)
+    print(f"Watching {len(directories)} directories ({type(watcher).__name__})")
+
+    run_full_etl(reset_db=False, engine=engine, use_cache=use_cache)
+
+    cache = ParseCache() if use_cache else None
+    try:
+        while True:
+            ready = debouncer.wait(watcher, idle_timeout)
+            if ready:
+                _load_watched(ready, directories, engine, cache)
+    except KeyboardInterrupt:
+        print("\nStopping watcher...")
+    finally:
+        watcher.close()
+
+
+def _load_watched(ready: List[Path], directories: Dict[Path, str], engine: str,
+                  cache: Optional[ParseCache]) -> None:
+    """
+    Load one batch of settled files for run_watch.
+
+    The connection is opened per batch under the writer lock: a rebuild
+    swapped in meanwhile (run_etl --reset, an API run) replaces the database
+    file, and a connection kept from before would write into the old one.
+    """
+    with writer_lock(DATABASE_PATH, wait_message="Waiting for another ETL writer to finish..."):
+        conn = sqlite3.connect(str(DATABASE_PATH))
+        loader = BulkLoader(conn)
+        try:
+            for directory, file_type in directories.items():
+                suffixes = PARSERS[file_type].SOURCE_SUFFIXES
+                file_paths = newest_first(file_type, expand_archives(
+                    [path for path in ready if path.parent == directory], suffixes
+                ))
+                if not file_paths:
+                    continue
+                stats = _empty_stats(file_type)
+                _process_files(conn, file_type, file_paths, stats, loader=loader, engine=engine, cache=cache)
+                loader.flush()
+                print(f"[{datetime.now():%H:%M:%S}] {FILE_LABELS[file_type]}: "
+                      f"{_files_loaded(stats)}, {stats['errors']} errors",
+                      flush=True)
+        finally:
+            loader.flush()
+            conn.close()
+
+
+def _yymmdd_arg(value: str):
+    """argparse type for YYMMDD dates."""
+    parsed = parse_yymmdd(value)
+    if parsed is None:
+        raise argparse.ArgumentTypeError(f"expected a YYMMDD date, got '{value}'")
+    return parsed
+
 
 def main():
     """CLI entry point with argument parsing."""
@@ -421,6 +973,15 @@ def main():
 Examples:
   python -m backend.etl.run_etl          # Incremental (new files only)
   python -m backend.etl.run_etl --reset  # Full reset (re-process all)
+  python -m backend.etl.run_etl --reset --workers 8  # Parse with 8 processes
+  python -m backend.etl.run_etl --engine stream      # Streaming xlsx reader
+  python -m backend.etl.run_etl --watch              # Continuous ingest daemon
+  python -m backend.etl.run_etl --tiered             # Metadata first, deep parsing after
+  python -m backend.etl.run_etl --since 250301 --until 250331 --site 부산현장
+                                                     # Reload one site's March files only
+  python -m backend.etl.run_etl --reset --bulk       # Faster rebuild (not resumable after a crash)
+  python -m backend.etl.run_etl --reset --profile    # Per-stage timing report
+  python -m backend.etl.run_etl --partition          # Move processed files into YYYY/MM folders
         """
     )
     parser.add_argument(
@@ -429,8 +990,154 @@ Examples:
         help="Reset database and re-process all files (default: incremental)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of parallel parser processes (default: 1, no pool; at most one per CPU)"
+    )
+
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=DEFAULT_ENGINE,
+        help=f"Workbook reader engine (default: {DEFAULT_ENGINE})"
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and ingest new files as they arrive (inotify, polling fallback)"
+    )
+
+    parser.add_argument(
+        "--tiered",
+        action="store_true",
+        help="Load new risk/TBM files metadata-first (dashboard counts update at once), "
+             "then deep-parse them at lower priority (incremental runs only)"
+    )
+
+    parser.add_argument(
+        "--hot-days",
+        type=int,
+        default=ETL_HOT_WINDOW_DAYS,
+        metavar="N",
+        help=f"Load files dated within the last N days first, for all file types, "
+             f"before older backfill (default: {ETL_HOT_WINDOW_DAYS}, 0 = newest first only)"
+    )
+
+    parser.add_argument(
+        "--since",
+        type=_yymmdd_arg,
+        metavar="YYMMDD",
+        help="Selective run: only files dated on/after this date (risk: period overlaps)"
+    )
+
+    parser.add_argument(
+        "--until",
+        type=_yymmdd_arg,
+        metavar="YYMMDD",
+        help="Selective run: only files dated on/before this date"
+    )
+
+    parser.add_argument(
+        "--site",
+        help="Selective run: only files whose site name contains this text"
+    )
+
+    parser.add_argument(
+        "--partner",
+        help="Selective run: only files whose partner name contains this text"
+    )
+
+    parser.add_argument(
+        "--settle-seconds",
+        type=float,
+        default=2.0,
+        help="--watch: seconds a new file must stay unchanged before ingest (default: 2)"
+    )
+
+    parser.add_argument(
+        "--polling",
+        action="store_true",
+        help="--watch: poll directories instead of using inotify"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse workbooks instead of reusing cached parse results"
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="--reset: discard an interrupted rebuild and start over"
+    )
+
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="--reset: load without journal syncs and build the query indexes at the end "
+             "(faster, but a crashed or killed rebuild starts over instead of resuming)"
+    )
+
+    parser.add_argument(
+        "--partition",
+        action="store_true",
+        help="Move fully processed files into YYYY/MM sub-folders by file name date, "
+             "so later incremental runs only list new arrivals"
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="etl_profile.json",
+        metavar="REPORT_JSON",
+        help="Time each ETL stage, print a report and write it as JSON (default: etl_profile.json)"
+    )
+
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="--profile: number of slowest files listed per type (default: 10)"
+    )
+
     args = parser.parse_args()
-    run_full_etl(reset_db=args.reset)
+    use_cache = not args.no_cache
+    file_filter = FileFilter(args.since, args.until, args.site, args.partner)
+    selective = file_filter != FileFilter()
+    if selective and (args.reset or args.watch or args.tiered):
+        parser.error("--since/--until/--site/--partner cannot be combined with --reset, --watch or --tiered")
+    if args.partition and (selective or args.watch):
+        parser.error("--partition cannot be combined with --watch or a selective run")
+
+    if selective:
+        try:
+            run_selective_etl(file_filter, workers=clamp_workers(args.workers), engine=args.engine, use_cache=use_cache)
+        except KeyboardInterrupt:
+            sys.exit(130)
+    elif args.watch:
+        run_watch(engine=args.engine, settle_seconds=args.settle_seconds, use_inotify=not args.polling,
+                  use_cache=use_cache)
+    else:
+        profile = EtlProfile(top_n=args.profile_top) if args.profile else None
+        try:
+            run_full_etl(reset_db=args.reset, workers=clamp_workers(args.workers), engine=args.engine,
+                         use_cache=use_cache, profile=profile, resume=not args.no_resume, tiered=args.tiered,
+                         hot_days=max(0, args.hot_days), bulk=args.bulk, partition=args.partition)
+        except RuntimeError as e:
+            print(f"\nETL failed: {e}")
+            sys.exit(1)
+        except KeyboardInterrupt:
+            sys.exit(130)
+        if profile is not None:
+            print("\n" + profile.format_table())
+            profile.write_json(Path(args.profile))
+            print(f"\nProfile written to {args.profile}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,128 @@
+"""
+Newest-first scheduling of ETL work.
+
+Source files are ordered by the date in their file name (YYMMDD), newest
+first, so after a large upload today's dashboards fill up before old
+backfill is touched. Files dated within the hot window (the last N days)
+form a first phase that is loaded for all three file types and committed
+before any older file; files without a readable date go last.
+
+FileFilter selects files by the same file name metadata (date window, site,
+partner) for selective re-processing (run_etl --since/--until/--site/--partner).
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from .parallel import PARSERS
+from .utils import normalize_text
+
+
+class Phase(NamedTuple):
+    """Files of each type to load in one scheduling phase, newest first."""
+    name: str  # "hot" or "backfill" ("all" without a hot window)
+    description: str
+    files: Dict[str, List[Path]]  # file_type -> paths
+
+
+class FileFilter(NamedTuple):
+    """Selection of source files by file name metadata (unset fields match everything)."""
+    since: Optional[date] = None
+    until: Optional[date] = None
+    site: Optional[str] = None  # part of the site name
+    partner: Optional[str] = None  # part of the partner name
+
+    def matches(self, meta: Optional[Dict[str, Any]]) -> bool:
+        """Whether a file with this parse_filename() metadata is selected."""
+        if meta is None:
+            return False
+        if self.since or self.until:
+            # Attendance/TBM: the work date; risk: the assessment period overlaps the window
+            first = meta.get("work_date") or meta.get("start_date")
+            last = meta.get("work_date") or meta.get("end_date")
+            if not isinstance(first, date) or not isinstance(last, date):
+                return False
+            if (self.since and last < self.since) or (self.until and first > self.until):
+                return False
+        for wanted, name in ((self.site, meta.get("site_name")), (self.partner, meta.get("partner_name"))):
+            if wanted and normalize_text(wanted).casefold() not in normalize_text(name).casefold():
+                return False
+        return True
+
+    def describe(self) -> str:
+        parts = []
+        if self.since or self.until:
+            parts.append(f"dates {self.since or '...'} to {self.until or '...'}")
+        if self.site:
+            parts.append(f"site '{self.site}'")
+        if self.partner:
+            parts.append(f"partner '{self.partner}'")
+        return ", ".join(parts) or "all files"
+
+
+def file_metadata(file_type: str, file_path: Path) -> Optional[Dict[str, Any]]:
+    """parse_filename() metadata of a file (the file itself is not opened); None if unparseable."""
+    try:
+        return PARSERS[file_type](str(file_path)).parse_filename()
+    except Exception:
+        return None
+
+
+def file_date(file_type: str, file_path: Path) -> Optional[date]:
+    """Date a file's data is for, from its name (risk: end of the assessment period)."""
+    meta = file_metadata(file_type, file_path) or {}
+    value = meta.get("work_date") or meta.get("end_date") or meta.get("start_date")
+    return value if isinstance(value, date) else None
+
+
+def select_files(file_type: str, file_paths: Iterable[Path], file_filter: FileFilter) -> List[Path]:
+    """Files whose name metadata matches file_filter."""
+    return [path for path in file_paths if file_filter.matches(file_metadata(file_type, path))]
+
+
+def newest_first(file_type: str, file_paths: List[Path],
+                 dates: Optional[Dict[Path, Optional[date]]] = None) -> List[Path]:
+    """Files sorted by file name date, newest first (undated files last, by name)."""
+    if dates is None:
+        dates = {path: file_date(file_type, path) for path in file_paths}
+    ordered = sorted(file_paths, key=lambda path: path.name)
+    ordered.sort(key=lambda path: dates[path] or date.min, reverse=True)
+    return ordered
+
+
+def schedule_files(files: Dict[str, List[Path]], hot_days: int = 0,
+                   today: Optional[date] = None) -> List[Phase]:
+    """
+    Split files into scheduling phases.
+
+    Args:
+        files: file_type -> source files
+        hot_days: Size of the hot window in days (0 = no window, one phase)
+        today: Reference date of the window (default: today)
+
+    Returns:
+        The hot phase (if any file is in the window) followed by the
+        backfill phase, each with newest-first file lists per type
+    """
+    dates = {
+        file_type: {path: file_date(file_type, path) for path in paths}
+        for file_type, paths in files.items()
+    }
+    ordered = {file_type: newest_first(file_type, paths, dates[file_type]) for file_type, paths in files.items()}
+    if hot_days <= 0:
+        return [Phase("all", "all files, newest first", ordered)]
+
+    cutoff = (today or date.today()) - timedelta(days=hot_days - 1)
+    hot: Dict[str, List[Path]] = {}
+    backfill: Dict[str, List[Path]] = {}
+    for file_type, paths in ordered.items():
+        in_window = {path: (dates[file_type][path] or date.min) >= cutoff for path in paths}
+        hot[file_type] = [path for path in paths if in_window[path]]
+        backfill[file_type] = [path for path in paths if not in_window[path]]
+
+    phases = []
+    if any(hot.values()):
+        phases.append(Phase("hot", f"hot window: files dated {cutoff.isoformat()} or later", hot))
+    phases.append(Phase("backfill", f"backfill: files dated before {cutoff.isoformat()}", backfill))
+    return phases
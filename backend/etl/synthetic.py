@@ -0,0 +1,274 @@
+"""
+Synthetic workbook corpus for ETL benchmarks.
+
+Generates attendance, risk assessment (최초/수시/정기) and TBM workbooks with
+the file names, sheet names and layouts the parsers expect:
+
+- 출퇴근무사고_<site>_<partner>_YYMMDD.xlsx: header row 14, data from row 15
+  in the fixed AttendanceParser columns, followed by the 사고발생자 명단 block
+- 위험성평가_<site>_<partner>_YYMMDD_YYMMDD_N.xlsx: "N O" header, 위험요인 /
+  개선대책 columns, 조치결과 section (수시/정기) and 12-column worker
+  confirmation blocks (수시)
+- tbm_<site>_<partner>_YYMMDD.xlsx: 작업내용 header and a two-column
+  participant list under 참석자 명단
+
+Usage:
+    python -m backend.etl.synthetic /tmp/corpus --count 500
+    python -m backend.etl.synthetic /tmp/corpus --attendance 2000 --risk 300 --tbm 2000
+"""
+
+import argparse
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from openpyxl import Workbook
+
+# Sub-directories of a data repository (see config.DATA_REPOSITORY)
+TYPE_DIRS = {
+    "attendance": "01_attendance",
+    "risk": "02_risk_assessment",
+    "tbm": "03_tbm",
+}
+
+RISK_TYPES = ("최초", "수시", "정기")
+
+SITES = [
+    "(주)삼천리이에스 안양아삼파워 연료전지 발전사업",
+    "(주)삼천리이에스 삼천리 수원사옥",
+    "(주)테스트건설 부산현장",
+    "(주)한빛엔지니어링 평택물류센터",
+]
+PARTNERS = ["(주)삼천리이에스", "대한전기", "한빛설비", "동해건설", "(주)서울배관"]
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ["철수", "영희", "민수", "지훈", "수진", "동원", "현우", "서연", "미란", "정호", "은지", "태식"]
+POSITIONS = ["전기공", "배관공", "용접공", "비계공", "신호수", "보통인부", "반장"]
+TBM_TASKS = ["배관 설치 작업", "전선 포설 작업", "고소작업대 작업", "자재 양중 작업", "용접 작업"]
+HAZARDS = [
+    ("추락 위험", "안전대 착용 및 안전난간 설치"),
+    ("감전 위험", "정전 작업 및 검전기 확인"),
+    ("협착 위험", "신호수 배치 및 작업반경 통제"),
+    ("화재 위험", "소화기 비치 및 불티 비산방지포 설치"),
+    ("낙하물 위험", "안전모 착용 및 하부 출입통제"),
+    ("전도 위험", "통로 정리정돈 및 자재 적치 구역 지정"),
+]
+
+
+class SheetBuilder:
+    """
+    Collects cells by (row, column) and saves them as a single-sheet workbook.
+
+    A regular (not write-only) workbook is used so the sheet gets a
+    <dimension> element like the exported files the parsers read.
+    """
+
+    def __init__(self):
+        self.cells: Dict[Tuple[int, int], Any] = {}
+
+    def set(self, row: int, col: int, value: Any) -> None:
+        self.cells[(row, col)] = value
+
+    def save(self, path: Path, title: str) -> None:
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = title
+        for (row, col), value in self.cells.items():
+            worksheet.cell(row=row, column=col, value=value)
+        workbook.save(path)
+
+
+def _worker_name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+
+
+def write_attendance(path: Path, rng: random.Random, workers: int) -> int:
+    """Write an attendance workbook. Returns the number of worker rows."""
+    sheet = SheetBuilder()
+    sheet.set(2, 2, "출퇴근 무사고 확인서")
+    for col, label in [(2, "NO"), (3, "구분"), (5, "이름"), (8, "직책∙직종"), (11, "생년월일"),
+                       (14, "휴대폰 번호"), (17, "출근 시간"), (20, "퇴근 시간"), (23, "상태")]:
+        sheet.set(14, col, label)
+
+    for i in range(workers):
+        row = 15 + i
+        sheet.set(row, 2, str(i + 1))
+        sheet.set(row, 3, "관리자" if i == 0 else "근로자")
+        sheet.set(row, 5, _worker_name(rng))
+        sheet.set(row, 8, rng.choice(POSITIONS))
+        sheet.set(row, 11, f"{rng.randint(50, 99):02d}.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}")
+        sheet.set(row, 14, f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}")
+        sheet.set(row, 17, f"07:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}")
+        sheet.set(row, 20, rng.choice(["17:00:00", "17:30:00", "-"]))
+        sheet.set(row, 23, "사고" if rng.random() < 0.05 else "무사고")
+
+    sheet.set(15 + workers + 1, 2, "사고발생자 명단")
+    sheet.save(path, "출퇴근 무사고 확인서")
+    return workers
+
+
+def write_tbm(path: Path, rng: random.Random, participants: int) -> int:
+    """Write a TBM workbook. Returns the number of participants."""
+    sheet = SheetBuilder()
+    sheet.set(1, 1, "TBM 활동일지")
+    sheet.set(4, 1, "작업내용")
+    sheet.set(4, 6, rng.choice(TBM_TASKS))
+    sheet.set(6, 1, "위험요인")
+    sheet.set(7, 1, rng.choice(HAZARDS)[0])
+    sheet.set(12, 1, "참석자 명단")
+    sheet.set(13, 1, "NO")
+    sheet.set(13, 11, "이름")
+    sheet.set(13, 25, "NO")
+    sheet.set(13, 35, "이름")
+
+    for i in range(participants):
+        row = 14 + i // 2
+        no_col, name_col = (1, 11) if i % 2 == 0 else (25, 35)
+        sheet.set(row, no_col, i + 1)
+        sheet.set(row, name_col, _worker_name(rng))
+
+    sheet.save(path, "TBM 활동일지")
+    return participants
+
+
+def write_risk(path: Path, rng: random.Random, risk_type: str, items: int, workers: int) -> int:
+    """Write a risk assessment workbook. Returns items + confirmations."""
+    sheet = SheetBuilder()
+    sheet.set(1, 1, f"{risk_type} 위험성 평가표")
+    sheet.set(6, 1, "N O")
+    sheet.set(6, 8, "위험요인")
+    sheet.set(6, 25, "개선대책")
+
+    row = 7
+    for i in range(items):
+        hazard, measure = rng.choice(HAZARDS)
+        sheet.set(row, 1, i + 1)
+        sheet.set(row, 8, f"{hazard} ({i + 1})")
+        sheet.set(row, 25, measure)
+        row += 1
+
+    row += 1
+    sheet.set(row, 1, "추가 위험 요인")
+    row += 2
+
+    if risk_type != "최초":
+        actions = rng.randint(1, 3)
+        sheet.set(row, 1, "조 치 결 과 (위 험 성 평 가 이 행 확 인)")
+        row += 1
+        sheet.set(row, 1, "\n".join(f"{n}번 조치결과" for n in range(1, actions + 1)))
+        row += 1
+        for _ in range(actions):
+            sheet.set(row, 3, f"등록일: 2025-02-0{rng.randint(1, 9)} 등록자: {_worker_name(rng)} 내용: 조치완료")
+            row += 1
+        row += 1
+
+    confirmations = 0
+    if risk_type == "수시":
+        sheet.set(row, 1, "위험성평가 근로자 확인")
+        row += 1
+        for base_col in range(1, 61, 12):
+            sheet.set(row, base_col, "직종")
+            sheet.set(row, base_col + 4, "이름")
+            sheet.set(row, base_col + 8, "서명")
+        row += 1
+        for i in range(workers):
+            base_col = 1 + 12 * (i % 5)
+            sheet.set(row + i // 5, base_col, rng.choice(POSITIONS))
+            sheet.set(row + i // 5, base_col + 4, _worker_name(rng))
+        confirmations = workers
+
+    sheet.save(path, f"{risk_type} 위험성 평가표")
+    return items + confirmations
+
+
+def generate_corpus(root: Path, attendance: int = 100, risk: int = 30, tbm: int = 100,
+                    seed: int = 1, start: date = date(2025, 1, 1), days: int = 90,
+                    rows: Tuple[int, int] = (5, 40)) -> Dict[str, Dict[str, int]]:
+    """
+    Generate a data repository under root.
+
+    Consecutive files go to different site/partner pairs, so even a small
+    corpus spans every site and partner; each pair's files are spread over
+    the work dates start .. start+days (past it once a pair has more files
+    than days). Worker names are drawn at random, so a sheet may list a
+    name twice, as real sheets do. Row counts are drawn from the rows
+    range. The same arguments always produce the same corpus.
+
+    Returns:
+        {file_type: {"files": n, "rows": expected parsed rows}}
+    """
+    root = Path(root)
+    rng = random.Random(seed)
+    for sub in TYPE_DIRS.values():
+        (root / sub).mkdir(parents=True, exist_ok=True)
+
+    combos = len(SITES) * len(PARTNERS)
+
+    def slot(i: int, total: int) -> Tuple[str, str, date]:
+        # Round-robin over site/partner pairs (site and partner both change
+        # from one file to the next); the n-th file of a pair gets the n-th of
+        # its evenly spaced dates, so (pair, date) and file names stay unique
+        turn, combo = divmod(i, combos)
+        site = combo % len(SITES)
+        partner = (combo // len(SITES) + site) % len(PARTNERS)
+        per_pair = -(-total // combos)
+        day = turn * days // per_pair if per_pair <= days else turn
+        return SITES[site], PARTNERS[partner], start + timedelta(days=day)
+
+    summary = {file_type: {"files": 0, "rows": 0} for file_type in TYPE_DIRS}
+
+    for i in range(attendance):
+        site, partner, work_date = slot(i, attendance)
+        path = root / TYPE_DIRS["attendance"] / f"출퇴근무사고_{site}_{partner}_{work_date:%y%m%d}.xlsx"
+        summary["attendance"]["rows"] += write_attendance(path, rng, rng.randint(*rows))
+        summary["attendance"]["files"] += 1
+
+    for i in range(tbm):
+        site, partner, work_date = slot(i, tbm)
+        path = root / TYPE_DIRS["tbm"] / f"tbm_{site}_{partner}_{work_date:%y%m%d}.xlsx"
+        summary["tbm"]["rows"] += write_tbm(path, rng, rng.randint(*rows))
+        summary["tbm"]["files"] += 1
+
+    for i in range(risk):
+        site, partner, start_date = slot(i, risk)
+        end_date = start_date + timedelta(days=6)
+        path = (root / TYPE_DIRS["risk"] /
+                f"위험성평가_{site}_{partner}_{start_date:%y%m%d}_{end_date:%y%m%d}_{i % 2}.xlsx")
+        risk_type = RISK_TYPES[i % len(RISK_TYPES)]
+        summary["risk"]["rows"] += write_risk(path, rng, risk_type, rng.randint(3, 25), rng.randint(*rows))
+        summary["risk"]["files"] += 1
+
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic xlsx corpus for ETL benchmarks")
+    parser.add_argument("output", type=Path, help="Target data repository directory")
+    parser.add_argument("--count", type=int, default=None, metavar="N",
+                        help="Files per type (overridden by --attendance/--risk/--tbm)")
+    parser.add_argument("--attendance", type=int, default=None, metavar="N")
+    parser.add_argument("--risk", type=int, default=None, metavar="N")
+    parser.add_argument("--tbm", type=int, default=None, metavar="N")
+    parser.add_argument("--min-rows", type=int, default=5)
+    parser.add_argument("--max-rows", type=int, default=40)
+    parser.add_argument("--days", type=int, default=90, help="Spread of work dates (default: 90)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    count = args.count if args.count is not None else 100
+    summary = generate_corpus(
+        args.output,
+        attendance=args.attendance if args.attendance is not None else count,
+        risk=args.risk if args.risk is not None else count,
+        tbm=args.tbm if args.tbm is not None else count,
+        seed=args.seed,
+        days=args.days,
+        rows=(args.min_rows, args.max_rows),
+    )
+    for file_type, entry in summary.items():
+        print(f"{file_type:<12}{entry['files']:>8} files{entry['rows']:>10} rows")
+    print(f"Corpus written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
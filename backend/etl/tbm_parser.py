@@ -10,20 +10,33 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .base_parser import BaseExcelParser
+from .csv_reader import CSV_DELIMITERS
+from .profiling import profiled
+from .records import TbmParticipant
+from .templates import Signature, row_signature
 from .utils import (
     parse_yymmdd,
     normalize_text,
-    clean_cell_value
+    clean_cell_value,
+    strip_upload_counter
 )
 
 
 class TbmParser(BaseExcelParser):
     """Parser for TBM Excel files."""
 
+    PARSER_VERSION = 5  # 2: duplicate-upload counter stripped from file names
+                        # 3: rows as record NamedTuples (see records)
+                        # 4: header row and columns located by label (layout templates)
+                        # 5: layout templates per parser version
+    FILE_TYPE = "tbm"
+    SOURCE_SUFFIXES = (".xlsx",) + tuple(CSV_DELIMITERS)  # CSV/TSV exports of the sheet too
     SHEET_NAME = "TBM"  # Will match "TBM 활동일지" etc.
     METADATA_ROWS = 12
     DATA_START_ROW = 14
+    RECORDS_PER_ROW = 2  # two name columns per row
 
+    @profiled("parse_filename")
     def parse_filename(self) -> Dict[str, Any]:
         """
         Parse filename to extract metadata.
@@ -35,8 +48,8 @@ class TbmParser(BaseExcelParser):
         # Remove the prefix (case-insensitive)
         name = re.sub(r'^tbm_', '', basename, flags=re.IGNORECASE)
 
-        # Split by underscore
-        parts = name.split("_")
+        # Split by underscore (ignoring a duplicate-upload counter)
+        parts = strip_upload_counter(name.split("_"))
 
         # Last part is the date (YYMMDD)
         date_str = parts[-1] if parts else ""
@@ -54,13 +67,14 @@ class TbmParser(BaseExcelParser):
             "partner_name": partner_name
         }
 
+    @profiled("metadata")
     def extract_metadata(self) -> Dict[str, Any]:
         """Extract metadata from header rows."""
         content = ""
 
         # Look for "작업내용" label and get its value
-        for row in range(1, min(12, self.worksheet.max_row + 1)):
-            for col in range(1, min(10, self.worksheet.max_column + 1)):
+        for row in range(1, min(12, self.max_row + 1)):
+            for col in range(1, min(10, self.max_column + 1)):
                 value = self.get_cell_value(row, col)
                 if value and isinstance(value, str):
                     text = value.strip()
@@ -75,7 +89,7 @@ class TbmParser(BaseExcelParser):
 
         # If no content found, try to get 위험요인
         if not content:
-            for row in range(1, min(12, self.worksheet.max_row + 1)):
+            for row in range(1, min(12, self.max_row + 1)):
                 value = self.get_cell_value(row, 1)
                 if value and isinstance(value, str) and "위험요인" in value:
                     # Get next row's content
@@ -86,14 +100,15 @@ class TbmParser(BaseExcelParser):
 
         return {"content": content}
 
+    @profiled("header_discovery")
     def _find_participant_header(self) -> tuple:
         """Find the header row and all name columns."""
         header_row = None
         name_columns = []
 
         # Scan for all "이름" columns in the header area
-        for row in range(1, min(20, self.worksheet.max_row + 1)):
-            for col in range(1, min(50, self.worksheet.max_column + 1)):
+        for row in range(1, min(20, self.max_row + 1)):
+            for col in range(1, min(50, self.max_column + 1)):
                 value = self.get_cell_value(row, col)
                 if value and isinstance(value, str):
                     text = value.strip()
@@ -107,7 +122,7 @@ class TbmParser(BaseExcelParser):
             return header_row, name_columns
 
         # Fallback: look for "참석자 명단" and assume structure
-        for row in range(1, min(20, self.worksheet.max_row + 1)):
+        for row in range(1, min(20, self.max_row + 1)):
             value = self.get_cell_value(row, 1)
             if value and isinstance(value, str) and "참석자" in value:
                 # Header row is next row, name columns at 11 and 35
@@ -115,14 +130,24 @@ class TbmParser(BaseExcelParser):
 
         return self.DATA_START_ROW - 1, [11, 35]
 
-    def extract_data_rows(self) -> List[Dict[str, Any]]:
+    def discover_layout(self) -> Dict[str, Any]:
+        header_row, name_columns = self._find_participant_header()
+        return {"header_row": header_row, "name_columns": name_columns}
+
+    def layout_signature(self, layout: Dict[str, Any]) -> Signature:
+        # The participant header row (NO/이름 labels)
+        return row_signature(self.grid, layout["header_row"])
+
+    @profiled("row_extraction")
+    def extract_data_rows(self) -> List[TbmParticipant]:
         """Extract TBM participant data from the worksheet."""
         participants = []
 
-        header_row, name_columns = self._find_participant_header()
+        layout = self.layout  # cached template positions, or _find_participant_header()
+        header_row, name_columns = layout["header_row"], layout["name_columns"]
         data_start = header_row + 1
 
-        for row in range(data_start, self.worksheet.max_row + 1):
+        for row in range(data_start, self.max_row + 1):
             # Check each name column (supports multi-column layout)
             for name_col in name_columns:
                 worker_name = clean_cell_value(self.get_cell_value(row, name_col))
@@ -142,9 +167,7 @@ class TbmParser(BaseExcelParser):
                 if len(worker_name.strip()) < 2:
                     continue
 
-                participants.append({
-                    "worker_name": worker_name.strip()
-                })
+                participants.append(TbmParticipant(worker_name.strip()))
 
         return participants
 
@@ -0,0 +1,175 @@
+"""
+Layout templates: cached header/column positions per workbook template.
+
+Files exported from the same template share their layout, so the positions
+a parser discovers by scanning (header row, name/risk/measure columns) are
+stored under a fingerprint of the layout:
+
+    file type + parser version + sheet name + column count + signature
+
+where the signature is the label cells the positions were found from, as
+(row, col, text). The next file with the same sheet name and width is checked against the
+stored signature by reading just those cells; on a match the cached
+positions are used and discovery is skipped. Unknown layouts are scanned
+as before and recorded, so a new or changed template shows up as a new
+fingerprint (printed by the ETL and kept with first/last file and file
+counts in a registry next to the database, see templates_path). Templates
+of another parser version are ignored, so a parser change that alters
+discovery starts from fresh templates.
+
+Parsers only read the registry (and learn new templates in memory for the
+rest of their process); the ETL writer records templates of loaded files
+and saves the registry.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from backend.config import LAYOUT_TEMPLATES_PATH
+
+Signature = Tuple[Tuple[int, int, str], ...]
+
+
+class LayoutTemplate(NamedTuple):
+    """Discovered layout of one workbook template."""
+    fingerprint: str
+    file_type: str
+    parser_version: int
+    sheet_name: str
+    max_column: int
+    signature: Signature  # label cells (row, col, text) the layout was found from
+    layout: Dict[str, Any]  # parser-specific positions
+
+
+def templates_path(database_path: Path) -> Path:
+    """Registry file of a database (in its directory, shared with its rebuild file)."""
+    return Path(database_path).parent / LAYOUT_TEMPLATES_PATH.name
+
+
+def layout_fingerprint(file_type: str, parser_version: int, sheet_name: str, max_column: int,
+                       signature: Signature) -> str:
+    """Stable short id of a layout."""
+    key = json.dumps([file_type, parser_version, sheet_name, max_column, [list(cell) for cell in signature]],
+                     ensure_ascii=False)
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def row_signature(grid: List[tuple], row: int, max_col: int = 49) -> Signature:
+    """Non-empty text cells of a row (1-indexed) up to max_col, as a signature."""
+    if not 0 < row <= len(grid):
+        return ()
+    return tuple(
+        (row, col, value.strip())
+        for col, value in enumerate(grid[row - 1][:max_col], 1)
+        if isinstance(value, str) and value.strip()
+    )
+
+
+def matches(grid: List[tuple], signature: Signature) -> bool:
+    """Whether every signature cell holds the same text in this grid."""
+    for row, col, text in signature:
+        if not 0 < row <= len(grid):
+            return False
+        values = grid[row - 1]
+        value = values[col - 1] if 0 < col <= len(values) else None
+        if not isinstance(value, str) or value.strip() != text:
+            return False
+    return True
+
+
+class TemplateRegistry:
+    """Known layout templates (persisted as JSON) plus templates learned in this process."""
+
+    def __init__(self, path: Path = LAYOUT_TEMPLATES_PATH):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}  # fingerprint -> persisted entry
+        self._learned: Dict[str, LayoutTemplate] = {}
+        self._dirty = False
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    @staticmethod
+    def _from_entry(fingerprint: str, entry: Dict[str, Any]) -> LayoutTemplate:
+        return LayoutTemplate(
+            fingerprint, entry["file_type"], entry.get("parser_version", 0), entry["sheet_name"],
+            entry["max_column"], tuple(tuple(cell) for cell in entry["signature"]), entry["layout"],
+        )
+
+    def candidates(self, file_type: str, parser_version: int, sheet_name: str,
+                   max_column: int) -> List[LayoutTemplate]:
+        """Templates that could match a sheet (same type and parser version, sheet name and width)."""
+        templates = {fp: self._from_entry(fp, entry) for fp, entry in self.entries.items()}
+        templates.update(self._learned)
+        key = (file_type, parser_version, sheet_name, max_column)
+        return [t for t in templates.values()
+                if (t.file_type, t.parser_version, t.sheet_name, t.max_column) == key]
+
+    def learn(self, template: LayoutTemplate) -> None:
+        """Remember a discovered template for the following files of this process."""
+        self._learned[template.fingerprint] = template
+
+    def record(self, info: Optional[Dict[str, Any]], filename: str) -> bool:
+        """
+        Record the template a loaded file used (parsed["template"]).
+
+        Returns True if the fingerprint was not known before.
+        """
+        if not info:
+            return False
+        now = datetime.now().isoformat(timespec="seconds")
+        entry = self.entries.get(info["fingerprint"])
+        self._dirty = True
+        if entry is not None:
+            entry["files"] += 1
+            entry["last_file"] = filename
+            entry["last_seen"] = now
+            return False
+
+        self.entries[info["fingerprint"]] = {
+            "file_type": info["file_type"],
+            "parser_version": info["parser_version"],
+            "sheet_name": info["sheet_name"],
+            "max_column": info["max_column"],
+            "signature": [list(cell) for cell in info["signature"]],
+            "layout": info["layout"],
+            "files": 1,
+            "first_file": filename,
+            "first_seen": now,
+            "last_file": filename,
+            "last_seen": now,
+        }
+        return True
+
+    def save(self) -> None:
+        """Write the registry if it changed (atomic rename)."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._dirty = False
+
+
+_registries: Dict[Path, TemplateRegistry] = {}
+
+
+def get_registry(path: Path = LAYOUT_TEMPLATES_PATH) -> TemplateRegistry:
+    """Process-wide registry of a registry file (loaded on first use)."""
+    path = Path(path)
+    registry = _registries.get(path)
+    if registry is None:
+        registry = _registries[path] = TemplateRegistry(path)
+    return registry
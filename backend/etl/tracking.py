@@ -0,0 +1,140 @@
+"""
+Change detection for incremental ETL runs.
+
+processed_files stores size, mtime and a content hash per file. A stat
+check settles unchanged files; the hash is computed only when the stat
+differs, so a touched-but-identical file is not re-parsed while a corrected
+re-upload under the same name is.
+
+processed_files also records how far a file was parsed: tiered runs load
+risk/TBM files metadata-first (PARSE_STAGE_METADATA) and complete them in a
+later deep-parsing stage (PARSE_STAGE_FULL).
+
+Members of zip archives (see archives.py) are tracked like files: their
+stat part is the member size and the archive mtime, their hash is over the
+member content.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .archives import ArchiveMember, SourcePath
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Filenames per query when looking up the recorded state of listed files
+STATE_QUERY_CHUNK = 500
+
+# processed_files.parse_stage values
+PARSE_STAGE_METADATA = "metadata"  # file name metadata loaded, deep parsing pending
+PARSE_STAGE_FULL = "full"
+
+
+class FileState(NamedTuple):
+    """Stat and content fingerprint of a source file."""
+    file_size: int
+    mtime_ns: int
+    content_hash: Optional[str]
+
+
+class ChangeSet(NamedTuple):
+    """Result of comparing a directory listing against processed_files."""
+    pending: List[Path]  # new or modified files to parse
+    modified: Set[str]  # filenames whose old rows must be replaced
+    states: Dict[str, FileState]  # filename -> current state (pending files only)
+    skipped: int  # unchanged files
+
+
+def content_hash(file_path: SourcePath) -> str:
+    """BLAKE2b digest of a file's (or archive member's) content."""
+    digest = hashlib.blake2b(digest_size=20)
+    with (file_path.open() if isinstance(file_path, ArchiveMember) else open(file_path, "rb")) as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stat_state(file_path: SourcePath) -> FileState:
+    """File state from stat() only (content_hash not computed)."""
+    if isinstance(file_path, ArchiveMember):
+        return FileState(file_path.file_size(), file_path.archive.stat().st_mtime_ns, None)
+    st = file_path.stat()
+    return FileState(st.st_size, st.st_mtime_ns, None)
+
+
+def get_file_states(conn: sqlite3.Connection, file_type: str,
+                    filenames: Optional[Iterable[str]] = None) -> Dict[str, FileState]:
+    """
+    Get recorded state of already processed files for a given type (only of
+    filenames if given, so a run that lists a few new arrivals does not
+    load the state of every file ever processed).
+    """
+    sql = "SELECT filename, file_size, mtime_ns, content_hash FROM processed_files WHERE file_type = ?"
+    if filenames is None:
+        rows = conn.execute(sql, (file_type,)).fetchall()
+    else:
+        names = list(filenames)
+        rows = []
+        for start in range(0, len(names), STATE_QUERY_CHUNK):
+            chunk = names[start:start + STATE_QUERY_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            rows += conn.execute(f"{sql} AND filename IN ({placeholders})", (file_type, *chunk)).fetchall()
+    return {row[0]: FileState(row[1], row[2], row[3]) for row in rows}
+
+
+def get_pending_files(conn: sqlite3.Connection, file_type: str) -> List[str]:
+    """Files of a type loaded metadata-first whose deep parsing is still pending."""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT filename FROM processed_files WHERE file_type = ? AND parse_stage = ? ORDER BY id",
+        (file_type, PARSE_STAGE_METADATA)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def update_file_state(conn: sqlite3.Connection, filename: str, state: FileState) -> None:
+    """Refresh the recorded stat/hash of a file without reprocessing it."""
+    conn.execute(
+        "UPDATE processed_files SET file_size = ?, mtime_ns = ?, content_hash = ? WHERE filename = ?",
+        (state.file_size, state.mtime_ns, state.content_hash, filename)
+    )
+
+
+def detect_changes(conn: sqlite3.Connection, file_type: str, file_paths: Iterable[Path],
+                   incremental: bool = True) -> ChangeSet:
+    """
+    Split files into unchanged (skipped), new and modified.
+
+    Files processed before change tracking existed have no recorded hash;
+    they are treated as unchanged and their current state is adopted.
+    """
+    file_paths = list(file_paths)
+    known = get_file_states(conn, file_type, [path.name for path in file_paths]) if incremental else {}
+    pending: List[Path] = []
+    modified: Set[str] = set()
+    states: Dict[str, FileState] = {}
+    skipped = 0
+
+    for file_path in file_paths:
+        current = stat_state(file_path)
+        previous = known.get(file_path.name)
+
+        if previous is not None and previous[:2] == current[:2]:
+            skipped += 1
+            continue
+
+        current = current._replace(content_hash=content_hash(file_path))
+
+        if previous is not None and previous.content_hash in (None, current.content_hash):
+            update_file_state(conn, file_path.name, current)
+            skipped += 1
+            continue
+
+        if previous is not None:
+            modified.add(file_path.name)
+        pending.append(file_path)
+        states[file_path.name] = current
+
+    return ChangeSet(pending, modified, states, skipped)
@@ -4,7 +4,7 @@ ETL utility functions for date parsing and text normalization
 
 import re
 from datetime import date, datetime, time
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 
 def parse_yymmdd(date_str: str) -> Optional[date]:
@@ -134,6 +134,25 @@ def normalize_text(text: Optional[str]) -> str:
     return text
 
 
+def strip_upload_counter(parts: List[str], fixed_tail: int = 0) -> List[str]:
+    """
+    Drop the counter of a duplicate upload from underscore-split filename parts.
+
+    Re-uploaded files get a numeric suffix after the date
+    (..._250614_1.xlsx next to ..._250614.xlsx). fixed_tail is the number of
+    numeric parts that normally follow the last date (1 for the risk
+    document index).
+    """
+    if len(parts) < 4 + fixed_tail:
+        return parts
+    counter, tail, date_part = parts[-1], parts[-1 - fixed_tail:-1], parts[-2 - fixed_tail]
+    is_counter = counter.isdigit() and parse_yymmdd(counter) is None
+    tail_ok = all(p.isdigit() and parse_yymmdd(p) is None for p in tail)
+    if is_counter and tail_ok and parse_yymmdd(date_part) is not None:
+        return parts[:-1]
+    return parts
+
+
 def extract_site_name(filename: str) -> str:
     """Extract site name from filename pattern."""
     # Pattern: 출퇴근무사고_(주)삼천리이에스 안양아삼파워 연료전지 발전사업_(주)삼천리이에스_250227.xlsx
@@ -0,0 +1,200 @@
+"""
+File system watching for the continuous ingest mode of run_etl.
+
+Uses Linux inotify (via ctypes, no extra dependency) and falls back to
+polling directory listings where inotify is unavailable. Reported paths go
+through a Debouncer that waits until a file's size and mtime have settled
+and, for workbooks and zip archives of source files, the file is a complete
+zip archive, so partial uploads are never handed to the parsers.
+"""
+
+import os
+import select
+import struct
+import sys
+import time
+import zipfile
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from .archives import ARCHIVE_SUFFIXES
+from .csv_reader import CSV_DELIMITERS
+
+# inotify event masks (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+
+INOTIFY_EVENT = struct.Struct("iIII")
+
+# Files still not a valid zip after this long are handed over anyway so the
+# parser reports the error instead of the file waiting forever
+INVALID_FILE_GRACE_SECONDS = 60.0
+
+# Source file suffixes watched (workbooks, CSV/TSV exports and zip archives of them)
+WATCHED_SUFFIXES = (".xlsx",) + tuple(CSV_DELIMITERS) + ARCHIVE_SUFFIXES
+
+# Suffixes of files that are complete only once they are a valid zip archive
+ZIP_SUFFIXES = (".xlsx",) + ARCHIVE_SUFFIXES
+
+
+def is_candidate(path: Path, suffixes: Tuple[str, ...] = WATCHED_SUFFIXES) -> bool:
+    """Whether a path looks like an input file (not a temp/lock file)."""
+    return path.suffix.lower() in suffixes and not path.name.startswith(("~$", "."))
+
+
+class PollingWatcher:
+    """Detects new or changed files by comparing directory snapshots."""
+
+    def __init__(self, directories: Iterable[Path]):
+        self.directories = list(directories)
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for directory in self.directories:
+            try:
+                entries = os.scandir(directory)
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_file():
+                        st = entry.stat()
+                        snapshot[Path(entry.path)] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def read_events(self, timeout: float) -> List[Path]:
+        """Sleep for timeout, then return paths that appeared or changed."""
+        time.sleep(timeout)
+        snapshot = self._scan()
+        changed = [path for path, state in snapshot.items() if self._snapshot.get(path) != state]
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Reports files closed after writing or moved into the watched directories."""
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO
+
+    def __init__(self, directories: Iterable[Path]):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.directories: Dict[int, Path] = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), self.MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                os.close(self._fd)
+                raise OSError(error, f"inotify_add_watch failed for {directory}")
+            self.directories[wd] = Path(directory)
+
+        # Fallback for queue overflows: rescan with a polling snapshot
+        self._poller = PollingWatcher(self.directories.values())
+
+    def read_events(self, timeout: float) -> List[Path]:
+        """Wait up to timeout seconds and return the paths reported by inotify."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                paths.extend(self._poller.read_events(0))
+            elif name and wd in self.directories:
+                paths.append(self.directories[wd] / os.fsdecode(name))
+        return paths
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def create_watcher(directories: Iterable[Path], use_inotify: bool = True):
+    """Create an inotify watcher on Linux, falling back to polling."""
+    directories = list(directories)
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError) as e:
+            print(f"Warning: inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(directories)
+
+
+class Debouncer:
+    """Holds reported files until they stop changing and are complete archives."""
+
+    def __init__(self, settle_seconds: float = 2.0):
+        self.settle_seconds = settle_seconds
+        # path -> (size, mtime_ns, first seen with this state)
+        self._pending: Dict[Path, Tuple[int, int, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, path: Path) -> None:
+        """Start (or keep) tracking a reported path."""
+        if path not in self._pending:
+            self._pending[path] = (-1, -1, time.monotonic())
+
+    def next_timeout(self, default: float) -> float:
+        """Seconds until the next pending file could be ready."""
+        if not self._pending:
+            return default
+        now = time.monotonic()
+        soonest = min(since + self.settle_seconds - now for _, _, since in self._pending.values())
+        if soonest <= 0:
+            # Settled but not yet a valid archive: re-check at the idle pace
+            return default
+        return max(0.05, min(default, soonest))
+
+    def pop_ready(self) -> List[Path]:
+        """Return files whose size and mtime have been stable for settle_seconds."""
+        now = time.monotonic()
+        ready = []
+        for path, (size, mtime_ns, since) in list(self._pending.items()):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                del self._pending[path]
+                continue
+
+            if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                self._pending[path] = (st.st_size, st.st_mtime_ns, now)
+                continue
+
+            settled_for = now - since
+            if settled_for < self.settle_seconds:
+                continue
+            complete = path.suffix.lower() not in ZIP_SUFFIXES or zipfile.is_zipfile(path)
+            if complete or settled_for >= INVALID_FILE_GRACE_SECONDS:
+                del self._pending[path]
+                ready.append(path)
+        return ready
+
+    def wait(self, watcher, idle_timeout: float = 1.0) -> List[Path]:
+        """Collect events for one loop iteration and return files ready for ingest."""
+        for path in watcher.read_events(self.next_timeout(idle_timeout)):
+            if is_candidate(path):
+                self.add(path)
+        return self.pop_ready()
@@ -0,0 +1,349 @@
+"""
+Lightweight streaming reader for .xlsx workbooks.
+
+Reads worksheet XML and shared strings straight from the zip archive with an
+incremental XML parser and returns cell values only - no styles, merged
+cells or cell objects. It mirrors the small part of openpyxl's read-only
+API that BaseExcelParser uses (sheetnames, workbook[name], active, title,
+max_row/max_column, reset_dimensions, iter_rows(values_only=True), close)
+and produces the same values as load_workbook(read_only=True, data_only=True).
+"""
+
+import posixpath
+import zipfile
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, Union
+from xml.etree.ElementTree import fromstring, iterparse
+
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+
+SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+DOC_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+ROW_TAG = SHEET_NS + "row"
+CELL_TAG = SHEET_NS + "c"
+VALUE_TAG = SHEET_NS + "v"
+INLINE_STRING_TAG = SHEET_NS + "is"
+TEXT_TAG = SHEET_NS + "t"
+RUN_TAG = SHEET_NS + "r"
+DIMENSION_TAG = SHEET_NS + "dimension"
+SHEET_DATA_TAG = SHEET_NS + "sheetData"
+
+SHARED_STRINGS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings"
+STYLES_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
+
+_column_cache: Dict[str, int] = {}
+
+
+def column_index(letters: str) -> int:
+    """Convert column letters (e.g. 'AB') to a 1-indexed column number."""
+    index = _column_cache.get(letters)
+    if index is None:
+        index = 0
+        for char in letters:
+            index = index * 26 + (ord(char) - 64)
+        _column_cache[letters] = index
+    return index
+
+
+def split_reference(ref: str) -> Tuple[int, int]:
+    """Split a cell reference like 'C14' into (row, column)."""
+    letters = ref.rstrip("0123456789")
+    return int(ref[len(letters):]), column_index(letters)
+
+
+def parse_dimension(ref: str) -> Optional[Tuple[int, int]]:
+    """Return (max_row, max_column) from a dimension ref like 'A1:X50'."""
+    last = ref.split(":")[-1].replace("$", "")
+    try:
+        return split_reference(last)
+    except ValueError:
+        return None
+
+
+def _text_content(node) -> str:
+    """Concatenate plain and rich-text runs of an <si>/<is> node (phonetic runs ignored)."""
+    snippets = []
+    plain = node.find(TEXT_TAG)
+    if plain is not None and plain.text is not None:
+        snippets.append(plain.text)
+    for run in node.iterfind(RUN_TAG):
+        text = run.find(TEXT_TAG)
+        if text is not None and text.text is not None:
+            snippets.append(text.text)
+    return "".join(snippets)
+
+
+def _cast_number(value: str):
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+class XlsxWorksheet:
+    """A worksheet whose rows are streamed from the archive on demand."""
+
+    def __init__(self, workbook: "XlsxWorkbook", title: str, path: str):
+        self.parent = workbook
+        self.title = title
+        self._path = path
+        self._dimension: Optional[Tuple[int, int]] = None
+        self._dimension_read = False
+
+    def _read_dimension(self) -> Optional[Tuple[int, int]]:
+        if not self._dimension_read:
+            self._dimension_read = True
+            with self.parent._archive.open(self._path) as source:
+                for _event, element in iterparse(source, events=("start",)):
+                    if element.tag == DIMENSION_TAG:
+                        self._dimension = parse_dimension(element.get("ref", ""))
+                        break
+                    if element.tag == SHEET_DATA_TAG:
+                        break
+        return self._dimension
+
+    @property
+    def max_row(self) -> Optional[int]:
+        dimension = self._read_dimension()
+        return dimension[0] if dimension else None
+
+    @property
+    def max_column(self) -> Optional[int]:
+        dimension = self._read_dimension()
+        return dimension[1] if dimension else None
+
+    def reset_dimensions(self) -> None:
+        """Ignore the declared dimension (rows are then not padded out to it)."""
+        self._dimension = None
+        self._dimension_read = True
+
+    def last_value_row(self) -> int:
+        """
+        Number of the last row holding a cell value (0 if none), from the
+        sheet data rather than the declared dimension; values are not decoded.
+        """
+        last = 0
+        row_counter = 0
+        with self.parent._archive.open(self._path) as source:
+            for _event, element in iterparse(source):
+                if element.tag != ROW_TAG:
+                    continue
+                row_ref = element.get("r")
+                row_counter = int(float(row_ref)) if row_ref else row_counter + 1
+                for cell in element.iterfind(CELL_TAG):
+                    if cell.find(VALUE_TAG) is not None or cell.find(INLINE_STRING_TAG) is not None:
+                        last = row_counter
+                        break
+                element.clear()
+        return last
+
+    def _parse_rows(self) -> Iterator[Tuple[int, List[Tuple[int, Any]]]]:
+        """Yield (row_number, [(column, value), ...]) for each <row> element."""
+        shared_strings = self.parent.shared_strings
+        date_styles = self.parent.date_styles
+        epoch = self.parent.epoch
+        row_counter = 0
+
+        with self.parent._archive.open(self._path) as source:
+            for _event, element in iterparse(source):
+                if element.tag != ROW_TAG:
+                    continue
+
+                row_ref = element.get("r")
+                row_counter = int(float(row_ref)) if row_ref else row_counter + 1
+                col_counter = 0
+                cells = []
+
+                for cell in element.iterfind(CELL_TAG):
+                    ref = cell.get("r")
+                    if ref:
+                        col_counter = column_index(ref.rstrip("0123456789"))
+                    else:
+                        col_counter += 1
+
+                    data_type = cell.get("t", "n")
+                    value = None
+                    if data_type == "inlineStr":
+                        inline = cell.find(INLINE_STRING_TAG)
+                        if inline is not None:
+                            value = _text_content(inline)
+                    else:
+                        node = cell.find(VALUE_TAG)
+                        raw = node.text if node is not None else None
+                        if raw:
+                            if data_type == "n":
+                                value = _cast_number(raw)
+                                style = cell.get("s")
+                                if style and int(style) in date_styles:
+                                    try:
+                                        value = from_excel(value, epoch)
+                                    except (OverflowError, ValueError):
+                                        value = "#VALUE!"
+                            elif data_type == "s":
+                                value = shared_strings[int(raw)]
+                            elif data_type == "b":
+                                value = bool(int(raw))
+                            elif data_type == "d":
+                                value = from_ISO8601(raw)
+                            else:
+                                value = raw
+                    cells.append((col_counter, value))
+
+                element.clear()
+                yield row_counter, cells
+
+    def iter_rows(self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+                  min_col: Optional[int] = None, max_col: Optional[int] = None,
+                  values_only: bool = False) -> Iterator[Tuple[Any, ...]]:
+        """Yield row value tuples, filling missing rows/cells with None."""
+        if not values_only:
+            raise ValueError("XlsxWorksheet only supports values_only=True")
+
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.max_row
+        max_col = max_col or self.max_column
+        empty_row: Tuple[Any, ...] = ()
+        if max_col is not None:
+            empty_row = (None,) * (max_col + 1 - min_col)
+
+        counter = min_row
+        for row_number, cells in self._parse_rows():
+            if max_row is not None and row_number > max_row:
+                break
+
+            while counter < row_number:
+                counter += 1
+                yield empty_row
+
+            if counter <= row_number:
+                counter += 1
+                if not cells and not max_col:
+                    yield ()
+                    continue
+                last_col = max_col or cells[-1][0]
+                values = [None] * (last_col + 1 - min_col)
+                for column, value in cells:
+                    if min_col <= column <= last_col:
+                        values[column - min_col] = value
+                yield tuple(values)
+
+        if max_row is not None:
+            while counter <= max_row:
+                counter += 1
+                yield empty_row
+
+
+class XlsxWorkbook:
+    """Minimal read-only workbook backed directly by the zip archive."""
+
+    def __init__(self, file_path: Union[str, BinaryIO], read_values: bool = True):
+        # A path, or a seekable binary file (workbooks read from inside a zip archive)
+        self._archive = zipfile.ZipFile(file_path)
+        try:
+            self._load(read_values)
+        except Exception:
+            self._archive.close()
+            raise
+
+    def _read_rels(self, part_path: str) -> Dict[str, Tuple[str, str]]:
+        """Return {rel_id: (type, absolute_target)} for a part's relationships."""
+        folder, name = posixpath.split(part_path)
+        try:
+            source = self._archive.read(posixpath.join(folder, "_rels", name + ".rels"))
+        except KeyError:
+            return {}
+        rels = {}
+        for rel in fromstring(source).iter(PKG_REL_NS + "Relationship"):
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target.lstrip("/")
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            rels[rel.get("Id")] = (rel.get("Type", ""), target)
+        return rels
+
+    def _load(self, read_values: bool = True) -> None:
+        root_rels = self._read_rels("")
+        workbook_path = next(
+            (target for rel_type, target in root_rels.values() if rel_type.endswith("/officeDocument")),
+            "xl/workbook.xml"
+        )
+        rels = self._read_rels(workbook_path)
+        root = fromstring(self._archive.read(workbook_path))
+
+        workbook_pr = root.find(SHEET_NS + "workbookPr")
+        date1904 = workbook_pr is not None and workbook_pr.get("date1904") in ("1", "true")
+        self.epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        self._sheets: List[XlsxWorksheet] = []
+        for sheet in root.iter(SHEET_NS + "sheet"):
+            _rel_type, target = rels.get(sheet.get(DOC_REL_NS + "id"), ("", ""))
+            self._sheets.append(XlsxWorksheet(self, sheet.get("name", ""), target))
+
+        self._active_index = 0
+        for view in root.iter(SHEET_NS + "workbookView"):
+            if view.get("activeTab") is not None:
+                self._active_index = int(view.get("activeTab"))
+                break
+
+        # Shared strings and styles are only needed to read cell values; without
+        # them just the sheet structure (names, dimensions) is available
+        self.shared_strings: List[str] = []
+        self.date_styles: Set[int] = set()
+        if not read_values:
+            return
+        for rel_type, target in rels.values():
+            if rel_type == SHARED_STRINGS_REL:
+                self.shared_strings = self._read_shared_strings(target)
+            elif rel_type == STYLES_REL:
+                self.date_styles = self._read_date_styles(target)
+
+    def _read_shared_strings(self, path: str) -> List[str]:
+        strings = []
+        si_tag = SHEET_NS + "si"
+        with self._archive.open(path) as source:
+            for _event, element in iterparse(source):
+                if element.tag == si_tag:
+                    strings.append(_text_content(element).replace("x005F_", ""))
+                    element.clear()
+        return strings
+
+    def _read_date_styles(self, path: str) -> Set[int]:
+        """Indexes of cellXfs entries whose number format is a date/time format."""
+        root = fromstring(self._archive.read(path))
+        custom_formats = {
+            int(fmt.get("numFmtId")): fmt.get("formatCode")
+            for fmt in root.iter(SHEET_NS + "numFmt")
+        }
+        date_styles = set()
+        cell_xfs = root.find(SHEET_NS + "cellXfs")
+        if cell_xfs is None:
+            return date_styles
+        for index, xf in enumerate(cell_xfs.iterfind(SHEET_NS + "xf")):
+            fmt_id = int(xf.get("numFmtId", 0))
+            fmt = custom_formats.get(fmt_id, BUILTIN_FORMATS.get(fmt_id))
+            if is_date_format(fmt):
+                date_styles.add(index)
+        return date_styles
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return [sheet.title for sheet in self._sheets]
+
+    def __getitem__(self, name: str) -> XlsxWorksheet:
+        for sheet in self._sheets:
+            if sheet.title == name:
+                return sheet
+        raise KeyError(f"Worksheet {name} does not exist.")
+
+    @property
+    def active(self) -> Optional[XlsxWorksheet]:
+        try:
+            return self._sheets[self._active_index]
+        except IndexError:
+            return None
+
+    def close(self) -> None:
+        self._archive.close()
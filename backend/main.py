@@ -5,16 +5,30 @@ Run with:
     uvicorn backend.main:app --reload --port 8000
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.config import API_PREFIX, CORS_ORIGINS
-from backend.api.routes import master, dashboard, risk, tbm
+from backend.config import API_PREFIX, CORS_ORIGINS, DATABASE_PATH
+from backend.database.schema import init_db
+from backend.api.routes import master, dashboard, risk, tbm, etl
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Bring the database schema up to date before serving requests."""
+    # The services query columns added after the initial schema; a database
+    # last written by an older ETL (or copied from another host) is migrated here
+    init_db(DATABASE_PATH)
+    yield
+
 
 app = FastAPI(
     title="HyunJangTong 2.0 API",
     description="Construction Site Safety Management API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for frontend development
@@ -31,6 +45,7 @@ app.include_router(master.router, prefix=API_PREFIX, tags=["Master Data"])
 app.include_router(dashboard.router, prefix=f"{API_PREFIX}/dashboard", tags=["Dashboard"])
 app.include_router(risk.router, prefix=f"{API_PREFIX}/risk", tags=["Risk Assessment"])
 app.include_router(tbm.router, prefix=f"{API_PREFIX}/tbm", tags=["TBM"])
+app.include_router(etl.router, prefix=f"{API_PREFIX}/etl", tags=["ETL"])
 
 
 @app.get("/")
@@ -0,0 +1,408 @@
+"""
+ETL service for background ETL runs and file uploads started from the API
+
+A run executes run_full_etl in a separate process (spawned, so it does not
+inherit the server's threads or open connections), which reports progress
+through a queue after every file. A monitor thread in the API process
+drains the queue into the run's status, so request handlers only read
+in-memory state and never wait on the ETL. One run may be active at a time,
+and none is started while another process (a CLI run, the watcher) holds
+the database writer lock.
+
+Uploaded workbooks are stored in the data repository (so later runs and
+rebuilds see them), parsed in a long-lived process pool and loaded
+incrementally into the live database. Uploads are refused while a run is
+active, since a full run would swap in a database without them, and wait
+only briefly for the writer lock (see database.writer_lock) held by CLI
+runs and the watcher.
+"""
+
+import multiprocessing
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import ATTENDANCE_DIR, DATABASE_PATH, ETL_HOT_WINDOW_DAYS, RISK_ASSESSMENT_DIR, TBM_DIR
+from backend.api.schemas.etl import (
+    EtlRunStatus,
+    EtlTypeProgress,
+    PendingFile,
+    PendingFilesResponse,
+    UploadFileResult,
+    UploadResponse,
+)
+from backend.database.schema import init_db
+from backend.database.writer_lock import WriterLockTimeout, writer_lock, writer_lock_busy
+from backend.etl.loader import BulkLoader
+from backend.etl.parallel import PARSERS, clamp_workers
+from backend.etl.parse_cache import ParseCache
+from backend.etl.run_etl import load_files, run_full_etl
+from backend.etl.tracking import PARSE_STAGE_METADATA
+
+# Finished runs kept for GET /api/etl/runs/{id}
+MAX_RUN_HISTORY = 20
+
+# Upload file name prefix -> (file_type, data repository directory)
+UPLOAD_TYPES = [
+    ("출퇴근무사고_", "attendance", ATTENDANCE_DIR),
+    ("위험성평가_", "risk", RISK_ASSESSMENT_DIR),
+    ("tbm_", "tbm", TBM_DIR),
+]
+# Accepted suffixes (CSV/TSV only for the types whose parser reads them)
+UPLOAD_EXTENSIONS = {suffix for parser in PARSERS.values() for suffix in parser.SOURCE_SUFFIXES}
+
+# Parser processes of the upload pool
+UPLOAD_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# Seconds an upload waits for another writer (e.g. a watcher batch) before it is refused
+UPLOAD_LOCK_TIMEOUT = 10.0
+
+_context = multiprocessing.get_context("spawn")
+_lock = threading.Lock()
+_runs: Dict[str, "EtlRun"] = {}
+_active_run_id: Optional[str] = None
+_uploads_active = 0
+
+_upload_lock = threading.Lock()  # one upload load at a time (single writer)
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+class EtlBusyError(RuntimeError):
+    """Raised when the ETL writer is busy (a run or an upload is in progress)."""
+
+
+class EtlRunActiveError(EtlBusyError):
+    """Raised when a run or upload is requested while a run is in progress."""
+
+    def __init__(self, run_id: str):
+        super().__init__(f"ETL run {run_id} is already in progress")
+        self.run_id = run_id
+
+
+def _etl_process(events: Any, reset_db: bool, workers: int, tiered: bool = False,
+                 hot_days: int = ETL_HOT_WINDOW_DAYS) -> None:
+    """Child process: run the ETL and report progress/result through the events queue."""
+    def progress(file_type: str, stats: Dict[str, int], total: int) -> None:
+        events.put(("progress", file_type, dict(stats), total))
+
+    try:
+        result = run_full_etl(reset_db=reset_db, workers=workers, progress=progress, tiered=tiered,
+                              hot_days=hot_days)
+    except BaseException as e:
+        events.put(("failed", f"{type(e).__name__}: {e}"))
+    else:
+        # Progress reports lag the merge by up to one batch; send the final totals
+        events.put(("merged", {file_type: result[file_type]["merged"] for file_type in PARSERS}))
+        events.put(("completed",))
+
+
+class EtlRun:
+    """State of one background run, updated by its monitor thread."""
+
+    def __init__(self, mode: str, workers: int, tiered: bool = False, hot_days: int = ETL_HOT_WINDOW_DAYS):
+        self.id = uuid.uuid4().hex[:12]
+        self.mode = mode
+        self.workers = workers
+        self.tiered = tiered
+        self.status = "running"
+        self.started_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+        self.types: Dict[str, EtlTypeProgress] = {}
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+        self._elapsed: Optional[float] = None
+        self._queue = _context.Queue()
+        self._process = _context.Process(
+            target=_etl_process, args=(self._queue, mode == "full", workers, tiered, hot_days),
+            name=f"etl-run-{self.id}"
+        )
+
+    def start(self) -> None:
+        self._process.start()
+        threading.Thread(target=self._monitor, name=f"etl-monitor-{self.id}", daemon=True).start()
+
+    def _monitor(self) -> None:
+        """Apply progress messages until the run reports its result or dies."""
+        while True:
+            try:
+                message = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+                self._finish("failed", f"ETL process exited with code {self._process.exitcode}")
+                break
+
+            if message[0] == "progress":
+                _kind, file_type, stats, total = message
+                self.types[file_type] = EtlTypeProgress(
+                    files_total=total,
+                    files_done=stats["files"],
+                    rows=stats.get("records", 0) + stats.get("items", 0) + stats.get("confirmations", 0),
+                    rows_merged=stats.get("merged", 0),
+                    errors=stats["errors"],
+                    skipped=stats["skipped"],
+                    updated=stats["updated"],
+                )
+            elif message[0] == "merged":
+                for file_type, rows in message[1].items():
+                    self.types.setdefault(file_type, EtlTypeProgress()).rows_merged = rows
+            else:
+                self._finish(message[0], message[1] if len(message) > 1 else None)
+                break
+
+        self._process.join()
+
+    def _finish(self, status: str, error: Optional[str] = None) -> None:
+        global _active_run_id
+        self._elapsed = time.perf_counter() - self._started
+        self.finished_at = datetime.now()
+        self.error = error
+        self.status = status
+        with _lock:
+            if _active_run_id == self.id:
+                _active_run_id = None
+
+    def to_status(self) -> EtlRunStatus:
+        elapsed = self._elapsed if self._elapsed is not None else time.perf_counter() - self._started
+        types = dict(self.types)
+        files_done = sum(t.files_done for t in types.values())
+        rows = sum(t.rows_merged for t in types.values())
+        return EtlRunStatus(
+            id=self.id,
+            mode=self.mode,
+            workers=self.workers,
+            tiered=self.tiered,
+            status=self.status,
+            started_at=self.started_at.isoformat(timespec="seconds"),
+            finished_at=self.finished_at.isoformat(timespec="seconds") if self.finished_at else None,
+            elapsed_seconds=round(elapsed, 3),
+            types=types,
+            files_done=files_done,
+            rows_inserted=rows,
+            errors=sum(t.errors for t in types.values()),
+            files_per_sec=round(files_done / elapsed, 2) if elapsed else 0.0,
+            rows_per_sec=round(rows / elapsed, 2) if elapsed else 0.0,
+            error=self.error,
+        )
+
+
+def start_etl_run(mode: str, workers: int = 1, tiered: bool = False,
+                  hot_days: Optional[int] = None) -> EtlRunStatus:
+    """
+    Start an ETL run in a background process.
+
+    Args:
+        mode: "incremental" (new/modified files) or "full" (shadow rebuild)
+        workers: Parser processes used by the run (clamped to 1..MAX_WORKERS)
+        tiered: Incremental runs: load risk/TBM metadata first, deep-parse after
+        hot_days: Files dated within the last hot_days days are loaded before
+                  older ones (default: ETL_HOT_WINDOW_DAYS)
+
+    Raises:
+        EtlRunActiveError: another run is still in progress
+        EtlBusyError: an upload is being loaded, or another process holds the
+                      database writer lock
+    """
+    global _active_run_id
+    with _lock:
+        if _active_run_id is not None:
+            raise EtlRunActiveError(_active_run_id)
+        if _uploads_active:
+            raise EtlBusyError("An upload is being loaded; try again shortly")
+        if writer_lock_busy(DATABASE_PATH):
+            raise EtlBusyError("The database is being written by another ETL process "
+                               "(CLI run or watcher); try again later")
+
+        if hot_days is None:
+            hot_days = ETL_HOT_WINDOW_DAYS
+        run = EtlRun(mode, clamp_workers(workers), tiered and mode == "incremental", max(0, hot_days))
+        run.start()
+        _active_run_id = run.id
+        _runs[run.id] = run
+
+        # Forget the oldest finished runs
+        finished: List[str] = [run_id for run_id, r in _runs.items() if r.status != "running"]
+        for run_id in finished[:max(0, len(_runs) - MAX_RUN_HISTORY)]:
+            del _runs[run_id]
+
+    return run.to_status()
+
+
+def get_etl_run(run_id: str) -> Optional[EtlRunStatus]:
+    """Status of a run, or None if it is unknown."""
+    run = _runs.get(run_id)
+    return run.to_status() if run else None
+
+
+def get_pending_files(file_type: Optional[str] = None, limit: int = 100) -> PendingFilesResponse:
+    """Files loaded metadata-first by a tiered run that still await deep parsing."""
+    conn = sqlite3.connect(str(DATABASE_PATH))
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    try:
+        where = "WHERE parse_stage = ?"
+        params: List[Any] = [PARSE_STAGE_METADATA]
+        if file_type:
+            where += " AND file_type = ?"
+            params.append(file_type)
+
+        cursor.execute(f"SELECT COUNT(*) FROM processed_files {where}", params)
+        total = cursor.fetchone()[0]
+        cursor.execute(f"""
+            SELECT filename, file_type, row_count, processed_at
+            FROM processed_files
+            {where}
+            ORDER BY id
+            LIMIT ?
+        """, params + [limit])
+
+        return PendingFilesResponse(
+            files=[
+                PendingFile(
+                    filename=row["filename"],
+                    file_type=row["file_type"],
+                    row_count=row["row_count"],
+                    processed_at=row["processed_at"]
+                )
+                for row in cursor.fetchall()
+            ],
+            total=total
+        )
+
+    finally:
+        conn.close()
+
+
+def detect_upload_type(filename: str) -> Optional[Tuple[str, Path]]:
+    """(file_type, target directory) for an upload file name, or None."""
+    for prefix, file_type, directory in UPLOAD_TYPES:
+        if filename.lower().startswith(prefix):
+            return file_type, directory
+    return None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Upload parser pool, started on first use and kept for later requests."""
+    global _parse_pool
+    # A pool that lost a worker is broken for good (BrokenProcessPool); replace it
+    if _parse_pool is not None and getattr(_parse_pool, "_broken", False):
+        _parse_pool.shutdown(wait=False)
+        _parse_pool = None
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=UPLOAD_WORKERS, mp_context=_context)
+    return _parse_pool
+
+
+def _save_upload(directory: Path, filename: str, content: bytes) -> Path:
+    """Write an upload into the data repository (atomic rename over an existing file)."""
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / filename
+    tmp = directory / f".{filename}.upload"
+    tmp.write_bytes(content)
+    os.replace(tmp, target)
+    return target
+
+
+def ingest_uploads(files: List[Tuple[str, bytes]]) -> UploadResponse:
+    """
+    Store uploaded workbooks and load them into the database.
+
+    The file type comes from the file name prefix (출퇴근무사고_, 위험성평가_,
+    tbm_). New files are loaded, re-uploads with changed content replace the
+    rows of the previous version and identical re-uploads are skipped.
+
+    Args:
+        files: (file name, content) per uploaded file
+
+    Raises:
+        EtlBusyError: an ETL run is in progress, or another process kept the
+                      database writer lock past UPLOAD_LOCK_TIMEOUT
+    """
+    global _uploads_active
+    started = time.perf_counter()
+    results: List[UploadFileResult] = []
+    accepted: Dict[str, Dict[str, Tuple[Path, bytes]]] = {}  # file_type -> name -> (dir, content)
+
+    for raw_name, content in files:
+        filename = Path(raw_name or "").name  # drop any client-side directories
+        detected = detect_upload_type(filename)
+        if Path(filename).suffix.lower() not in UPLOAD_EXTENSIONS:
+            results.append(UploadFileResult(filename=filename, status="rejected",
+                                            error=f"Unsupported file type (expected {', '.join(sorted(UPLOAD_EXTENSIONS))})"))
+        elif detected is None:
+            results.append(UploadFileResult(filename=filename, status="rejected",
+                                            error="Unknown file name prefix (expected 출퇴근무사고_, 위험성평가_ or tbm_)"))
+        elif Path(filename).suffix.lower() not in PARSERS[detected[0]].SOURCE_SUFFIXES:
+            expected = ", ".join(PARSERS[detected[0]].SOURCE_SUFFIXES)
+            results.append(UploadFileResult(filename=filename, status="rejected",
+                                            error=f"Unsupported file type for {detected[0]} files (expected {expected})"))
+        else:
+            file_type, directory = detected
+            accepted.setdefault(file_type, {})[filename] = (directory, content)
+
+    if accepted:
+        with _lock:
+            if _active_run_id is not None:
+                raise EtlRunActiveError(_active_run_id)
+            _uploads_active += 1
+        try:
+            with _upload_lock, writer_lock(DATABASE_PATH, timeout=UPLOAD_LOCK_TIMEOUT):
+                results.extend(_load_uploads(accepted))
+        except WriterLockTimeout as e:
+            raise EtlBusyError(f"{e}; try again shortly") from e
+        finally:
+            with _lock:
+                _uploads_active -= 1
+
+    return UploadResponse(
+        files=results,
+        loaded=sum(1 for r in results if r.status in ("loaded", "updated")),
+        errors=sum(1 for r in results if r.status in ("error", "rejected")),
+        elapsed_seconds=round(time.perf_counter() - started, 3),
+    )
+
+
+def _load_uploads(accepted: Dict[str, Dict[str, Tuple[Path, bytes]]]) -> List[UploadFileResult]:
+    """
+    Save accepted uploads and load them per type through one loader.
+
+    A file that fails to load is taken out of the data repository again (or
+    its previous version put back), so later runs do not keep failing on it.
+    """
+    init_db(DATABASE_PATH)
+    cache = ParseCache()
+    pool = _get_parse_pool()
+
+    conn = sqlite3.connect(str(DATABASE_PATH))
+    try:
+        loader = BulkLoader(conn)
+        results: List[UploadFileResult] = []
+        for file_type, uploads in accepted.items():
+            previous: Dict[str, Optional[bytes]] = {}
+            paths = []
+            for name, (directory, content) in uploads.items():
+                target = directory / name
+                previous[name] = target.read_bytes() if target.exists() else None
+                paths.append(_save_upload(directory, name, content))
+
+            for result in load_files(conn, file_type, paths, loader, workers=UPLOAD_WORKERS,
+                                     cache=cache, executor=pool):
+                results.append(UploadFileResult(**result))
+                if result["status"] == "error":
+                    directory = uploads[result["filename"]][0]
+                    if previous[result["filename"]] is None:
+                        (directory / result["filename"]).unlink(missing_ok=True)
+                    else:
+                        _save_upload(directory, result["filename"], previous[result["filename"]])
+        loader.flush()
+        return results
+    finally:
+        conn.close()
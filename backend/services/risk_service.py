@@ -127,6 +127,20 @@ def get_risk_summary(
         # Count participating companies
         summary.participating_companies = len(rows)
 
+        # Item rows of documents loaded metadata-first, estimated until the deep stage parses them
+        pending_query = """
+            SELECT COALESCE(SUM(pf.row_count), 0) as estimate
+            FROM processed_files pf
+            WHERE pf.parse_stage = 'metadata'
+              AND pf.filename IN (
+                  SELECT d.filename FROM risk_docs d
+                  WHERE d.start_date <= ? AND d.end_date >= ?{site_filter}
+              )
+        """.format(site_filter=" AND d.site_id = ?" if site_id else "")
+        params = [end_date.isoformat(), start_date.isoformat()] + ([site_id] if site_id else [])
+        cursor.execute(pending_query, params)
+        summary.pending_risk_factors_estimate = cursor.fetchone()["estimate"]
+
         # Generate chart data for date range
         chart_data = []
         current_date = start_date
@@ -194,7 +208,11 @@ def get_risk_documents(
                 d.start_date,
                 d.end_date,
                 d.filename,
-                COUNT(i.id) as item_count
+                COUNT(i.id) as item_count,
+                EXISTS (
+                    SELECT 1 FROM processed_files pf
+                    WHERE pf.filename = d.filename AND pf.parse_stage = 'metadata'
+                ) as parse_pending
             FROM risk_docs d
             JOIN sites s ON d.site_id = s.id
             JOIN partners p ON d.partner_id = p.id
@@ -219,7 +237,8 @@ def get_risk_documents(
                 start_date=row["start_date"],
                 end_date=row["end_date"],
                 filename=row["filename"],
-                item_count=row["item_count"] or 0
+                item_count=row["item_count"] or 0,
+                parse_pending=bool(row["parse_pending"])
             )
             for row in cursor.fetchall()
         ]
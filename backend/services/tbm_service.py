@@ -121,6 +121,20 @@ def get_tbm_summary(
         if total_attendance > 0:
             summary.participation_rate = round(summary.total_tbm_attendees / total_attendance * 100, 1)
 
+        # Attendees of logs loaded metadata-first, estimated until the deep stage parses them
+        pending_query = """
+            SELECT COALESCE(SUM(pf.row_count), 0) as estimate
+            FROM processed_files pf
+            WHERE pf.parse_stage = 'metadata'
+              AND pf.filename IN (
+                  SELECT t.source_file FROM tbm_logs t
+                  WHERE t.work_date BETWEEN ? AND ?{site_filter}
+              )
+        """.format(site_filter=" AND t.site_id = ?" if site_id else "")
+        params = [start_date.isoformat(), end_date.isoformat()] + ([site_id] if site_id else [])
+        cursor.execute(pending_query, params)
+        summary.pending_attendees_estimate = cursor.fetchone()["estimate"]
+
         return TbmSummaryResponse(summary=summary, rows=rows)
 
     finally:
@@ -146,7 +160,11 @@ def get_tbm_logs(
                 s.name as site_name,
                 p.name as partner_name,
                 t.content,
-                COUNT(tp.id) as participant_count
+                COUNT(tp.id) as participant_count,
+                EXISTS (
+                    SELECT 1 FROM processed_files pf
+                    WHERE pf.filename = t.source_file AND pf.parse_stage = 'metadata'
+                ) as parse_pending
             FROM tbm_logs t
             JOIN sites s ON t.site_id = s.id
             JOIN partners p ON t.partner_id = p.id
@@ -169,7 +187,8 @@ def get_tbm_logs(
                 site_name=row["site_name"],
                 partner_name=row["partner_name"],
                 content=row["content"],
-                participant_count=row["participant_count"] or 0
+                participant_count=row["participant_count"] or 0,
+                parse_pending=bool(row["parse_pending"])
             )
             for row in cursor.fetchall()
         ]
@@ -0,0 +1,107 @@
+"""
+Source files read straight from zip archives (see backend.etl.archives).
+"""
+
+import random
+import sqlite3
+import zipfile
+
+import pytest
+
+from backend.etl.archives import UTF8_NAME_FLAG, list_members, source_path
+from backend.etl.parallel import PARSERS
+from backend.etl.run_etl import run_full_etl
+from backend.etl.synthetic import TYPE_DIRS, write_tbm
+
+TBM_NAME = "tbm_(주)삼천리이에스 삼천리 수원사옥_대한전기_250301.xlsx"
+
+
+class LegacyZipInfo(zipfile.ZipInfo):
+    """ZipInfo whose name is stored in a legacy encoding, without the UTF-8 flag."""
+
+    encoding = "cp949"
+
+    def _encodeFilenameFlags(self):
+        return self.filename.encode(self.encoding), self.flag_bits & ~UTF8_NAME_FLAG
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    root = tmp_path / "data"
+    for sub in TYPE_DIRS.values():
+        (root / sub).mkdir(parents=True)
+    return root
+
+
+def _legacy_archive(path, name, content, encoding):
+    info = LegacyZipInfo(name)
+    info.encoding = encoding
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(info, content)
+    with zipfile.ZipFile(path) as zf:
+        assert not zf.infolist()[0].flag_bits & UTF8_NAME_FLAG
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp949"])
+def test_member_names_without_utf8_flag_are_decoded(tmp_path, data_dir, encoding):
+    workbook = tmp_path / TBM_NAME
+    write_tbm(workbook, random.Random(1), 6)
+    archive = data_dir / TYPE_DIRS["tbm"] / "batch.zip"
+    _legacy_archive(archive, TBM_NAME, workbook.read_bytes(), encoding)
+
+    members = list_members(archive, PARSERS["tbm"].SOURCE_SUFFIXES)
+    assert [member.name for member in members] == [f"batch.zip::{TBM_NAME}"]
+
+    # Parser workers get the string form (decoded name) and find the raw entry
+    parsed = PARSERS["tbm"](str(source_path(str(members[0])))).run()
+    assert parsed["metadata"]["site_name"] == "(주)삼천리이에스 삼천리 수원사옥"
+    assert parsed["metadata"]["partner_name"] == "대한전기"
+    assert parsed["records"] == PARSERS["tbm"](str(workbook)).run()["records"]
+
+    db_path = tmp_path / "safety.db"
+    run_full_etl(database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        assert conn.execute("SELECT name FROM sites").fetchall() == [("(주)삼천리이에스 삼천리 수원사옥",)]
+        assert conn.execute("SELECT name FROM partners").fetchall() == [("대한전기",)]
+        assert conn.execute("SELECT filename FROM processed_files").fetchall() == [(f"batch.zip::{TBM_NAME}",)]
+    finally:
+        conn.close()
+
+
+def _archive(path, members):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+
+
+def test_rewritten_archive_loads_only_changed_members(tmp_path, data_dir):
+    contents = {}
+    for seed, day in enumerate([1, 2, 3, 2], start=1):
+        workbook = tmp_path / f"v{seed}.xlsx"
+        write_tbm(workbook, random.Random(seed), 6)
+        contents[seed] = workbook.read_bytes()
+    names = [f"tbm_현장A_업체B_25030{day}.xlsx" for day in (1, 2, 3)]
+    archive = data_dir / TYPE_DIRS["tbm"] / "batch.zip"
+    db_path = tmp_path / "safety.db"
+    options = dict(database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+
+    _archive(archive, {names[0]: contents[1], names[1]: contents[2]})
+    assert run_full_etl(**options)["tbm"]["files"] == 2
+
+    # Same first member, a new version of the second, a third one added
+    _archive(archive, {names[0]: contents[1], names[1]: contents[4], names[2]: contents[3]})
+    stats = run_full_etl(**options)["tbm"]
+
+    assert (stats["files"], stats["updated"], stats["skipped"]) == (2, 1, 1)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        loaded = dict(conn.execute(
+            "SELECT t.source_file, COUNT(p.id) FROM tbm_logs t JOIN tbm_participants p ON p.tbm_id = t.id "
+            "GROUP BY t.source_file"
+        ).fetchall())
+    finally:
+        conn.close()
+    expected = {name: len(PARSERS["tbm"](str(tmp_path / f"v{seed}.xlsx")).run()["records"])
+                for name, seed in zip(names, (1, 4, 3))}
+    assert loaded == {f"batch.zip::{name}": count for name, count in expected.items()}
@@ -0,0 +1,42 @@
+"""
+A default (journaled) rebuild that dies mid-way is resumed; a bulk rebuild,
+which is opt-in, starts over.
+"""
+
+import random
+import sqlite3
+
+import pytest
+
+from backend.database.shadow import REBUILD_BUILDING, REBUILD_BULK_LOADING, read_rebuild_state, shadow_path
+from backend.etl.run_etl import run_full_etl
+from backend.etl.synthetic import TYPE_DIRS, write_attendance
+
+
+def _crash_after_first_file(file_type, stats, total):
+    if stats["files"]:
+        raise RuntimeError("simulated crash")
+
+
+@pytest.mark.parametrize("bulk, state", [(False, REBUILD_BUILDING), (True, REBUILD_BULK_LOADING)],
+                         ids=["journaled", "bulk"])
+def test_crashed_rebuild_state(tmp_path, bulk, state):
+    data_dir = tmp_path / "data"
+    directory = data_dir / TYPE_DIRS["attendance"]
+    directory.mkdir(parents=True)
+    for day in range(1, 4):
+        write_attendance(directory / f"출퇴근무사고_현장A_업체B_2503{day:02d}.xlsx", random.Random(day), 5)
+    db_path = tmp_path / "safety.db"
+    options = dict(reset_db=True, database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+
+    with pytest.raises(RuntimeError):
+        run_full_etl(bulk=bulk, progress=_crash_after_first_file, **options)
+    assert read_rebuild_state(shadow_path(db_path))["status"] == state
+
+    run_full_etl(**options)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM processed_files").fetchone()[0] == 3
+    finally:
+        conn.close()
+    assert not shadow_path(db_path).exists()
@@ -0,0 +1,82 @@
+"""
+Incremental runs load new files, re-load modified ones and report them apart.
+"""
+
+import os
+import random
+import sqlite3
+
+from backend.etl.run_etl import run_full_etl
+from backend.etl.synthetic import TYPE_DIRS, write_attendance
+from backend.etl.tracking import detect_changes, get_file_states
+
+
+def _setup(tmp_path):
+    data_dir = tmp_path / "data"
+    directory = data_dir / TYPE_DIRS["attendance"]
+    directory.mkdir(parents=True)
+    return data_dir, directory, tmp_path / "safety.db"
+
+
+def _run(data_dir, db_path):
+    return run_full_etl(database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+
+
+def test_new_and_updated_files_reported_separately(tmp_path, capsys):
+    data_dir, directory, db_path = _setup(tmp_path)
+    first = directory / "출퇴근무사고_현장A_업체B_250301.xlsx"
+    write_attendance(first, random.Random(1), 5)
+    write_attendance(directory / "출퇴근무사고_현장A_업체B_250302.xlsx", random.Random(2), 5)
+    _run(data_dir, db_path)
+    capsys.readouterr()
+
+    write_attendance(first, random.Random(3), 5)
+    write_attendance(directory / "출퇴근무사고_현장A_업체B_250303.xlsx", random.Random(4), 5)
+    stats = _run(data_dir, db_path)["attendance"]
+
+    assert (stats["files"], stats["updated"], stats["skipped"]) == (2, 1, 1)
+    out = capsys.readouterr().out
+    assert "Completed attendance: 1 new files, 1 updated" in out
+    assert "Attendance: 1 new files, 1 updated" in out
+
+
+def test_detect_changes_by_stat_then_content(tmp_path):
+    data_dir, directory, db_path = _setup(tmp_path)
+    paths = [directory / f"출퇴근무사고_현장A_업체B_25030{day}.xlsx" for day in (1, 2, 3)]
+    for seed, path in enumerate(paths):
+        write_attendance(path, random.Random(seed), 5)
+    _run(data_dir, db_path)
+
+    unchanged, touched, modified = paths
+    os.utime(touched, ns=(1, 1))  # same content, new mtime
+    write_attendance(modified, random.Random(9), 5)
+    arrival = directory / "출퇴근무사고_현장A_업체B_250304.xlsx"
+    write_attendance(arrival, random.Random(4), 5)
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        changes = detect_changes(conn, "attendance", paths + [arrival])
+        state = get_file_states(conn, "attendance", [touched.name])[touched.name]
+    finally:
+        conn.close()
+
+    assert changes.skipped == 2
+    assert [path.name for path in changes.pending] == [modified.name, arrival.name]
+    assert changes.modified == {modified.name}
+    assert state.mtime_ns == 1  # touched file's new state adopted without reloading
+
+
+def test_modified_file_rows_replaced(tmp_path):
+    data_dir, directory, db_path = _setup(tmp_path)
+    path = directory / "출퇴근무사고_현장A_업체B_250301.xlsx"
+    write_attendance(path, random.Random(1), 5)
+    _run(data_dir, db_path)
+    write_attendance(path, random.Random(2), 8)
+    _run(data_dir, db_path)
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        count = conn.execute("SELECT COUNT(*) FROM attendance_logs WHERE source_file = ?", (path.name,)).fetchone()[0]
+    finally:
+        conn.close()
+    assert count == 8
@@ -0,0 +1,61 @@
+"""
+A duplicate upload (..._1.xlsx) merged into the rows of the original file
+must not keep the original's old rows alive once the original is modified.
+"""
+
+import random
+import shutil
+import sqlite3
+
+import pytest
+
+from backend.etl.parallel import PARSERS
+from backend.etl.run_etl import run_full_etl
+from backend.etl.synthetic import TYPE_DIRS, write_attendance, write_tbm
+
+STEM = "{prefix}_현장A_업체B_250301"
+
+
+def _run(data_dir, db_path):
+    run_full_etl(database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+
+
+def _parse(file_type, path):
+    return PARSERS[file_type](str(path)).run()["records"]
+
+
+@pytest.mark.parametrize("duplicate_later", [False, True], ids=["same-run", "later-run"])
+@pytest.mark.parametrize("file_type, prefix, write, query", [
+    ("attendance", "출퇴근무사고", write_attendance,
+     "SELECT worker_name, check_in_time FROM attendance_logs"),
+    ("tbm", "tbm", write_tbm,
+     "SELECT p.worker_name FROM tbm_participants p JOIN tbm_logs t ON t.id = p.tbm_id"),
+])
+def test_modified_original_replaces_rows_merged_from_duplicate(tmp_path, file_type, prefix, write, query,
+                                                               duplicate_later):
+    data_dir = tmp_path / "data"
+    for sub in TYPE_DIRS.values():
+        (data_dir / sub).mkdir(parents=True)
+    db_path = tmp_path / "safety.db"
+    directory = data_dir / TYPE_DIRS[file_type]
+    original = directory / (STEM.format(prefix=prefix) + ".xlsx")
+
+    write(original, random.Random(1), 8)
+    if duplicate_later:
+        _run(data_dir, db_path)
+    shutil.copy(original, directory / (STEM.format(prefix=prefix) + "_1.xlsx"))
+    _run(data_dir, db_path)
+
+    # Corrected re-upload of the original under the same name
+    write(original, random.Random(2), 8)
+    _run(data_dir, db_path)
+
+    if file_type == "attendance":
+        expected = {(r.worker_name, r.check_in_time) for r in _parse(file_type, original)}
+    else:
+        expected = {(r.worker_name,) for r in _parse(file_type, original)}
+    conn = sqlite3.connect(str(db_path))
+    try:
+        assert set(conn.execute(query).fetchall()) == expected
+    finally:
+        conn.close()
@@ -0,0 +1,51 @@
+"""
+Background runs report merged rows and respect the cross-process writer lock.
+"""
+
+import random
+import shutil
+import threading
+
+import pytest
+
+import backend.services.etl_service as etl_service
+from backend.database.writer_lock import writer_lock
+from backend.etl.parallel import PARSERS
+from backend.etl.run_etl import run_full_etl
+from backend.etl.synthetic import TYPE_DIRS, write_attendance
+
+
+def test_merged_rows_exclude_duplicates(tmp_path):
+    data_dir = tmp_path / "data"
+    directory = data_dir / TYPE_DIRS["attendance"]
+    directory.mkdir(parents=True)
+    original = directory / "출퇴근무사고_현장A_업체B_250301.xlsx"
+    write_attendance(original, random.Random(1), 6)
+    shutil.copy(original, directory / "출퇴근무사고_현장A_업체B_250301_1.xlsx")
+
+    stats = run_full_etl(database_path=tmp_path / "safety.db", data_dir=data_dir, use_cache=False, hot_days=0)
+
+    parsed = len(PARSERS["attendance"](str(original)).run()["records"])
+    assert stats["attendance"]["records"] == 2 * parsed
+    assert stats["attendance"]["merged"] == parsed
+
+
+def test_run_refused_while_another_writer_holds_the_lock(tmp_path, monkeypatch):
+    db_path = tmp_path / "safety.db"
+    monkeypatch.setattr(etl_service, "DATABASE_PATH", db_path)
+    locked, release = threading.Event(), threading.Event()
+
+    def hold():
+        with writer_lock(db_path):
+            locked.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    try:
+        locked.wait()
+        with pytest.raises(etl_service.EtlBusyError):
+            etl_service.start_etl_run("incremental")
+    finally:
+        release.set()
+        holder.join()
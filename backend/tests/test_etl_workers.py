@@ -0,0 +1,23 @@
+"""
+ETL runs never start more parser processes than the host has CPUs.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from backend.api.schemas.etl import EtlRunRequest
+from backend.etl.parallel import MAX_WORKERS, clamp_workers
+
+
+def test_run_request_rejects_out_of_range_workers():
+    with pytest.raises(ValidationError):
+        EtlRunRequest(workers=MAX_WORKERS + 1)
+    with pytest.raises(ValidationError):
+        EtlRunRequest(workers=0)
+    assert EtlRunRequest(workers=MAX_WORKERS).workers == MAX_WORKERS
+
+
+def test_clamp_workers():
+    assert clamp_workers(10000) == MAX_WORKERS
+    assert clamp_workers(0) == 1
+    assert clamp_workers(-3) == 1
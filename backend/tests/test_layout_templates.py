@@ -0,0 +1,51 @@
+"""
+Layout templates are kept next to the database they were loaded into, and a
+risk template only matches sheets with the same label columns.
+"""
+
+import random
+
+from openpyxl import load_workbook
+
+from backend.etl.risk_parser import RiskAssessmentParser
+from backend.etl.run_etl import run_full_etl
+from backend.etl.synthetic import TYPE_DIRS, write_risk
+from backend.etl.templates import TemplateRegistry, templates_path
+
+
+def test_registry_follows_the_database(tmp_path):
+    data_dir = tmp_path / "data"
+    directory = data_dir / TYPE_DIRS["risk"]
+    directory.mkdir(parents=True)
+    write_risk(directory / "위험성평가_현장A_업체B_250301_250331_0.xlsx", random.Random(1), "수시", 4, 3)
+    db_path = tmp_path / "db" / "safety.db"
+    db_path.parent.mkdir()
+
+    run_full_etl(database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+
+    entries = TemplateRegistry(templates_path(db_path)).entries
+    assert [entry["file_type"] for entry in entries.values()] == ["risk"]
+
+
+def test_risk_template_checks_label_columns(tmp_path):
+    """A sheet whose 위험요인 label moved is rediscovered, not parsed with the template."""
+    registry_path = tmp_path / "layout_templates.json"
+    layouts = {}
+    # The same item header row in both files; the label above it sits in another column
+    for label_col, end in [(8, "250331"), (3, "250430")]:
+        path = tmp_path / f"위험성평가_현장A_업체B_250301_{end}_0.xlsx"
+        write_risk(path, random.Random(1), "수시", 4, 3)
+        _label_above_header(path, label_col)
+        parser = RiskAssessmentParser(str(path), templates_path=registry_path)
+        parsed = parser.run()
+        layouts[label_col] = (parsed["template"]["matched"], parser.layout["risk_factor_col"])
+
+    assert layouts == {8: (False, 8), 3: (False, 3)}
+
+
+def _label_above_header(path, col):
+    workbook = load_workbook(path)
+    sheet = workbook.active
+    sheet.cell(6, 8).value = None
+    sheet.cell(5, col).value = "위험요인"
+    workbook.save(path)
@@ -0,0 +1,70 @@
+"""
+The natural-key merge replaces copies of a file's rows loaded from another
+file, but keeps rows that repeat within one file.
+"""
+
+import sqlite3
+from datetime import date
+
+import pytest
+
+from backend.database.schema import init_db
+from backend.etl.loader import BulkLoader
+from backend.etl.records import AttendanceRecord, TbmParticipant
+
+META = {"work_date": date(2025, 3, 1), "site_name": "현장A", "partner_name": "업체B"}
+
+
+def _attendance(filename, *names):
+    records = [AttendanceRecord(name, "근로자", None, None, False, None, None, False) for name in names]
+    return {"metadata": META, "records": records, "filename": filename}
+
+
+def _tbm(filename, *names):
+    return {"metadata": META, "records": [TbmParticipant(name) for name in names], "filename": filename}
+
+
+@pytest.fixture
+def conn(tmp_path):
+    db_path = tmp_path / "safety.db"
+    init_db(db_path)
+    conn = sqlite3.connect(str(db_path))
+    yield conn
+    conn.close()
+
+
+def _rows(conn, sql):
+    return sorted(conn.execute(sql).fetchall())
+
+
+ATTENDANCE_SQL = "SELECT worker_name, source_file FROM attendance_logs"
+TBM_SQL = "SELECT p.worker_name, t.source_file FROM tbm_participants p JOIN tbm_logs t ON t.id = p.tbm_id"
+
+
+@pytest.mark.parametrize("same_batch", [True, False], ids=["same-batch", "later-batch"])
+def test_attendance_repeats_within_a_file_are_kept(conn, same_batch):
+    loader = BulkLoader(conn)
+    loader.add_attendance(_attendance("a.xlsx", "김철수", "김철수", "이영희"))
+    if not same_batch:
+        loader.flush()
+    # A duplicate upload: its copy replaces the first one under the first file's name
+    loader.add_attendance(_attendance("a_1.xlsx", "김철수", "김철수", "이영희"))
+    loader.flush()
+
+    assert _rows(conn, ATTENDANCE_SQL) == [("김철수", "a.xlsx"), ("김철수", "a.xlsx"), ("이영희", "a.xlsx")]
+    assert loader.merged_rows("attendance") == 3
+
+
+@pytest.mark.parametrize("same_batch", [True, False], ids=["same-batch", "later-batch"])
+def test_tbm_participants_replaced_by_newer_copy(conn, same_batch):
+    loader = BulkLoader(conn)
+    loader.add_tbm(_tbm("t.xlsx", "김철수", "김철수", "이영희"))
+    if not same_batch:
+        loader.flush()
+    loader.add_tbm(_tbm("t_1.xlsx", "김철수", "김철수", "이영희", "박민수"))
+    loader.flush()
+
+    assert _rows(conn, TBM_SQL) == [("김철수", "t.xlsx"), ("김철수", "t.xlsx"),
+                                    ("박민수", "t.xlsx"), ("이영희", "t.xlsx")]
+    assert conn.execute("SELECT COUNT(*) FROM tbm_logs").fetchone()[0] == 1
+    assert loader.merged_rows("tbm") == 4
@@ -0,0 +1,44 @@
+"""
+The metadata tier reads the risk type from the sheet name and estimates the
+record count from the rows holding values, not the declared dimension.
+"""
+
+import random
+import re
+import zipfile
+
+from backend.etl.risk_parser import RiskAssessmentParser
+from backend.etl.synthetic import write_risk, write_tbm
+from backend.etl.tbm_parser import TbmParser
+
+
+def _declare_dimension(path, ref):
+    """Rewrite the sheet's declared dimension, as some exporters get it wrong."""
+    with zipfile.ZipFile(path) as source:
+        members = {info: source.read(info) for info in source.infolist()}
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as target:
+        for info, data in members.items():
+            if info.filename.startswith("xl/worksheets/"):
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="' + ref + b'"', data)
+            target.writestr(info, data)
+
+
+def test_risk_type_from_sheet_name(tmp_path):
+    path = tmp_path / "위험성평가_현장A_업체B_250301_250331.xlsx"
+    write_risk(path, random.Random(1), "수시", 4, 3)
+
+    parsed = RiskAssessmentParser(str(path)).run_metadata()
+
+    assert parsed["metadata"]["risk_type"] == "수시"
+
+
+def test_row_count_ignores_declared_dimension(tmp_path):
+    path = tmp_path / "TBM_현장A_업체B_250301.xlsx"
+    write_tbm(path, random.Random(1), 6)
+    expected = TbmParser(str(path)).run_metadata()["row_count"]
+    _declare_dimension(path, b"A1:BZ5000")
+
+    parsed = TbmParser(str(path)).run_metadata()
+
+    assert parsed["row_count"] == expected
+    assert expected >= len(TbmParser(str(path)).run()["records"])
@@ -0,0 +1,55 @@
+"""
+Parse cache hits, invalidation by parser version, and eviction of the least
+recently used entries.
+"""
+
+import os
+import random
+
+from backend.etl.attendance_parser import AttendanceParser
+from backend.etl.parallel import parse_file, parser_versions
+from backend.etl.parse_cache import ParseCache
+from backend.etl.synthetic import write_attendance
+from backend.etl.tracking import content_hash
+
+PARSED = {"records": ["x" * 200], "metadata": {}}
+
+
+def test_parser_version_bump_invalidates_entries(tmp_path, monkeypatch):
+    cache = ParseCache(tmp_path / "cache")
+    path = tmp_path / "출퇴근무사고_현장A_업체B_250301.xlsx"
+    write_attendance(path, random.Random(1), 5)
+    digest = content_hash(path)
+    old_version = AttendanceParser.PARSER_VERSION
+
+    templates = tmp_path / "layout_templates.json"
+
+    parsed = parse_file("attendance", path, cache=cache, content_hash=digest, templates_path=templates)
+    assert cache.get("attendance", old_version, path.name, digest) == parsed
+
+    monkeypatch.setattr(AttendanceParser, "PARSER_VERSION", old_version + 1)
+    assert cache.get("attendance", old_version + 1, path.name, digest) is None
+    reparsed = parse_file("attendance", path, cache=cache, content_hash=digest, templates_path=templates)
+    assert reparsed["records"] == parsed["records"]
+    assert cache.get("attendance", old_version + 1, path.name, digest) == reparsed
+
+    assert cache.prune(parser_versions()) == 1
+    assert cache.get("attendance", old_version, path.name, digest) is None
+    assert [d.name for d in (tmp_path / "cache" / "attendance").iterdir()] == [f"v{old_version + 1}"]
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    cache = ParseCache(tmp_path)
+    for mtime, name in enumerate(["a.xlsx", "b.xlsx", "c.xlsx"], start=1):
+        cache.put("tbm", 4, name, "hash", PARSED)
+        os.utime(cache._path("tbm", 4, name, "hash"), (mtime, mtime))
+    entry_size = cache._path("tbm", 4, "a.xlsx", "hash").stat().st_size
+
+    assert cache.get("tbm", 4, "a.xlsx", "hash") == PARSED  # oldest, but used now
+    cache.max_bytes = 2 * entry_size
+    assert cache.evict() == 1
+
+    assert cache.get("tbm", 4, "a.xlsx", "hash") == PARSED
+    assert cache.get("tbm", 4, "b.xlsx", "hash") is None
+    assert cache.get("tbm", 4, "c.xlsx", "hash") == PARSED
+    assert cache.evict() == 0
@@ -0,0 +1,71 @@
+"""
+Processed files move into YYYY/MM partitions; incremental runs list only the
+top level, rebuilds and selective runs find the partitions again.
+"""
+
+import random
+import shutil
+import sqlite3
+from datetime import date
+
+from backend.etl.discovery import list_partitions, resolve_tracked
+from backend.etl.run_etl import run_full_etl, run_selective_etl
+from backend.etl.scheduling import FileFilter
+from backend.etl.synthetic import TYPE_DIRS, write_attendance
+
+NAMES = ["출퇴근무사고_현장A_업체B_250215.xlsx", "출퇴근무사고_현장A_업체B_250301.xlsx"]
+
+
+def _setup(tmp_path):
+    data_dir = tmp_path / "data"
+    directory = data_dir / TYPE_DIRS["attendance"]
+    directory.mkdir(parents=True)
+    for seed, name in enumerate(NAMES):
+        write_attendance(directory / name, random.Random(seed), 5)
+    return data_dir, directory, tmp_path / "safety.db"
+
+
+def _query(db_path, sql):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return sorted(conn.execute(sql).fetchall())
+    finally:
+        conn.close()
+
+
+def test_processed_files_partitioned_by_month(tmp_path):
+    data_dir, directory, db_path = _setup(tmp_path)
+    options = dict(database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+    run_full_etl(partition=True, **options)
+
+    assert (directory / "2025" / "02" / NAMES[0]).exists()
+    assert (directory / "2025" / "03" / NAMES[1]).exists()
+    assert not any(directory.glob("*.xlsx"))
+    assert _query(db_path, "SELECT filename, location FROM source_manifest") == [
+        (NAMES[0], "2025/02"), (NAMES[1], "2025/03")]
+    assert list_partitions(directory) == [directory / "2025" / "03", directory / "2025" / "02"]
+    assert list_partitions(directory, since=date(2025, 3, 10)) == [directory / "2025" / "03"]
+
+    # Incremental runs list the top level only: just the new arrival
+    write_attendance(directory / "출퇴근무사고_현장A_업체B_250302.xlsx", random.Random(9), 5)
+    stats = run_full_etl(**options)["attendance"]
+    assert (stats["files"], stats["skipped"]) == (1, 0)
+
+    # A selective run lists the partitions its window reaches
+    selective = run_selective_etl(FileFilter(since=date(2025, 3, 1)), use_cache=False,
+                                  database_path=db_path, data_dir=data_dir)["attendance"]
+    assert selective["files"] == 2
+
+    # A rebuild lists every partition
+    run_full_etl(reset_db=True, **options)
+    assert len(_query(db_path, "SELECT filename FROM processed_files")) == 3
+
+
+def test_resolve_tracked_prefers_top_level_copy(tmp_path):
+    data_dir, directory, db_path = _setup(tmp_path)
+    run_full_etl(partition=True, database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+    partitioned = directory / "2025" / "02" / NAMES[0]
+
+    assert resolve_tracked(directory, NAMES[0], "2025/02") == partitioned
+    shutil.copy(partitioned, directory / NAMES[0])  # re-upload, not partitioned yet
+    assert resolve_tracked(directory, NAMES[0], "2025/02") == directory / NAMES[0]
@@ -0,0 +1,77 @@
+"""
+The API migrates a database created with the initial schema at startup,
+so the listing services can query columns added since.
+"""
+
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.main
+from backend.services import risk_service, tbm_service
+
+# Tables as created by the initial schema (before the ETL added source_file,
+# change tracking and parse_stage columns)
+BASELINE_SCHEMA_SQL = """
+CREATE TABLE sites (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE NOT NULL);
+CREATE TABLE partners (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE NOT NULL);
+CREATE TABLE attendance_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, work_date DATE NOT NULL, site_id INTEGER NOT NULL,
+    partner_id INTEGER NOT NULL, worker_name TEXT NOT NULL, role TEXT NOT NULL, birth_date DATE,
+    age INTEGER, is_senior BOOLEAN DEFAULT 0, check_in_time TIME, check_out_time TIME,
+    has_accident BOOLEAN DEFAULT 0
+);
+CREATE TABLE risk_docs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, site_id INTEGER NOT NULL, partner_id INTEGER NOT NULL,
+    start_date DATE NOT NULL, end_date DATE NOT NULL, doc_index INTEGER DEFAULT 0,
+    risk_type TEXT NOT NULL DEFAULT '최초', action_result_count INTEGER DEFAULT 0, filename TEXT
+);
+CREATE TABLE risk_items (id INTEGER PRIMARY KEY AUTOINCREMENT, doc_id INTEGER NOT NULL, risk_factor TEXT, measure TEXT);
+CREATE TABLE risk_confirmations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, doc_id INTEGER NOT NULL, worker_name TEXT NOT NULL, position TEXT
+);
+CREATE TABLE tbm_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, work_date DATE NOT NULL, site_id INTEGER NOT NULL,
+    partner_id INTEGER NOT NULL, content TEXT
+);
+CREATE TABLE tbm_participants (id INTEGER PRIMARY KEY AUTOINCREMENT, tbm_id INTEGER NOT NULL, worker_name TEXT NOT NULL);
+CREATE TABLE processed_files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, filename TEXT UNIQUE NOT NULL, file_type TEXT NOT NULL,
+    processed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO sites (name) VALUES ('현장A');
+INSERT INTO partners (name) VALUES ('업체B');
+INSERT INTO risk_docs (site_id, partner_id, start_date, end_date, filename)
+VALUES (1, 1, '2025-03-01', '2025-03-31', 'risk.xlsx');
+INSERT INTO risk_items (doc_id, risk_factor, measure) VALUES (1, '추락', '안전대 착용');
+INSERT INTO tbm_logs (work_date, site_id, partner_id, content) VALUES ('2025-03-10', 1, 1, '작업 전 점검');
+INSERT INTO tbm_participants (tbm_id, worker_name) VALUES (1, '홍길동');
+INSERT INTO processed_files (filename, file_type) VALUES ('risk.xlsx', 'risk');
+"""
+
+
+@pytest.fixture
+def baseline_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "safety.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(BASELINE_SCHEMA_SQL)
+    conn.close()
+    for module in (backend.main, risk_service, tbm_service):
+        monkeypatch.setattr(module, "DATABASE_PATH", db_path)
+    return db_path
+
+
+def test_baseline_database_fails_without_migration(baseline_db):
+    with pytest.raises(sqlite3.OperationalError):
+        risk_service.get_risk_documents(None, "2025-03-15", "MONTHLY")
+
+
+def test_api_startup_migrates_baseline_database(baseline_db):
+    with TestClient(backend.main.app):
+        documents = risk_service.get_risk_documents(None, "2025-03-15", "MONTHLY")
+        logs = tbm_service.get_tbm_logs(None, "2025-03-10")
+
+    assert [(doc.filename, doc.item_count) for doc in documents] == [("risk.xlsx", 1)]
+    assert len(logs) == 1 and logs[0].participant_count == 1
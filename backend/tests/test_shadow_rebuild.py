@@ -0,0 +1,76 @@
+"""
+A reset rebuilds into a shadow file and swaps it in only after verification;
+readers of the old file keep their snapshot.
+"""
+
+import random
+import shutil
+import sqlite3
+
+import pytest
+
+from backend.database.shadow import REBUILD_FAILED, read_rebuild_state, shadow_path, swap_database
+from backend.etl.run_etl import run_full_etl
+from backend.etl.synthetic import TYPE_DIRS, write_attendance
+
+
+def _setup(tmp_path, files):
+    data_dir = tmp_path / "data"
+    directory = data_dir / TYPE_DIRS["attendance"]
+    directory.mkdir(parents=True)
+    for day in range(1, files + 1):
+        write_attendance(directory / f"출퇴근무사고_현장A_업체B_2503{day:02d}.xlsx", random.Random(day), 5)
+    db_path = tmp_path / "safety.db"
+    run_full_etl(database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+    return data_dir, directory, db_path
+
+
+def _file_count(conn):
+    return conn.execute("SELECT COUNT(*) FROM processed_files").fetchone()[0]
+
+
+def test_rebuild_swapped_in_while_reader_keeps_snapshot(tmp_path):
+    data_dir, directory, db_path = _setup(tmp_path, 2)
+    write_attendance(directory / "출퇴근무사고_현장A_업체B_250303.xlsx", random.Random(3), 5)
+    reader = sqlite3.connect(str(db_path))
+    try:
+        reader.execute("BEGIN")
+        assert _file_count(reader) == 2
+
+        run_full_etl(reset_db=True, database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+
+        assert _file_count(reader) == 2  # still the old file
+    finally:
+        reader.close()
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        assert _file_count(conn) == 3
+    finally:
+        conn.close()
+    assert not shadow_path(db_path).exists()
+
+
+def test_failed_verification_keeps_live_database(tmp_path):
+    data_dir, directory, db_path = _setup(tmp_path, 2)
+    shutil.rmtree(directory)  # e.g. the data mount is missing
+    directory.mkdir()
+    before = db_path.read_bytes()
+
+    with pytest.raises(RuntimeError, match="verification"):
+        run_full_etl(reset_db=True, database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+
+    assert db_path.read_bytes() == before
+    assert read_rebuild_state(shadow_path(db_path))["status"] == REBUILD_FAILED
+
+
+def test_swap_refused_while_live_database_has_a_journal(tmp_path):
+    db_path = tmp_path / "safety.db"
+    shadow = shadow_path(db_path)
+    db_path.write_bytes(b"live")
+    shadow.write_bytes(b"rebuilt")
+    db_path.with_name(db_path.name + "-journal").write_bytes(b"")
+
+    with pytest.raises(RuntimeError, match="being written"):
+        swap_database(shadow, db_path)
+    assert db_path.read_bytes() == b"live"
@@ -0,0 +1,78 @@
+"""
+Writers of the live database serialize on its writer lock, and the watcher
+keeps loading into the live file after a rebuild was swapped in.
+"""
+
+import random
+import sqlite3
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import backend.etl.run_etl as run_etl
+from backend.database.writer_lock import WriterLockTimeout, writer_lock, writer_lock_busy
+from backend.etl.synthetic import TYPE_DIRS, write_attendance
+
+HOLD_LOCK = """
+import sys
+from pathlib import Path
+from backend.database.writer_lock import writer_lock
+with writer_lock(Path(sys.argv[1])):
+    print("locked", flush=True)
+    sys.stdin.read()
+"""
+
+
+def test_lock_is_exclusive_across_processes(tmp_path):
+    db_path = tmp_path / "safety.db"
+    holder = subprocess.Popen([sys.executable, "-c", HOLD_LOCK, str(db_path)],
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        assert writer_lock_busy(db_path)
+        with pytest.raises(WriterLockTimeout):
+            with writer_lock(db_path, timeout=0.3):
+                pass
+    finally:
+        holder.communicate("")
+
+    with writer_lock(db_path, timeout=0):
+        assert not writer_lock_busy(db_path)  # re-entrant in the holding thread
+
+
+def test_lock_excludes_other_threads(tmp_path):
+    db_path = tmp_path / "safety.db"
+    busy = []
+    with writer_lock(db_path):
+        thread = threading.Thread(target=lambda: busy.append(writer_lock_busy(db_path)))
+        thread.start()
+        thread.join()
+    assert busy == [True]
+    assert not writer_lock_busy(db_path)
+
+
+def test_watcher_loads_into_swapped_in_rebuild(tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    directory = data_dir / TYPE_DIRS["attendance"]
+    directory.mkdir(parents=True)
+    db_path = tmp_path / "safety.db"
+    monkeypatch.setattr(run_etl, "DATABASE_PATH", db_path)
+
+    write_attendance(directory / "출퇴근무사고_현장A_업체B_250301.xlsx", random.Random(1), 5)
+    run_etl.run_full_etl(database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+    directories = {directory: "attendance"}
+
+    # A rebuild replaces the database file between two watcher batches
+    run_etl.run_full_etl(reset_db=True, database_path=db_path, data_dir=data_dir, use_cache=False, hot_days=0)
+    arrival = directory / "출퇴근무사고_현장A_업체B_250302.xlsx"
+    write_attendance(arrival, random.Random(2), 5)
+    run_etl._load_watched([arrival], directories, run_etl.DEFAULT_ENGINE, None)
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        names = {row[0] for row in conn.execute("SELECT filename FROM processed_files")}
+    finally:
+        conn.close()
+    assert names == {"출퇴근무사고_현장A_업체B_250301.xlsx", arrival.name}
@@ -0,0 +1,63 @@
+"""
+The streaming reader returns the same cell values and parsed rows as openpyxl.
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from backend.etl.parallel import PARSERS
+from backend.etl.synthetic import write_attendance, write_risk, write_tbm
+from backend.etl.xlsx_reader import XlsxWorkbook
+
+SYNTHETIC = {
+    "attendance": ("출퇴근무사고_현장A_업체B_250301.xlsx", lambda path: write_attendance(path, random.Random(1), 12)),
+    "risk": ("위험성평가_현장A_업체B_250301_250331_0.xlsx",
+             lambda path: write_risk(path, random.Random(1), "수시", 6, 7)),
+    "tbm": ("TBM_현장A_업체B_250301.xlsx", lambda path: write_tbm(path, random.Random(1), 9)),
+}
+
+
+def _openpyxl_rows(path):
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        return list(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def _stream_rows(path):
+    workbook = XlsxWorkbook(str(path))
+    try:
+        return list(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def test_cell_values_match_openpyxl(tmp_path):
+    path = tmp_path / "values.xlsx"
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "값"
+    sheet.append(["이름", "출근", 7, 2.5, None, True])
+    sheet.append([None, datetime(2025, 3, 1, 7, 30), "=A1", -1, "", "줄\n바꿈"])
+    sheet.cell(5, 9, "끝")
+    workbook.save(path)
+
+    assert _stream_rows(path) == _openpyxl_rows(path)
+
+
+@pytest.mark.parametrize("file_type", sorted(SYNTHETIC))
+def test_parsed_rows_match_openpyxl(tmp_path, file_type):
+    filename, write = SYNTHETIC[file_type]
+    path = tmp_path / filename
+    write(path)
+    templates = tmp_path / "layout_templates.json"
+
+    results = {engine: PARSERS[file_type](str(path), engine=engine, templates_path=templates).run()
+               for engine in ("openpyxl", "stream")}
+
+    assert results["stream"]["records"] == results["openpyxl"]["records"]
+    assert results["stream"]["metadata"] == results["openpyxl"]["metadata"]